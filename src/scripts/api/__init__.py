@@ -0,0 +1,109 @@
+"""REST API над базою даних проєкту: фабрика застосунку.
+
+    from api import create_app
+    app = create_app()
+
+Моделі (api.models) і серіалізатори (api.serializers) визначені один раз.
+Під час створення застосунку БД не запитується: схема створюється
+скриптом src/sql/database.sql або явною командою `flask --app app init-db`
+(лише для локальної SQLite-БД), а зʼєднання відкривається з першим запитом.
+"""
+import time
+
+import click
+from flask import Flask, make_response
+from flask_restful import Api
+
+import config
+from conditional import change_log_versions, track_writes, init_conditional
+from entity_cache import connect
+from ingest import BatchIngestor
+from instrumentation import init_instrumentation, record_serialization
+from integrity import enforce_foreign_keys
+from outbox import init_change_log
+from replicas import init_replicas
+from serializer import dumps
+
+from .extensions import db, table_versions, request_metrics, entity_cache, replica_set
+from .models import Event, Change
+
+
+def output_json(data, code, headers=None):
+    # orjson (якщо встановлений) замість стандартного json flask_restful
+    started = time.perf_counter()
+    body = dumps(data)
+    record_serialization(time.perf_counter() - started)
+    response = make_response(body, code)
+    response.headers.extend(headers or {})
+    return response
+
+
+def create_app(config_object=config):
+    app = Flask(__name__)
+    app.config.from_object(config_object)
+    db.init_app(app)
+
+    app.extensions["event_ingestor"] = BatchIngestor(
+        app,
+        Event.__table__,
+        batch_size=config_object.EVENT_INGEST_BATCH_SIZE,
+        interval=config_object.EVENT_INGEST_INTERVAL,
+        max_queue=config_object.EVENT_INGEST_QUEUE_SIZE
+    )
+
+    # Нові події видно з діапазону id Event, у журнал змін — лише їх зміни й видалення
+    init_change_log(app, db.session, Change.__table__, [
+        name for name in db.metadata.tables if name not in (Event.__tablename__, Change.__tablename__)
+    ], appended=[Event.__tablename__])
+
+    # Спільні обʼєкти процесу (api.extensions) налаштовуються з config_object
+    entity_cache.size = config_object.ENTITY_CACHE_SIZE
+    entity_cache.ttl = config_object.ENTITY_CACHE_TTL
+    entity_cache.shared_ttl = config_object.ENTITY_CACHE_SHARED_TTL
+    entity_cache.tombstone_ttl = config_object.ENTITY_CACHE_TOMBSTONE_TTL
+    entity_cache.shared = connect(config_object.ENTITY_CACHE_URL) if config_object.ENTITY_CACHE_URL else None
+    replica_set.interval = config_object.DB_REPLICA_CHECK_INTERVAL
+    replica_set.max_lag = config_object.DB_REPLICA_MAX_LAG
+
+    with app.app_context():
+        # Engine створюється без підключення до БД
+        for engine in db.engines.values():
+            enforce_foreign_keys(engine)
+        track_writes(db.engine, db.metadata, table_versions)
+        # Версії для ETag — з журналу змін у БД, спільні для всіх воркерів
+        table_versions.ttl = config_object.CONDITIONAL_VERSION_TTL
+        table_versions.load = change_log_versions(db.engine, Change.__table__, [Event.__table__])
+        replica_set.attach({name: db.engines[name] for name in config_object.REPLICA_BINDS})
+        # До init_conditional: відповіді 304 теж потрапляють у метрики
+        init_instrumentation(
+            app, db.engines.values(), request_metrics,
+            slow_query_ms=config_object.SLOW_QUERY_MS,
+            server_timing=config_object.SERVER_TIMING
+        )
+    init_conditional(app, table_versions)
+    # Після init_conditional: відповідь 304 не вибирає репліку
+    init_replicas(app, db.session, replica_set, table_versions, config_object.DB_PRIMARY_PIN_SECONDS)
+
+    api = Api(app)
+    api.representation("application/json")(output_json)
+    from .resources import register
+    from .resources.roles import permission_cache
+    register(api)
+    permission_cache.ttl = config_object.PERMISSION_CACHE_TTL
+
+    @app.route("/")
+    def index():
+        return {"message": "API is working"}
+
+    @app.cli.command("init-db")
+    def init_db():
+        """Створити відсутні таблиці за моделями (для локальної розробки)."""
+        from migrate import available, stamp
+        # Лише primary: репліки отримують схему через реплікацію
+        db.create_all(bind_key=None)
+        # Моделі відповідають database.sql з усіма міграціями
+        with db.engine.connect() as conn:
+            stamp(conn, [version for version, _ in available()])
+        click.echo(f"Schema created: {db.engine.url.render_as_string(hide_password=True)}")
+
+    return app
@@ -0,0 +1,50 @@
+from flask import request
+
+from entity_cache import cascade_keys
+from replicas import primary
+
+from .extensions import db, entity_cache
+from .models import Project, Team, User, Role, Task
+from .serializers import expander, project_to_dict, team_to_dict, user_to_dict, role_to_dict, task_to_dict
+
+# Моделі, окремі записи яких кешуються: повний набір полів серіалізатора
+CACHED = {
+    Project: project_to_dict,
+    Team: team_to_dict,
+    User: user_to_dict,
+    Role: role_to_dict,
+    Task: task_to_dict
+}
+CACHED_TABLES = {model.__tablename__ for model in CACHED}
+
+
+def cached_item(model, key):
+    # dict запису або None. ?expand= читає БД напряму, ?fields= вибирає
+    # поля з кешованого повного запису
+    if request.args.get("expand"):
+        query, serialize = expander.query(model.query, model)
+        obj = query.filter(model.id == key).first()
+        return None if obj is None else serialize(obj)
+
+    serializer = CACHED[model]
+    fields = serializer.selected()
+
+    def load():
+        # Кеш живе довше за допустиме відставання репліки — заповнюється з primary
+        with primary(db.session):
+            query, serialize = serializer.project(model.query)
+            row = query.filter(model.id == key).first()
+        return None if row is None else serialize(row)
+
+    data = entity_cache.get(model.__tablename__, key, load)
+    if data is None or fields is None:
+        return data
+    return {name: data[name] for name in fields}
+
+
+def entity_keys(model, *keys, cascade=False):
+    # Ключі кешу для інвалідації після запису. cascade=True — перед DELETE:
+    # разом з дочірніми рядками, які змінить ON DELETE CASCADE / SET NULL
+    if cascade:
+        return cascade_keys(db.session, model.__table__, keys, CACHED_TABLES)
+    return [(model.__tablename__, key) for key in keys]
@@ -0,0 +1,29 @@
+from flask_sqlalchemy import SQLAlchemy
+
+import config
+from conditional import TableVersions
+from entity_cache import EntityCache
+from hub import Hub
+from instrumentation import RequestMetrics
+from replicas import ReplicaSet, RoutingSession
+
+# Після commit відповідь будується з уже завантажених атрибутів, без повторного SELECT.
+# RoutingSession спрямовує читання GET-запитів на репліку (replicas.init_replicas)
+db = SQLAlchemy(session_options={"class_": RoutingSession, "expire_on_commit": False})
+
+# Стан процесу, спільний для ресурсів: версії таблиць для ETag, метрики запитів,
+# кеш окремих записів (спільний рівень підключається в create_app), репліки
+# і розсилка push-сповіщень підписникам цього процесу
+table_versions = TableVersions()
+request_metrics = RequestMetrics()
+entity_cache = EntityCache(
+    size=config.ENTITY_CACHE_SIZE,
+    ttl=config.ENTITY_CACHE_TTL,
+    shared_ttl=config.ENTITY_CACHE_SHARED_TTL,
+    tombstone_ttl=config.ENTITY_CACHE_TOMBSTONE_TTL
+)
+replica_set = ReplicaSet(
+    interval=config.DB_REPLICA_CHECK_INTERVAL,
+    max_lag=config.DB_REPLICA_MAX_LAG
+)
+hub = Hub()
@@ -0,0 +1,228 @@
+import uuid
+
+from sqlalchemy.dialects.mysql import CHAR, INTEGER, TEXT, TIMESTAMP, VARCHAR
+
+from .extensions import db
+
+# Типи колонок, індекси та імена обмежень збігаються з src/sql/database.sql
+# (перевіряється командою `python migrate.py check`)
+
+
+# Звʼязки лише для читання (?expand=...): записи йдуть через колонки
+# зовнішніх ключів, а каскади виконує сама БД (ON DELETE CASCADE / SET NULL)
+def read_only(target, **kwargs):
+    return db.relationship(target, viewonly=True, **kwargs)
+
+
+class User(db.Model):
+    __tablename__ = 'User'
+    __table_args__ = (
+        db.Index('idx_user_team', 'team_id'),
+        db.Index('ft_user_text', 'nickname', 'email', mysql_prefix='FULLTEXT'),
+    )
+    # UUID генерується на боці застосунку: інакше перед INSERT виконується окремий SELECT UUID()
+    id         = db.Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    nickname   = db.Column(VARCHAR(255), nullable=False, unique=True)
+    email      = db.Column(VARCHAR(255), nullable=False, unique=True)
+    password   = db.Column(TEXT, nullable=False)
+    photo      = db.Column(TEXT, nullable=True)
+    team_id    = db.Column(
+                    INTEGER,
+                    db.ForeignKey('Team.id', name='fk_user_team', ondelete='CASCADE', onupdate='CASCADE'),
+                    nullable=False
+                 )
+
+    team       = read_only('Team')
+    projects   = read_only('UserProject', order_by='UserProject.id')
+
+
+class Project(db.Model):
+    __tablename__ = 'Project'
+    id   = db.Column(INTEGER, primary_key=True, autoincrement=True)
+    name = db.Column(VARCHAR(255), nullable=False)
+
+    teams   = read_only('Team', order_by='Team.id')
+    roles   = read_only('Role', order_by='Role.id')
+    members = read_only('UserProject', order_by='UserProject.id')
+
+
+class Team(db.Model):
+    __tablename__ = 'Team'
+    __table_args__ = (
+        db.Index('idx_team_project', 'project_id'),
+    )
+    id         = db.Column(INTEGER, primary_key=True, autoincrement=True)
+    name       = db.Column(VARCHAR(255), nullable=False)
+    project_id = db.Column(
+                    INTEGER,
+                    db.ForeignKey('Project.id', name='fk_team_project', ondelete='CASCADE', onupdate='CASCADE'),
+                    nullable=False
+                 )
+
+    project    = read_only('Project')
+    users      = read_only('User', order_by='User.id')
+    tasks      = read_only('Task', order_by='Task.id')
+
+
+class Role(db.Model):
+    __tablename__ = 'Role'
+    __table_args__ = (
+        db.Index('idx_role_project', 'project_id'),
+    )
+    id          = db.Column(INTEGER, primary_key=True, autoincrement=True)
+    name        = db.Column(VARCHAR(255), nullable=False)
+    description = db.Column(TEXT, nullable=True)
+    project_id  = db.Column(
+                    INTEGER,
+                    db.ForeignKey('Project.id', name='fk_role_project', ondelete='CASCADE', onupdate='CASCADE'),
+                    nullable=False
+                 )
+
+    project     = read_only('Project')
+    actions     = read_only('Action', secondary='Role_Action', order_by='Action.id')
+
+
+class UserProject(db.Model):
+    __tablename__ = 'User_Project'
+    __table_args__ = (
+        db.Index('idx_up_user', 'user_id'),
+        db.Index('idx_up_project', 'project_id'),
+        db.Index('idx_up_role', 'role_id'),
+        db.Index('idx_up_team', 'team_id'),
+    )
+    id         = db.Column(INTEGER, primary_key=True, autoincrement=True)
+    user_id    = db.Column(
+                    CHAR(36),
+                    db.ForeignKey('User.id', name='fk_up_user', ondelete='CASCADE', onupdate='CASCADE'),
+                    nullable=False
+                 )
+    project_id = db.Column(
+                    INTEGER,
+                    db.ForeignKey('Project.id', name='fk_up_project', ondelete='CASCADE', onupdate='CASCADE'),
+                    nullable=False
+                 )
+    role_id    = db.Column(
+                    INTEGER,
+                    db.ForeignKey('Role.id', name='fk_up_role', ondelete='SET NULL', onupdate='CASCADE'),
+                    nullable=True
+                 )
+    team_id    = db.Column(
+                    INTEGER,
+                    db.ForeignKey('Team.id', name='fk_up_team', ondelete='SET NULL', onupdate='CASCADE'),
+                    nullable=True
+                 )
+
+    user       = read_only('User')
+    project    = read_only('Project')
+    role       = read_only('Role')
+    team       = read_only('Team')
+
+
+class Task(db.Model):
+    __tablename__ = 'Task'
+    __table_args__ = (
+        db.Index('idx_task_team', 'team_id', 'deadlineDate'),
+        db.Index('idx_task_start', 'startDate'),
+        db.Index('idx_task_deadline', 'deadlineDate'),
+        db.Index('ft_task_text', 'name', 'description', mysql_prefix='FULLTEXT'),
+    )
+    id           = db.Column(INTEGER, primary_key=True, autoincrement=True)
+    name         = db.Column(VARCHAR(255), nullable=False)
+    description  = db.Column(TEXT, nullable=True)
+    startDate    = db.Column(TIMESTAMP, server_default=db.func.current_timestamp(), nullable=False)
+    deadlineDate = db.Column(TIMESTAMP, nullable=True)
+    team_id      = db.Column(
+                     INTEGER,
+                     db.ForeignKey('Team.id', name='fk_task_team', ondelete='CASCADE', onupdate='CASCADE'),
+                     nullable=False
+                  )
+
+    team         = read_only('Team')
+    artifacts    = read_only('Artifact', order_by='Artifact.id')
+
+
+class Artifact(db.Model):
+    __tablename__ = 'Artifact'
+    __table_args__ = (
+        db.Index('idx_artifact_task', 'task_id', 'datetime'),
+        db.Index('idx_artifact_datetime', 'datetime'),
+        db.Index('ft_artifact_comment', 'comment', mysql_prefix='FULLTEXT'),
+    )
+    id       = db.Column(INTEGER, primary_key=True, autoincrement=True)
+    status   = db.Column(VARCHAR(255), nullable=False)
+    comment  = db.Column(TEXT, nullable=True)
+    datetime = db.Column(TIMESTAMP, server_default=db.func.current_timestamp(), nullable=False)
+    task_id  = db.Column(
+                  INTEGER,
+                  db.ForeignKey('Task.id', name='fk_artifact_task', ondelete='CASCADE', onupdate='CASCADE'),
+                  nullable=False
+               )
+
+    task     = read_only('Task')
+
+
+class Action(db.Model):
+    __tablename__ = 'Action'
+    id     = db.Column(INTEGER, primary_key=True, autoincrement=True)
+    action = db.Column(VARCHAR(255), unique=True, nullable=False)
+
+
+class RoleAction(db.Model):
+    __tablename__ = 'Role_Action'
+    __table_args__ = (
+        db.Index('idx_ra_role', 'role_id'),
+        db.Index('idx_ra_action', 'action_id'),
+    )
+    id        = db.Column(INTEGER, primary_key=True, autoincrement=True)
+    role_id   = db.Column(
+                    INTEGER,
+                    db.ForeignKey('Role.id', name='fk_ra_role', ondelete='CASCADE', onupdate='CASCADE'),
+                    nullable=False
+                 )
+    action_id = db.Column(
+                    INTEGER,
+                    db.ForeignKey('Action.id', name='fk_ra_action', ondelete='CASCADE', onupdate='CASCADE'),
+                    nullable=False
+                 )
+
+    role      = read_only('Role')
+    action    = read_only('Action')
+
+
+class Event(db.Model):
+    __tablename__ = 'Event'
+    __table_args__ = (
+        db.Index('idx_event_user', 'user_id', 'datetime'),
+        db.Index('idx_event_role', 'role_id', 'datetime'),
+        db.Index('idx_event_datetime', 'datetime'),
+    )
+    id       = db.Column(INTEGER, primary_key=True, autoincrement=True)
+    user_id  = db.Column(
+                    CHAR(36),
+                    db.ForeignKey('User.id', name='fk_event_user', ondelete='CASCADE', onupdate='CASCADE'),
+                    nullable=False
+                 )
+    role_id  = db.Column(
+                    INTEGER,
+                    db.ForeignKey('Role.id', name='fk_event_role', ondelete='CASCADE', onupdate='CASCADE'),
+                    nullable=False
+                 )
+    action   = db.Column(VARCHAR(255), nullable=False)
+    datetime = db.Column(TIMESTAMP, server_default=db.func.current_timestamp(), nullable=False)
+
+    user     = read_only('User')
+    role     = read_only('Role')
+
+
+class Change(db.Model):
+    # Журнал змін (outbox.ChangeLog): дописується в транзакції кожного запису
+    __tablename__ = 'Change'
+    __table_args__ = (
+        db.Index('idx_change_datetime', 'datetime'),
+        db.Index('idx_change_entity', 'entity', 'id'),
+    )
+    id        = db.Column(INTEGER, primary_key=True, autoincrement=True)
+    entity    = db.Column(VARCHAR(255), nullable=False)
+    entity_id = db.Column(VARCHAR(36), nullable=False)
+    op        = db.Column(VARCHAR(16), nullable=False)
+    datetime  = db.Column(TIMESTAMP, server_default=db.func.current_timestamp(), nullable=False)
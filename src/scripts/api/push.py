@@ -0,0 +1,63 @@
+from sqlalchemy import select
+
+from hub import sse_message
+
+from .extensions import db, hub
+from .models import Team, Task, Artifact
+from .serializers import task_to_dict, artifact_to_dict
+
+# Модель -> (тип події, серіалізатор поточного стану рядка)
+PUSHED = {
+    Task: ("task", task_to_dict),
+    Artifact: ("artifact", artifact_to_dict)
+}
+
+
+def topics(team_id, project_id):
+    return [("team", team_id), ("project", project_id)]
+
+
+def scopes(model, ids):
+    # {id: (team_id, project_id)} задач або артефактів. Без підписників у
+    # процесі — без запиту: запис не платить за сповіщення, яких ніхто не чекає
+    ids = list(ids)
+    if not hub.active or not ids:
+        return {}
+    query = select(model.id, Team.id, Team.project_id)
+    if model is Artifact:
+        query = query.join(Task, Task.id == Artifact.task_id)
+    query = query.join(Team, Team.id == Task.team_id).where(model.id.in_(ids))
+    return {key: (team_id, project_id) for key, team_id, project_id in db.session.execute(query)}
+
+
+def publish(model, op, ids, before=None):
+    # Після commit: подія {op, id, data} у канали команди і проєкту рядка.
+    # before — scopes() до запису: задача, що перейшла до іншої команди,
+    # надсилається і старим, і новим підписникам; видалений рядок — лише старим
+    ids = list(ids)
+    if not hub.active or not ids:
+        return
+    event, serializer = PUSHED[model]
+    before = before or {}
+    after, data = {}, {}
+    if op != "delete":
+        after = scopes(model, ids)
+        query, serialize = serializer.project(model.query)
+        data = {row.id: serialize(row) for row in query.filter(model.id.in_(ids))}
+    for key in ids:
+        channels = set()
+        for scope in (before.get(key), after.get(key)):
+            if scope is not None:
+                channels.update(topics(*scope))
+        if channels:
+            hub.publish(channels, sse_message(event, {"op": op, "id": key, "data": data.get(key)}))
+
+
+class PushBatch:
+    # Домішка до BatchResource: сповіщення про масовий запис
+    def writing(self, op, ids):
+        self.before = scopes(self.model, ids)
+
+    def written(self, op, ids):
+        super().written(op, ids)
+        publish(self.model, op, ids, getattr(self, "before", None))
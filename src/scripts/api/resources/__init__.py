@@ -0,0 +1,69 @@
+def register(api):
+    # Модулі ресурсів імпортуються лише тут, під час створення застосунку
+    from .projects import ProjectListResource, ProjectResource, ProjectTaskSummaryResource
+    from .teams import TeamListResource, TeamResource, TeamStatsResource
+    from .users import UserListResource, UserResource, UserByEmailResource
+    from .roles import (
+        RoleListResource, RoleResource, RolePermissionsResource,
+        ActionListResource, ActionResource, RoleActionListResource, RoleActionResource
+    )
+    from .memberships import UserProjectListResource, UserProjectResource, UserProjectBatchResource
+    from .tasks import TaskListResource, TaskResource, TaskBatchResource
+    from .artifacts import (
+        ArtifactListResource, ArtifactResource, ArtifactStatusHistogramResource, ArtifactBatchResource
+    )
+    from .events import EventListResource, EventResource, EventBatchResource, EventIngestResource
+    from .search import SearchResource
+    from .changes import ChangeListResource
+    from .streams import TeamStreamResource, ProjectStreamResource
+    from .metrics import PoolMetricsResource, CacheMetricsResource, ReplicaMetricsResource, MetricsResource
+
+    api.add_resource(ProjectListResource, '/projects')
+    api.add_resource(ProjectResource,     '/projects/<int:project_id>')
+    api.add_resource(ProjectTaskSummaryResource, '/projects/<int:project_id>/task-summary')
+    api.add_resource(ProjectStreamResource, '/projects/<int:project_id>/stream')
+
+    api.add_resource(TeamListResource,    '/teams')
+    api.add_resource(TeamResource,        '/teams/<int:team_id>')
+    api.add_resource(TeamStatsResource,   '/teams/<int:team_id>/stats')
+    api.add_resource(TeamStreamResource,  '/teams/<int:team_id>/stream')
+
+    api.add_resource(UserListResource,    '/users')
+    api.add_resource(UserResource,        '/users/<string:user_id>')
+    api.add_resource(UserByEmailResource, '/users/by-email/<string:email>')
+
+    api.add_resource(RoleListResource,    '/roles')
+    api.add_resource(RoleResource,        '/roles/<int:role_id>')
+    api.add_resource(RolePermissionsResource, '/roles/<int:role_id>/permissions')
+
+    api.add_resource(UserProjectListResource, '/user_projects')
+    api.add_resource(UserProjectResource,     '/user_projects/<int:up_id>')
+    api.add_resource(UserProjectBatchResource, '/user_projects:batch')
+
+    api.add_resource(TaskListResource,    '/tasks')
+    api.add_resource(TaskResource,        '/tasks/<int:task_id>')
+    api.add_resource(TaskBatchResource,   '/tasks:batch')
+
+    api.add_resource(ArtifactListResource, '/artifacts')
+    api.add_resource(ArtifactResource,     '/artifacts/<int:artifact_id>')
+    api.add_resource(ArtifactStatusHistogramResource, '/artifacts/status-histogram')
+    api.add_resource(ArtifactBatchResource, '/artifacts:batch')
+
+    api.add_resource(ActionListResource,  '/actions')
+    api.add_resource(ActionResource,      '/actions/<int:action_id>')
+
+    api.add_resource(RoleActionListResource, '/role_actions')
+    api.add_resource(RoleActionResource,     '/role_actions/<int:ra_id>')
+
+    api.add_resource(EventListResource,   '/events')
+    api.add_resource(EventResource,       '/events/<int:event_id>')
+    api.add_resource(EventBatchResource,  '/events:batch')
+    api.add_resource(EventIngestResource, '/events/ingest')
+
+    api.add_resource(SearchResource,      '/search')
+    api.add_resource(ChangeListResource,  '/changes')
+
+    api.add_resource(PoolMetricsResource, '/metrics/pool')
+    api.add_resource(CacheMetricsResource, '/metrics/cache')
+    api.add_resource(ReplicaMetricsResource, '/metrics/replicas')
+    api.add_resource(MetricsResource,     '/metrics')
@@ -0,0 +1,111 @@
+from flask import request, abort
+from flask_restful import Resource
+from sqlalchemy import func
+
+from batch import BatchResource
+from filtering import EQ, RANGE, apply_filters
+from integrity import commit_or_abort
+from pagination import list_response
+
+from ..extensions import db
+from ..models import Task, Artifact
+from ..push import PushBatch, publish, scopes
+from ..serializers import expander, artifact_to_dict
+
+
+class ArtifactListResource(Resource):
+    model = Artifact
+    tables = expander.request_tables(model)
+    filters = {"task_id": EQ, "datetime": RANGE}
+    sorts = ("datetime",)
+
+    def get(self):
+        query, serialize = expander.query(Artifact.query, Artifact)
+        return list_response(query, Artifact.id, serialize, self.filters, self.sorts)
+
+    def post(self):
+        data = request.get_json(force=True)
+        keys = ("status", "task_id")
+        if not all(k in data for k in keys):
+            abort(400, description="Fields 'status' and 'task_id' required")
+
+        new = Artifact(
+            status=data["status"].strip(),
+            comment=data.get("comment"),
+            task_id=data["task_id"]
+        )
+        db.session.add(new)
+        commit_or_abort(db.session, [(Task, data.get("task_id"))])
+        publish(Artifact, "insert", [new.id])
+        return artifact_to_dict(new), 201
+
+
+class ArtifactBatchResource(PushBatch, BatchResource):
+    model = Artifact
+    required = ("status", "task_id")
+    fields = ("status", "comment", "task_id")
+    strip = ("status",)
+    references = {"task_id": Task}
+
+
+class ArtifactStatusHistogramResource(Resource):
+    # Розподіл статусів артефактів по задачах: GROUP BY task_id, status.
+    # ?task_id=1,2 або ?task_id__in=1,2 обмежує вибірку
+    tables = ("Artifact",)
+    filters = {"task_id": EQ}
+
+    def get(self):
+        query = apply_filters(
+            db.session.query(Artifact.task_id, Artifact.status, func.count(Artifact.id)),
+            Artifact,
+            self.filters
+        )
+        histogram = {}
+        for task_id, status, count in query.group_by(Artifact.task_id, Artifact.status):
+            histogram.setdefault(task_id, {})[status] = count
+        totals = {}
+        for statuses in histogram.values():
+            for status, count in statuses.items():
+                totals[status] = totals.get(status, 0) + count
+        return {
+            "total": totals,
+            "tasks": [{"task_id": k, "statuses": v} for k, v in sorted(histogram.items())]
+        }
+
+
+class ArtifactResource(Resource):
+    model = Artifact
+    tables = expander.request_tables(model)
+
+    def get(self, artifact_id):
+        query, serialize = expander.query(Artifact.query, Artifact)
+        a = query.filter(Artifact.id == artifact_id).first()
+        if not a:
+            abort(404, description="Artifact not found")
+        return serialize(a)
+
+    def put(self, artifact_id):
+        a = Artifact.query.get(artifact_id)
+        if not a:
+            abort(404, description="Artifact not found")
+        before = scopes(Artifact, [artifact_id])
+        data = request.get_json(force=True)
+        if "status" in data and data["status"].strip():
+            a.status = data["status"].strip()
+        if "comment" in data:
+            a.comment = data["comment"]
+        if "task_id" in data:
+            a.task_id = data["task_id"]
+        commit_or_abort(db.session, [(Task, data.get("task_id"))])
+        publish(Artifact, "update", [artifact_id], before)
+        return {"message": "Artifact updated"}
+
+    def delete(self, artifact_id):
+        a = Artifact.query.get(artifact_id)
+        if not a:
+            abort(404, description="Artifact not found")
+        before = scopes(Artifact, [artifact_id])
+        db.session.delete(a)
+        db.session.commit()
+        publish(Artifact, "delete", [artifact_id], before)
+        return {"message": "Artifact deleted"}
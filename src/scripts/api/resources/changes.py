@@ -0,0 +1,129 @@
+from datetime import timedelta
+
+from flask import request, abort, current_app
+from flask_restful import Resource
+from sqlalchemy import func, select
+
+from batch import id_step
+from filtering import coerce_value
+from pagination import decode_cursor, encode_cursor, page_limit
+
+from ..extensions import db
+from ..models import Project, Team, User, Role, UserProject, Task, Artifact, Action, RoleAction, Change
+from ..serializers import (
+    project_to_dict, team_to_dict, user_to_dict, role_to_dict, user_project_to_dict,
+    task_to_dict, artifact_to_dict, action_to_dict, role_action_to_dict
+)
+
+# Таблиця журналу змін -> (модель, серіалізатор поточного стану рядка)
+SERIALIZERS = {
+    model.__tablename__: (model, serializer) for model, serializer in (
+        (Project, project_to_dict),
+        (Team, team_to_dict),
+        (User, user_to_dict),
+        (Role, role_to_dict),
+        (UserProject, user_project_to_dict),
+        (Task, task_to_dict),
+        (Artifact, artifact_to_dict),
+        (Action, action_to_dict),
+        (RoleAction, role_action_to_dict)
+    )
+}
+
+
+def selected_tables():
+    raw = request.args.get("tables")
+    if raw is None:
+        return None
+    tables = {t.strip() for t in raw.split(",") if t.strip()}
+    unknown = sorted(tables - set(SERIALIZERS))
+    if not tables or unknown:
+        abort(400, description=f"Parameter 'tables' must be a subset of {', '.join(SERIALIZERS)}")
+    return tables
+
+
+def since_id(raw):
+    values = decode_cursor(raw)
+    if len(values) != 1 or not isinstance(values[0], int) or values[0] < 0:
+        abort(400, description="Invalid cursor")
+    return values[0]
+
+
+def compact(rows, tables):
+    # Остання операція для кожного рядка; insert, за яким іде update, лишається insert.
+    # Записи таблиць без серіалізатора (зміни Event) лише рухають курсор
+    latest = {}
+    for row in rows:
+        if row.entity not in SERIALIZERS or tables is not None and row.entity not in tables:
+            continue
+        key = (row.entity, row.entity_id)
+        previous = latest.pop(key, None)
+        latest[key] = "insert" if previous == "insert" and row.op == "update" else row.op
+    return latest
+
+
+def current_rows(latest):
+    # {(таблиця, id): dict} — стан рядків зараз, один SELECT ... IN на таблицю
+    ids = {}
+    for (name, key), op in latest.items():
+        if op != "delete" and name in SERIALIZERS:
+            ids.setdefault(name, []).append(key)
+    data = {}
+    for name, keys in ids.items():
+        model, serializer = SERIALIZERS[name]
+        query, serialize = serializer.project(model.query)
+        for row in query.filter(model.id.in_([coerce_value(model.id, k) for k in keys])):
+            data[(name, str(row.id))] = serialize(row)
+    return data
+
+
+class ChangeListResource(Resource):
+    # GET /changes — поточний курсор; GET /changes?since=<cursor>&tables=Task,Team&limit=N —
+    # зміни після курсора: операція і поточний стан рядка (null для видалених)
+    # та курсор для наступного запиту. Записи журналу з меншим id можуть
+    # стати видимими пізніше за більші (транзакції завершуються не в порядку
+    # id), тому сторінка зупиняється перед пропуском id (більшим за крок
+    # AUTO_INCREMENT), доки рядки за ним молодші за CHANGE_FEED_SETTLE_SECONDS;
+    # старіші пропуски — відкочені транзакції.
+    def get(self):
+        tables = selected_tables()
+        now = db.session.scalar(select(func.current_timestamp()))
+        settled = now - timedelta(seconds=current_app.config["CHANGE_FEED_SETTLE_SECONDS"])
+
+        raw = request.args.get("since")
+        if raw is None:
+            head = db.session.scalar(select(func.max(Change.id)).where(Change.datetime <= settled))
+            return {"changes": [], "cursor": encode_cursor([head or 0]), "more": False}
+
+        since = since_id(raw)
+        step = id_step(db.session, db.session.get_bind().dialect)
+        oldest = db.session.scalar(select(func.min(Change.id)))
+        if oldest is not None and since < oldest - step:
+            abort(410, description="Cursor is older than the change log; download collections again")
+
+        limit = page_limit()
+        rows = db.session.execute(
+            select(Change).where(Change.id > since).order_by(Change.id).limit(limit + 1)
+        ).scalars().all()
+        page, cursor = [], since
+        for row in rows[:limit]:
+            if row.id - cursor > step and row.datetime > settled:
+                break
+            page.append(row)
+            cursor = row.id
+
+        latest = compact(page, tables)
+        data = current_rows(latest)
+        changes = []
+        for (name, key), op in latest.items():
+            model = SERIALIZERS[name][0]
+            item = data.get((name, key)) if op != "delete" else None
+            changes.append({
+                "table": name,
+                "id": coerce_value(model.id, key),
+                # Рядок видалено пізніше — видалення буде далі в журналі
+                "op": op if op == "delete" or item is not None else "delete",
+                "data": item
+            })
+        more = len(page) == limit and len(rows) > limit
+        return {"changes": changes, "cursor": encode_cursor([cursor]), "more": more}
@@ -0,0 +1,142 @@
+import queue
+from concurrent.futures import TimeoutError as AckTimeout
+
+from flask import request, abort, current_app
+from flask_restful import Resource
+from sqlalchemy.exc import IntegrityError
+
+from batch import BatchResource
+from filtering import EQ, RANGE
+from integrity import commit_or_abort, missing_reference
+from pagination import list_response
+from schema import partitioned_tables
+
+from ..extensions import db
+from ..models import User, Role, Event
+from ..serializers import expander, event_to_dict
+
+
+def event_ingestor():
+    # Черга подій створюється в create_app для кожного застосунку окремо
+    return current_app.extensions["event_ingestor"]
+
+
+def references_enforced():
+    # partitioning.sql видаляє зовнішні ключі Event — тоді user_id/role_id
+    # перевіряє застосунок. Визначається один раз на застосунок:
+    # після partitioning.sql його треба перезапустити
+    if "partitioned_tables" not in current_app.extensions:
+        with db.engine.connect() as conn:
+            current_app.extensions["partitioned_tables"] = partitioned_tables(conn)
+    return Event.__tablename__ not in current_app.extensions["partitioned_tables"]
+
+
+def check_references(data):
+    # Без зовнішніх ключів: обидва посилання одним SELECT EXISTS(...), EXISTS(...) до запису
+    if references_enforced():
+        return
+    model = missing_reference(db.session, [(User, data.get("user_id")), (Role, data.get("role_id"))])
+    if model is not None:
+        abort(404, description=f"{model.__name__} not found")
+
+
+class EventListResource(Resource):
+    model = Event
+    tables = expander.request_tables(model)
+    filters = {"user_id": EQ, "role_id": EQ, "datetime": RANGE}
+    sorts = ("datetime",)
+
+    def get(self):
+        query, serialize = expander.query(Event.query, Event)
+        return list_response(query, Event.id, serialize, self.filters, self.sorts)
+
+    def post(self):
+        data = request.get_json(force=True)
+        keys = ("user_id", "role_id", "action")
+        if not all(k in data for k in keys):
+            abort(400, description="Fields 'user_id', 'role_id', and 'action' required")
+        check_references(data)
+
+        if current_app.config["EVENT_INGEST_MODE"] != "sync":
+            return self.ingest(data)
+
+        new = Event(
+            user_id=data["user_id"],
+            role_id=data["role_id"],
+            action=data["action"].strip()
+        )
+        db.session.add(new)
+        commit_or_abort(db.session, [(User, data.get("user_id")), (Role, data.get("role_id"))])
+        return event_to_dict(new), 201
+
+    def ingest(self, data):
+        row = {
+            "user_id": data["user_id"],
+            "role_id": data["role_id"],
+            "action": data["action"].strip()
+        }
+        try:
+            future = event_ingestor().submit(row)
+        except queue.Full:
+            abort(503, description="Event queue is full")
+        if current_app.config["EVENT_INGEST_MODE"] == "enqueue":
+            return {"message": "Event accepted"}, 202
+
+        try:
+            stored = future.result(timeout=current_app.config["EVENT_INGEST_ACK_TIMEOUT"])
+        except AckTimeout:
+            abort(503, description="Event was not stored in time")
+        except IntegrityError:
+            model = missing_reference(db.session, [(User, row["user_id"]), (Role, row["role_id"])])
+            if model is not None:
+                abort(404, description=f"{model.__name__} not found")
+            abort(409, description="Event rejected")
+        return event_to_dict(stored), 201
+
+
+class EventIngestResource(Resource):
+    def get(self):
+        return event_ingestor().metrics()
+
+
+class EventBatchResource(BatchResource):
+    model = Event
+    required = ("user_id", "role_id", "action")
+    fields = ("user_id", "role_id", "action")
+    strip = ("action",)
+    references = {"user_id": User, "role_id": Role}
+
+
+class EventResource(Resource):
+    model = Event
+    tables = expander.request_tables(model)
+
+    def get(self, event_id):
+        query, serialize = expander.query(Event.query, Event)
+        e = query.filter(Event.id == event_id).first()
+        if not e:
+            abort(404, description="Event not found")
+        return serialize(e)
+
+    def put(self, event_id):
+        e = Event.query.get(event_id)
+        if not e:
+            abort(404, description="Event not found")
+        data = request.get_json(force=True)
+        check_references(data)
+        if "user_id" in data:
+            e.user_id = data["user_id"]
+        if "role_id" in data:
+            e.role_id = data["role_id"]
+        if "action" in data and data["action"].strip():
+            e.action = data["action"].strip()
+        commit_or_abort(db.session, [(User, data.get("user_id")), (Role, data.get("role_id"))])
+        return {"message": "Event updated"}
+
+    def delete(self, event_id):
+        e = Event.query.get(event_id)
+        if not e:
+            abort(404, description="Event not found")
+        db.session.delete(e)
+        db.session.commit()
+        return {"message": "Event deleted"}
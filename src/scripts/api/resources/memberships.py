@@ -0,0 +1,97 @@
+from flask import request, abort
+from flask_restful import Resource
+
+from batch import BatchResource
+from filtering import EQ
+from integrity import commit_or_abort
+from pagination import list_response
+
+from ..extensions import db
+from ..models import Project, Team, User, Role, UserProject
+from ..serializers import expander, user_project_to_dict
+
+
+class UserProjectListResource(Resource):
+    model = UserProject
+    tables = expander.request_tables(model)
+    filters = {"user_id": EQ, "project_id": EQ, "role_id": EQ, "team_id": EQ}
+
+    def get(self):
+        query, serialize = expander.query(UserProject.query, UserProject)
+        return list_response(query, UserProject.id, serialize, self.filters)
+
+    def post(self):
+        data = request.get_json(force=True)
+        keys = ("user_id", "project_id")
+        if not all(k in data for k in keys):
+            abort(400, description="Fields 'user_id' and 'project_id' required")
+
+        # Існування звʼязаних записів перевіряють зовнішні ключі БД під час INSERT;
+        # role_id та team_id – не обов'язкові
+        role_id = data.get("role_id")
+        team_id = data.get("team_id")
+
+        new = UserProject(
+            user_id=data["user_id"],
+            project_id=data["project_id"],
+            role_id=role_id,
+            team_id=team_id
+        )
+        db.session.add(new)
+        commit_or_abort(db.session, [
+            (User, data.get("user_id")),
+            (Project, data.get("project_id")),
+            (Role, role_id),
+            (Team, team_id)
+        ])
+        return user_project_to_dict(new), 201
+
+
+class UserProjectBatchResource(BatchResource):
+    model = UserProject
+    required = ("user_id", "project_id")
+    fields = ("user_id", "project_id", "role_id", "team_id")
+    references = {"user_id": User, "project_id": Project, "role_id": Role, "team_id": Team}
+
+
+class UserProjectResource(Resource):
+    model = UserProject
+    tables = expander.request_tables(model)
+
+    def get(self, up_id):
+        query, serialize = expander.query(UserProject.query, UserProject)
+        up = query.filter(UserProject.id == up_id).first()
+        if not up:
+            abort(404, description="User_Project not found")
+        return serialize(up)
+
+    def put(self, up_id):
+        up = UserProject.query.get(up_id)
+        if not up:
+            abort(404, description="User_Project not found")
+        data = request.get_json(force=True)
+
+        if "user_id" in data:
+            up.user_id = data["user_id"]
+        if "project_id" in data:
+            up.project_id = data["project_id"]
+        if "role_id" in data:
+            up.role_id = data["role_id"]
+        if "team_id" in data:
+            up.team_id = data["team_id"]
+
+        commit_or_abort(db.session, [
+            (User, data.get("user_id")),
+            (Project, data.get("project_id")),
+            (Role, data.get("role_id")),
+            (Team, data.get("team_id"))
+        ])
+        return {"message": "User_Project updated"}
+
+    def delete(self, up_id):
+        up = UserProject.query.get(up_id)
+        if not up:
+            abort(404, description="User_Project not found")
+        db.session.delete(up)
+        db.session.commit()
+        return {"message": "User_Project deleted"}
@@ -0,0 +1,45 @@
+from flask import Response
+from flask_restful import Resource
+
+from pool import pool_metrics
+
+from ..extensions import db, request_metrics, entity_cache, replica_set, hub
+from .events import event_ingestor
+from .roles import permission_cache
+
+
+class PoolMetricsResource(Resource):
+    def get(self):
+        return pool_metrics(db.engine.pool)
+
+
+class CacheMetricsResource(Resource):
+    def get(self):
+        return entity_cache.metrics()
+
+
+class ReplicaMetricsResource(Resource):
+    def get(self):
+        metrics = replica_set.metrics()
+        metrics["pools"] = {name: pool_metrics(db.engines[name].pool) for name in metrics["replicas"]}
+        return metrics
+
+
+class MetricsResource(Resource):
+    # Prometheus: запити й SQL по ендпоінтах, кеш записів, репліки, пул зʼєднань, черга подій,
+    # кеш прав, push-підписники
+    def get(self):
+        lines = request_metrics.exposition() + entity_cache.exposition()
+        if replica_set.engines:
+            lines += replica_set.exposition()
+        gauges = [
+            ("db_pool", pool_metrics(db.engine.pool)),
+            ("event_ingest", event_ingestor().metrics()),
+            ("permission_cache", {"hits": permission_cache.hits, "misses": permission_cache.misses}),
+            ("push", hub.metrics())
+        ]
+        for prefix, values in gauges:
+            for name, value in values.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    lines.append(f"{prefix}_{name} {value}")
+        return Response("\n".join(lines) + "\n", mimetype="text/plain; version=0.0.4")
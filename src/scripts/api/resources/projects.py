@@ -0,0 +1,96 @@
+from flask import request, abort
+from flask_restful import Resource
+
+from integrity import missing_reference
+from pagination import list_response
+
+from ..cache import cached_item, entity_keys
+from ..extensions import db, entity_cache
+from ..models import Project, Team, Task
+from ..serializers import expander, project_to_dict
+from .roles import permission_cache
+from .teams import task_counts
+
+
+class ProjectListResource(Resource):
+    model = Project
+    tables = expander.request_tables(model)
+
+    def get(self):
+        query, serialize = expander.query(Project.query, Project)
+        return list_response(query, Project.id, serialize)
+
+    def post(self):
+        data = request.get_json(force=True)
+        if "name" not in data or not data["name"].strip():
+            abort(400, description="Field 'name' required")
+        new = Project(name=data["name"].strip())
+        db.session.add(new)
+        db.session.commit()
+        return project_to_dict(new), 201
+
+
+class ProjectResource(Resource):
+    model = Project
+    tables = expander.request_tables(model)
+
+    def get(self, project_id):
+        proj = cached_item(Project, project_id)
+        if proj is None:
+            abort(404, description="Project not found")
+        return proj
+
+    def put(self, project_id):
+        proj = Project.query.get(project_id)
+        if not proj:
+            abort(404, description="Project not found")
+        data = request.get_json(force=True)
+        if "name" in data and data["name"].strip():
+            proj.name = data["name"].strip()
+        db.session.commit()
+        entity_cache.invalidate(entity_keys(Project, project_id))
+        return {"message": "Project updated"}
+
+    def delete(self, project_id):
+        proj = Project.query.get(project_id)
+        if not proj:
+            abort(404, description="Project not found")
+        # команди, ролі, а через команди користувачі та задачі видаляються каскадно
+        keys = entity_keys(Project, project_id, cascade=True)
+        db.session.delete(proj)
+        db.session.commit()
+        entity_cache.invalidate(keys)
+        permission_cache.clear()
+        return {"message": "Project deleted"}
+
+
+class ProjectTaskSummaryResource(Resource):
+    # Один GROUP BY по командах проєкту замість вивантаження всіх /tasks
+    def get(self, project_id):
+        rows = (
+            db.session.query(Team.id, Team.name, *task_counts())
+            .outerjoin(Task, Task.team_id == Team.id)
+            .filter(Team.project_id == project_id)
+            .group_by(Team.id, Team.name)
+            .order_by(Team.id)
+            .all()
+        )
+        if not rows and missing_reference(db.session, [(Project, project_id)]):
+            abort(404, description="Project not found")
+        teams = [
+            {
+                "team_id": r.id,
+                "name": r.name,
+                "tasks": r.tasks,
+                "overdue": int(r.overdue),
+                "without_deadline": r.without_deadline
+            }
+            for r in rows
+        ]
+        return {
+            "project_id": project_id,
+            "tasks": sum(t["tasks"] for t in teams),
+            "overdue": sum(t["overdue"] for t in teams),
+            "without_deadline": sum(t["without_deadline"] for t in teams),
+            "teams": teams
+        }
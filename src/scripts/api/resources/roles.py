@@ -0,0 +1,214 @@
+from flask import request, abort
+from flask_restful import Resource
+
+import config
+from filtering import EQ
+from integrity import commit_or_abort
+from pagination import list_response
+from permissions import PermissionCache
+from replicas import primary
+
+from ..cache import cached_item, entity_keys
+from ..extensions import db, entity_cache
+from ..models import Project, Role, Action, RoleAction
+from ..serializers import expander, role_to_dict, action_to_dict, role_action_to_dict
+
+
+def load_role_actions(role_id):
+    # Один запит: LEFT JOIN від ролі, щоб відрізнити роль без дій від неіснуючої.
+    # Кеш прав заповнюється з primary, а не з репліки
+    with primary(db.session):
+        rows = (
+            db.session.query(Role.id, Action.action)
+            .outerjoin(RoleAction, RoleAction.role_id == Role.id)
+            .outerjoin(Action, Action.id == RoleAction.action_id)
+            .filter(Role.id == role_id)
+            .all()
+        )
+    if not rows:
+        return None
+    return {action for _, action in rows if action is not None}
+
+
+permission_cache = PermissionCache(load_role_actions, config.PERMISSION_CACHE_TTL)
+
+
+class RoleListResource(Resource):
+    model = Role
+    tables = expander.request_tables(model)
+    filters = {"project_id": EQ}
+
+    def get(self):
+        query, serialize = expander.query(Role.query, Role)
+        return list_response(query, Role.id, serialize, self.filters)
+
+    def post(self):
+        data = request.get_json(force=True)
+        if "name" not in data or not data["name"].strip():
+            abort(400, description="Field 'name' required")
+        if "project_id" not in data:
+            abort(400, description="Field 'project_id' required")
+
+        new = Role(
+            name=data["name"].strip(),
+            description=data.get("description"),
+            project_id=data["project_id"]
+        )
+        db.session.add(new)
+        commit_or_abort(db.session, [(Project, data.get("project_id"))])
+        return role_to_dict(new), 201
+
+
+class RoleResource(Resource):
+    model = Role
+    tables = expander.request_tables(model)
+
+    def get(self, role_id):
+        r = cached_item(Role, role_id)
+        if r is None:
+            abort(404, description="Role not found")
+        return r
+
+    def put(self, role_id):
+        r = Role.query.get(role_id)
+        if not r:
+            abort(404, description="Role not found")
+        data = request.get_json(force=True)
+        if "name" in data and data["name"].strip():
+            r.name = data["name"].strip()
+        if "description" in data:
+            r.description = data["description"]
+        if "project_id" in data:
+            r.project_id = data["project_id"]
+        commit_or_abort(db.session, [(Project, data.get("project_id"))])
+        entity_cache.invalidate(entity_keys(Role, role_id))
+        permission_cache.invalidate(role_id)
+        return {"message": "Role updated"}
+
+    def delete(self, role_id):
+        r = Role.query.get(role_id)
+        if not r:
+            abort(404, description="Role not found")
+        db.session.delete(r)
+        db.session.commit()
+        entity_cache.invalidate(entity_keys(Role, role_id))
+        permission_cache.invalidate(role_id)
+        return {"message": "Role deleted"}
+
+
+class RolePermissionsResource(Resource):
+    tables = ("Role", "Role_Action", "Action")
+
+    def get(self, role_id):
+        actions = permission_cache.get(role_id)
+        if actions is None:
+            abort(404, description="Role not found")
+        return {"role_id": role_id, "actions": sorted(actions)}
+
+
+class ActionListResource(Resource):
+    model = Action
+    tables = expander.request_tables(model)
+
+    def get(self):
+        query, serialize = expander.query(Action.query, Action)
+        return list_response(query, Action.id, serialize)
+
+    def post(self):
+        data = request.get_json(force=True)
+        if "action" not in data or not data["action"].strip():
+            abort(400, description="Field 'action' required")
+
+        new = Action(action=data["action"].strip())
+        db.session.add(new)
+        commit_or_abort(db.session, conflicts={"action": "Action already exists"})
+        return action_to_dict(new), 201
+
+
+class ActionResource(Resource):
+    model = Action
+    tables = expander.request_tables(model)
+
+    def get(self, action_id):
+        query, serialize = expander.query(Action.query, Action)
+        a = query.filter(Action.id == action_id).first()
+        if not a:
+            abort(404, description="Action not found")
+        return serialize(a)
+
+    def put(self, action_id):
+        a = Action.query.get(action_id)
+        if not a:
+            abort(404, description="Action not found")
+        data = request.get_json(force=True)
+        if "action" in data and data["action"].strip():
+            a.action = data["action"].strip()
+        commit_or_abort(db.session, conflicts={"action": "Another action with this name already exists"})
+        permission_cache.clear()
+        return {"message": "Action updated"}
+
+    def delete(self, action_id):
+        a = Action.query.get(action_id)
+        if not a:
+            abort(404, description="Action not found")
+        db.session.delete(a)
+        db.session.commit()
+        permission_cache.clear()
+        return {"message": "Action deleted"}
+
+
+class RoleActionListResource(Resource):
+    model = RoleAction
+    tables = expander.request_tables(model)
+    filters = {"role_id": EQ, "action_id": EQ}
+
+    def get(self):
+        query, serialize = expander.query(RoleAction.query, RoleAction)
+        return list_response(query, RoleAction.id, serialize, self.filters)
+
+    def post(self):
+        data = request.get_json(force=True)
+        keys = ("role_id", "action_id")
+        if not all(k in data for k in keys):
+            abort(400, description="Fields 'role_id' and 'action_id' required")
+
+        new = RoleAction(role_id=data["role_id"], action_id=data["action_id"])
+        db.session.add(new)
+        commit_or_abort(db.session, [(Role, data.get("role_id")), (Action, data.get("action_id"))])
+        permission_cache.invalidate(int(new.role_id))
+        return role_action_to_dict(new), 201
+
+
+class RoleActionResource(Resource):
+    model = RoleAction
+    tables = expander.request_tables(model)
+
+    def get(self, ra_id):
+        query, serialize = expander.query(RoleAction.query, RoleAction)
+        ra = query.filter(RoleAction.id == ra_id).first()
+        if not ra:
+            abort(404, description="Role_Action not found")
+        return serialize(ra)
+
+    def put(self, ra_id):
+        ra = RoleAction.query.get(ra_id)
+        if not ra:
+            abort(404, description="Role_Action not found")
+        old_role_id = ra.role_id
+        data = request.get_json(force=True)
+        if "role_id" in data:
+            ra.role_id = data["role_id"]
+        if "action_id" in data:
+            ra.action_id = data["action_id"]
+        commit_or_abort(db.session, [(Role, data.get("role_id")), (Action, data.get("action_id"))])
+        permission_cache.invalidate(old_role_id, int(ra.role_id))
+        return {"message": "Role_Action updated"}
+
+    def delete(self, ra_id):
+        ra = RoleAction.query.get(ra_id)
+        if not ra:
+            abort(404, description="Role_Action not found")
+        db.session.delete(ra)
+        db.session.commit()
+        permission_cache.invalidate(ra.role_id)
+        return {"message": "Role_Action deleted"}
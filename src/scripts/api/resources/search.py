@@ -0,0 +1,85 @@
+from flask import request, abort, current_app
+from flask_restful import Resource
+
+from fulltext import query_terms, relevance
+from pagination import decode_cursor, encode_cursor, next_link, page_limit
+
+from ..extensions import db
+from ..models import Task, Artifact, User
+from ..serializers import task_to_dict, artifact_to_dict, user_to_dict
+
+# Тип результату -> (модель, колонки FULLTEXT-індексу, серіалізатор)
+SEARCHABLE = {
+    "task": (Task, (Task.name, Task.description), task_to_dict),
+    "artifact": (Artifact, (Artifact.comment,), artifact_to_dict),
+    "user": (User, (User.nickname, User.email), user_to_dict)
+}
+
+
+def search_types():
+    raw = request.args.get("type")
+    if raw is None:
+        return list(SEARCHABLE)
+    types = list(dict.fromkeys(t.strip() for t in raw.split(",") if t.strip()))
+    unknown = [t for t in types if t not in SEARCHABLE]
+    if not types or unknown:
+        abort(400, description=f"Parameter 'type' must be a subset of {', '.join(SEARCHABLE)}")
+    return types
+
+
+def search_offset():
+    after = request.args.get("after")
+    if after is None:
+        return 0
+    values = decode_cursor(after)
+    if len(values) != 1 or not isinstance(values[0], int) or values[0] < 0:
+        abort(400, description="Invalid cursor")
+    return values[0]
+
+
+class SearchResource(Resource):
+    # GET /search?q=...&type=task,artifact&limit=N. Результати всіх типів в
+    # одному списку за спаданням релевантності; курсор — зсув у цьому списку,
+    # глибина обмежена SEARCH_MAX_RESULTS
+    tables = ("Task", "Artifact", "User")
+
+    def get(self):
+        q = request.args.get("q", "")
+        min_length = current_app.config["SEARCH_MIN_WORD_LENGTH"]
+        max_results = current_app.config["SEARCH_MAX_RESULTS"]
+        terms = query_terms(q, min_length)
+        if not terms:
+            abort(400, description=f"Parameter 'q' must contain a word of at least {min_length} characters")
+        types = search_types()
+        limit = page_limit()
+        offset = search_offset()
+        # Кожен тип віддає не більше offset + limit + 1 найкращих рядків
+        depth = min(offset + limit, max_results)
+        if offset >= depth:
+            return []
+
+        dialect = db.session.get_bind().dialect.name
+        hits = []
+        for order, name in enumerate(types):
+            model, columns, serializer = SEARCHABLE[name]
+            score, condition = relevance(columns, terms, dialect)
+            score = score.label("score")
+            query, serialize = serializer.project(model.query)
+            rows = (
+                query.add_columns(score)
+                .filter(condition)
+                .order_by(score.desc(), model.id)
+                .limit(depth + 1)
+                .all()
+            )
+            hits += [(-float(row.score), order, row.id, name, serialize(row)) for row in rows]
+        hits.sort(key=lambda hit: hit[:3])
+
+        page = [
+            {"type": name, "score": round(-score, 6), "item": item}
+            for score, _, _, name, item in hits[offset:depth]
+        ]
+        headers = {}
+        if len(hits) > depth and depth < max_results:
+            headers["Link"] = next_link(encode_cursor([depth]), limit)
+        return page, 200, headers
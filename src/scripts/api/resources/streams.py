@@ -0,0 +1,33 @@
+from flask import abort, current_app
+from flask_restful import Resource
+
+from streaming import stream_events
+
+from ..extensions import db, hub
+from ..models import Project, Team
+
+
+class StreamResource(Resource):
+    # GET — потік Server-Sent Events зі змінами задач і артефактів команди
+    # або проєкту: event: task|artifact, data: {"op", "id", "data"}. Події
+    # надходять лише від записів, оброблених цим процесом (див. README)
+    parent = None
+    topic = None
+
+    def get(self, **args):
+        (key,) = args.values()
+        if db.session.query(self.parent.id).filter(self.parent.id == key).first() is None:
+            abort(404, description=f"{self.parent.__tablename__} not found")
+        if hub.subscribers >= current_app.config["PUSH_MAX_SUBSCRIBERS"]:
+            abort(503, description="Too many subscribers")
+        return stream_events(hub, [(self.topic, key)])
+
+
+class TeamStreamResource(StreamResource):
+    parent = Team
+    topic = "team"
+
+
+class ProjectStreamResource(StreamResource):
+    parent = Project
+    topic = "project"
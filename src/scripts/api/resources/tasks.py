@@ -0,0 +1,93 @@
+from flask import request, abort
+from flask_restful import Resource
+
+from batch import BatchResource
+from filtering import EQ, RANGE
+from integrity import commit_or_abort
+from pagination import list_response
+
+from ..cache import cached_item, entity_keys
+from ..extensions import db, entity_cache
+from ..models import Team, Task
+from ..push import PushBatch, publish, scopes
+from ..serializers import expander, task_to_dict
+
+
+class TaskListResource(Resource):
+    model = Task
+    tables = expander.request_tables(model)
+    filters = {"team_id": EQ, "startDate": RANGE, "deadlineDate": RANGE}
+    sorts = ("startDate", "deadlineDate")
+
+    def get(self):
+        query, serialize = expander.query(Task.query, Task)
+        return list_response(query, Task.id, serialize, self.filters, self.sorts)
+
+    def post(self):
+        data = request.get_json(force=True)
+        keys = ("name", "team_id")
+        if not all(k in data for k in keys):
+            abort(400, description="Fields 'name' and 'team_id' required")
+
+        new = Task(
+            name=data["name"].strip(),
+            description=data.get("description"),
+            team_id=data["team_id"]
+        )
+        db.session.add(new)
+        commit_or_abort(db.session, [(Team, data.get("team_id"))])
+        publish(Task, "insert", [new.id])
+        return task_to_dict(new), 201
+
+
+class TaskBatchResource(PushBatch, BatchResource):
+    model = Task
+    required = ("name", "team_id")
+    fields = ("name", "description", "deadlineDate", "team_id")
+    strip = ("name",)
+    references = {"team_id": Team}
+
+    def written(self, op, ids):
+        entity_cache.invalidate(entity_keys(Task, *ids))
+        super().written(op, ids)
+
+
+class TaskResource(Resource):
+    model = Task
+    tables = expander.request_tables(model)
+
+    def get(self, task_id):
+        t = cached_item(Task, task_id)
+        if t is None:
+            abort(404, description="Task not found")
+        return t
+
+    def put(self, task_id):
+        t = Task.query.get(task_id)
+        if not t:
+            abort(404, description="Task not found")
+        before = scopes(Task, [task_id])
+        data = request.get_json(force=True)
+        if "name" in data and data["name"].strip():
+            t.name = data["name"].strip()
+        if "description" in data:
+            t.description = data["description"]
+        if "deadlineDate" in data:
+            t.deadlineDate = data["deadlineDate"]
+        if "team_id" in data:
+            t.team_id = data["team_id"]
+        commit_or_abort(db.session, [(Team, data.get("team_id"))])
+        entity_cache.invalidate(entity_keys(Task, task_id))
+        publish(Task, "update", [task_id], before)
+        return {"message": "Task updated"}
+
+    def delete(self, task_id):
+        t = Task.query.get(task_id)
+        if not t:
+            abort(404, description="Task not found")
+        before = scopes(Task, [task_id])
+        db.session.delete(t)
+        db.session.commit()
+        entity_cache.invalidate(entity_keys(Task, task_id))
+        publish(Task, "delete", [task_id], before)
+        return {"message": "Task deleted"}
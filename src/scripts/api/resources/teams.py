@@ -0,0 +1,116 @@
+from flask import request, abort
+from flask_restful import Resource
+from sqlalchemy import case, func, select
+
+from filtering import EQ
+from integrity import commit_or_abort
+from pagination import list_response
+
+from ..cache import cached_item, entity_keys
+from ..extensions import db, entity_cache
+from ..models import Project, Team, User, Task, Artifact
+from ..serializers import expander, team_to_dict
+
+
+class TeamListResource(Resource):
+    model = Team
+    tables = expander.request_tables(model)
+    filters = {"project_id": EQ}
+
+    def get(self):
+        query, serialize = expander.query(Team.query, Team)
+        return list_response(query, Team.id, serialize, self.filters)
+
+    def post(self):
+        data = request.get_json(force=True)
+        if "name" not in data or not data["name"].strip():
+            abort(400, description="Field 'name' required")
+        if "project_id" not in data:
+            abort(400, description="Field 'project_id' required")
+
+        new = Team(name=data["name"].strip(), project_id=data["project_id"])
+        db.session.add(new)
+        commit_or_abort(db.session, [(Project, data.get("project_id"))])
+        return team_to_dict(new), 201
+
+
+class TeamResource(Resource):
+    model = Team
+    tables = expander.request_tables(model)
+
+    def get(self, team_id):
+        t = cached_item(Team, team_id)
+        if t is None:
+            abort(404, description="Team not found")
+        return t
+
+    def put(self, team_id):
+        t = Team.query.get(team_id)
+        if not t:
+            abort(404, description="Team not found")
+        data = request.get_json(force=True)
+        if "name" in data and data["name"].strip():
+            t.name = data["name"].strip()
+        if "project_id" in data:
+            t.project_id = data["project_id"]
+        commit_or_abort(db.session, [(Project, data.get("project_id"))])
+        entity_cache.invalidate(entity_keys(Team, team_id))
+        return {"message": "Team updated"}
+
+    def delete(self, team_id):
+        t = Team.query.get(team_id)
+        if not t:
+            abort(404, description="Team not found")
+        keys = entity_keys(Team, team_id, cascade=True)
+        db.session.delete(t)
+        db.session.commit()
+        entity_cache.invalidate(keys)
+        return {"message": "Team deleted"}
+
+
+def task_counts():
+    # Агрегати задач для GROUP BY: усього, прострочені, без дедлайну
+    now = func.now()
+    return (
+        func.count(Task.id).label("tasks"),
+        func.coalesce(func.sum(case((Task.deadlineDate < now, 1), else_=0)), 0).label("overdue"),
+        (func.count(Task.id) - func.count(Task.deadlineDate)).label("without_deadline")
+    )
+
+
+class TeamStatsResource(Resource):
+    # Без `tables`: "прострочені" залежать від поточного часу, тож ETag
+    # за версіями таблиць тут застарів би без жодного запису в БД
+    def get(self, team_id):
+        users = select(func.count(User.id)).where(User.team_id == Team.id).scalar_subquery()
+        artifacts = (
+            select(func.count(Artifact.id))
+            .join(Task, Task.id == Artifact.task_id)
+            .where(Task.team_id == Team.id)
+            .scalar_subquery()
+        )
+        next_deadline = func.min(case((Task.deadlineDate >= func.now(), Task.deadlineDate)))
+        row = (
+            db.session.query(
+                *task_counts(),
+                next_deadline.label("next_deadline"),
+                users.label("users"),
+                artifacts.label("artifacts")
+            )
+            .select_from(Team)
+            .outerjoin(Task, Task.team_id == Team.id)
+            .filter(Team.id == team_id)
+            .group_by(Team.id)
+            .first()
+        )
+        if row is None:
+            abort(404, description="Team not found")
+        return {
+            "team_id": team_id,
+            "tasks": row.tasks,
+            "overdue": int(row.overdue),
+            "without_deadline": row.without_deadline,
+            "next_deadline": row.next_deadline,
+            "users": row.users,
+            "artifacts": row.artifacts
+        }
@@ -0,0 +1,175 @@
+import uuid
+
+from flask import request, abort
+from flask_restful import Resource
+from sqlalchemy import case, or_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from filtering import EQ
+from integrity import commit_or_abort, constraint_errors
+from outbox import record_changes
+from pagination import list_response
+
+from ..cache import cached_item, entity_keys
+from ..extensions import db, entity_cache
+from ..models import Team, User
+from ..serializers import expander, user_to_dict
+
+
+class UserListResource(Resource):
+    model = User
+    tables = expander.request_tables(model)
+    filters = {"team_id": EQ}
+
+    def get(self):
+        query, serialize = expander.query(User.query, User)
+        return list_response(query, User.id, serialize, self.filters)
+
+    def post(self):
+        data = request.get_json(force=True)
+        required = ("nickname", "email", "password", "team_id")
+        if not all(k in data for k in required):
+            abort(400, description="Fields 'nickname','email','password','team_id' are required")
+
+        new = User(
+            nickname=data["nickname"].strip(),
+            email=data["email"].strip(),
+            password=data["password"],  # У реальному проєкті: зберігати лише хеш!
+            photo=data.get("photo"),
+            team_id=data["team_id"]
+        )
+        db.session.add(new)
+        # Унікальність email/nickname забезпечують UNIQUE-індекси: один INSERT
+        commit_or_abort(
+            db.session,
+            [(Team, data.get("team_id"))],
+            conflicts={
+                "email": "User with this email already exists",
+                "nickname": "User with this nickname already exists"
+            }
+        )
+        return user_to_dict(new), 201
+
+
+class UserResource(Resource):
+    model = User
+    tables = expander.request_tables(model)
+
+    def get(self, user_id):
+        u = cached_item(User, user_id)
+        if u is None:
+            abort(404, description="User not found")
+        return u
+
+    def put(self, user_id):
+        u = User.query.get(user_id)
+        if not u:
+            abort(404, description="User not found")
+        data = request.get_json(force=True)
+
+        if "nickname" in data:
+            u.nickname = data["nickname"].strip()
+        if "email" in data:
+            u.email = data["email"].strip()
+        if "password" in data:
+            u.password = data["password"]
+        if "photo" in data:
+            u.photo = data["photo"]  # може бути None
+        if "team_id" in data:
+            u.team_id = data["team_id"]
+
+        commit_or_abort(
+            db.session,
+            [(Team, data.get("team_id"))],
+            conflicts={
+                "nickname": "Another user with this nickname already exists",
+                "email": "Another user with this email already exists"
+            }
+        )
+        entity_cache.invalidate(entity_keys(User, user_id))
+        return {"message": "User updated"}
+
+    def delete(self, user_id):
+        u = User.query.get(user_id)
+        if not u:
+            abort(404, description="User not found")
+        db.session.delete(u)
+        db.session.commit()
+        entity_cache.invalidate(entity_keys(User, user_id))
+        return {"message": "User deleted"}
+
+
+ON_CONFLICT_INSERT = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+def upsert_by_email(dialect, row, values):
+    # MySQL: INSERT ... ON DUPLICATE KEY UPDATE спрацьовує на будь-якому UNIQUE,
+    # тож CASE оновлює лише рядок з тим самим email. SQLite/PostgreSQL:
+    # ON CONFLICT (email) DO UPDATE лише коли дані відрізняються —
+    # конфлікт за nickname лишається IntegrityError
+    if dialect.name == "mysql":
+        stmt = mysql_insert(User).values(**row)
+        same_email = User.email == stmt.inserted.email
+        return stmt.on_duplicate_key_update({
+            name: case((same_email, stmt.inserted[name]), else_=getattr(User, name))
+            for name in values
+        })
+    stmt = ON_CONFLICT_INSERT[dialect.name](User).values(**row)
+    return stmt.on_conflict_do_update(
+        index_elements=[User.email],
+        set_={name: stmt.excluded[name] for name in values},
+        where=or_(*[getattr(User, name).is_distinct_from(stmt.excluded[name]) for name in values]),
+    )
+
+
+class UserByEmailResource(Resource):
+    # Upsert для синхронізації каталогу (див. upsert_by_email).
+    # Оновлюється лише рядок з тим самим email; конфлікт за nickname з
+    # іншим користувачем не змінює його рядок і повертає 409.
+    def put(self, email):
+        data = request.get_json(force=True)
+        required = ("nickname", "password", "team_id")
+        if not all(k in data for k in required):
+            abort(400, description="Fields 'nickname','password','team_id' are required")
+
+        values = {
+            "nickname": data["nickname"].strip(),
+            "password": data["password"],
+            "photo": data.get("photo"),
+            "team_id": data["team_id"]
+        }
+        new_id = str(uuid.uuid4())
+        dialect = db.session.get_bind().dialect
+        stmt = upsert_by_email(dialect, dict(values, id=new_id, email=email.strip()), values)
+
+        # MySQL: 2 — наявний рядок оновлено, 1 (з CLIENT_FOUND_ROWS) — вставлено
+        # новий рядок, дані не змінились або конфлікт за nickname.
+        # ON CONFLICT: 1 — вставлено або оновлено, 0 — дані не змінились
+        with constraint_errors(
+            db.session,
+            [(Team, data.get("team_id"))],
+            conflicts={"nickname": "Another user with this nickname already exists"},
+        ):
+            affected = db.session.execute(stmt).rowcount
+            user_id = db.session.query(User.id).filter_by(email=email.strip()).scalar()
+            if dialect.name == "mysql":
+                updated = affected == 2
+            else:
+                updated = affected == 1 and user_id != new_id
+            if updated:
+                record_changes(db.session, User.__table__, "update", [user_id])
+            elif user_id == new_id:
+                record_changes(db.session, User.__table__, "insert", [user_id])
+            db.session.commit()
+
+        if updated:
+            entity_cache.invalidate(entity_keys(User, user_id))
+            return {"message": "User updated"}
+        u = User.query.filter_by(email=email.strip()).first()
+        if u is not None and u.id == new_id:
+            return user_to_dict(u), 201
+        if u is not None and all(getattr(u, k) == v for k, v in values.items()):
+            return {"message": "User updated"}
+        abort(409, description="Another user with this nickname already exists")
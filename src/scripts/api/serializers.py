@@ -0,0 +1,51 @@
+from expand import Expander
+from serializer import Serializer
+
+from .models import Project, Team, User, Role, UserProject, Task, Artifact, Action, RoleAction, Event
+
+project_to_dict = Serializer(Project, "id", "name")
+
+team_to_dict = Serializer(Team, "id", "name", "project_id")
+
+user_to_dict = Serializer(User, "id", "nickname", "email", "photo", "team_id")
+
+role_to_dict = Serializer(Role, "id", "name", "description", "project_id")
+
+user_project_to_dict = Serializer(UserProject, "id", "user_id", "project_id", "role_id", "team_id")
+
+task_to_dict = Serializer(Task, "id", "name", "description", "startDate", "deadlineDate", "team_id")
+
+artifact_to_dict = Serializer(Artifact, "id", "status", "comment", "datetime", "task_id")
+
+action_to_dict = Serializer(Action, "id", "action")
+
+role_action_to_dict = Serializer(RoleAction, "id", "role_id", "action_id")
+
+event_to_dict = Serializer(Event, "id", "user_id", "role_id", "action", "datetime")
+
+
+expander = Expander(
+    serializers={
+        Project: project_to_dict,
+        Team: team_to_dict,
+        User: user_to_dict,
+        Role: role_to_dict,
+        UserProject: user_project_to_dict,
+        Task: task_to_dict,
+        Artifact: artifact_to_dict,
+        Action: action_to_dict,
+        RoleAction: role_action_to_dict,
+        Event: event_to_dict
+    },
+    relations={
+        Project: ("teams", "roles", "members"),
+        Team: ("project", "users", "tasks"),
+        User: ("team", "projects"),
+        Role: ("project", "actions"),
+        UserProject: ("user", "project", "role", "team"),
+        Task: ("team", "artifacts"),
+        Artifact: ("task",),
+        RoleAction: ("role", "action"),
+        Event: ("user", "role")
+    }
+)
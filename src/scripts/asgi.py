@@ -0,0 +1,265 @@
+"""ASGI-режим: асинхронне читання ресурсів.
+
+    pip install uvicorn aiomysql asgiref
+    uvicorn asgi:app --workers 4
+
+GET-запити до ресурсів з атрибутом `model` (списки й окремі записи разом з
+?expand=, ?fields=, фільтрами, сортуванням, пагінацією, NDJSON та ETag)
+виконуються через асинхронний драйвер: очікування відповіді MySQL не
+займає потік, тож один воркер обслуговує багато паралельних читань.
+Потоки подій (/teams/<id>/stream, /projects/<id>/stream) теж обслуговуються
+циклом подій: відкрите зʼєднання не займає потік. Решта запитів (запис,
+статистика, метрики) передається Flask-застосунку через WsgiToAsgi і
+виконується в пулі потоків, як і в синхронному режимі; записи публікують
+сповіщення в той самий хаб процесу.
+
+Асинхронні читання обходять кеш записів (entity_cache), маршрутизацію на
+репліки (завжди primary) та інструментацію /metrics і Server-Timing.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from werkzeug.exceptions import HTTPException
+from werkzeug.http import http_date
+
+import config
+from api import create_app
+from api.extensions import table_versions, hub
+from api.serializers import expander
+from conditional import REVALIDATE, request_tables, check_preconditions
+from hub import CLOSED, HEARTBEAT, Subscription, sse_retry
+from pagination import filter_and_sort, order_clauses, page_query, page_rows
+from serializer import dumps
+from streaming import NDJSON, EVENT_STREAM, EVENT_STREAM_HEADERS, wants_stream
+
+engine = create_async_engine(
+    config.ASYNC_DATABASE_URI,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
+    pool_recycle=config.DB_POOL_RECYCLE,
+    pool_pre_ping=config.DB_POOL_PRE_PING,
+    pool_timeout=config.DB_POOL_TIMEOUT
+)
+Session = async_sessionmaker(engine, expire_on_commit=False)
+
+
+class PooledWsgiInstance(WsgiToAsgiInstance):
+    # WsgiToAsgi виконує всі WSGI-запити по одному в спільному потоці
+    # (thread_sensitive), а під паралельним навантаженням падає з
+    # "CurrentThreadExecutor already quit". Тут — пул потоків циклу подій,
+    # як gunicorn --threads
+    run_wsgi_app = sync_to_async(WsgiToAsgiInstance.__dict__["run_wsgi_app"].func, thread_sensitive=False)
+
+
+class PooledWsgi(WsgiToAsgi):
+    async def __call__(self, scope, receive, send):
+        await PooledWsgiInstance(self.wsgi_application, self.duplicate_header_limit)(scope, receive, send)
+
+
+flask_app = create_app()
+wsgi = PooledWsgi(flask_app)
+urls = flask_app.url_map.bind("localhost")
+
+
+def route(scope, methods, attribute):
+    # -> (клас ресурсу з атрибутом attribute, аргументи маршруту) або None
+    if scope["type"] != "http" or scope["method"] not in methods:
+        return None
+    try:
+        endpoint, args = urls.match(scope["path"], method="GET")
+    except HTTPException:
+        return None
+    view_class = getattr(flask_app.view_functions[endpoint], "view_class", None)
+    if getattr(view_class, attribute, None) is None:
+        return None
+    return view_class, args
+
+
+def resolve(scope):
+    # Ресурс для асинхронного читання
+    return route(scope, ("GET", "HEAD"), "model")
+
+
+def resolve_stream(scope):
+    # Ресурс потоку подій (streams.StreamResource)
+    return route(scope, ("GET",), "topic")
+
+
+class AsyncSubscription(Subscription):
+    # Черга в циклі подій; publish() викликається з потоків, що виконують запис
+    def __init__(self, topics, size, loop):
+        super().__init__(topics, size)
+        self.loop = loop
+        self.queue = asyncio.Queue()
+
+    def push(self, message):
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, message)
+
+
+def request_context(scope):
+    # Flask-контекст запиту без виконання WSGI: розбір параметрів і побудова
+    # SQL використовують ті самі функції, що й синхронні обробники
+    headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+    host = headers.get("host", "localhost")
+    return flask_app.test_request_context(
+        scope["path"],
+        base_url=f"{scope.get('scheme', 'http')}://{host}{scope.get('root_path', '')}",
+        query_string=scope["query_string"].decode("latin-1"),
+        headers=headers,
+        method="GET"
+    )
+
+
+def build(view_class, args):
+    # -> (вид відповіді, query, функція серіалізації, (sort, limit))
+    model = view_class.model
+    query, serialize = expander.query(model.query, model)
+    if args:
+        (value,) = args.values()
+        return "item", query.filter(model.id == value).limit(1), serialize, None
+    query, sort = filter_and_sort(
+        query, model.id, getattr(view_class, "filters", None), getattr(view_class, "sorts", ())
+    )
+    if wants_stream():
+        return "stream", query.order_by(*order_clauses(model.id, sort)), serialize, None
+    query, limit = page_query(query, model.id, sort)
+    return "page", query, serialize, (sort, limit)
+
+
+def returns_objects(query, model):
+    # ?expand= читає ORM-обʼєкти, без нього — рядки проєкції
+    descriptions = query.column_descriptions
+    return len(descriptions) == 1 and descriptions[0]["expr"] is model
+
+
+async def send_response(send, status, body=b"", headers=None, head=False):
+    raw = [(b"content-type", b"application/json")]
+    raw += [(k.lower().encode(), str(v).encode()) for k, v in (headers or {}).items()]
+    raw.append((b"content-length", str(len(body)).encode()))
+    await send({"type": "http.response.start", "status": status, "headers": raw})
+    await send({"type": "http.response.body", "body": b"" if head else body})
+
+
+async def stream_rows(send, session, statement, objects, serialize, headers):
+    result = await session.stream(statement.execution_options(yield_per=flask_app.config["STREAM_BATCH_SIZE"]))
+    if objects:
+        result = result.scalars()
+    raw = [(b"content-type", NDJSON.encode())]
+    raw += [(k.lower().encode(), str(v).encode()) for k, v in headers.items()]
+    await send({"type": "http.response.start", "status": 200, "headers": raw})
+    async for partition in result.partitions():
+        chunk = b"".join(dumps(serialize(row)) + b"\n" for row in partition)
+        await send({"type": "http.response.body", "body": chunk, "more_body": True})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def disconnected(receive):
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def event_stream(send, receive, view_class, args):
+    # Server-Sent Events: очікування повідомлення, heartbeat і розриву — await
+    (key,) = args.values()
+    parent = view_class.parent
+    async with Session() as session:
+        found = await session.scalar(select(parent.id).where(parent.id == key))
+    if found is None:
+        return await send_response(send, 404, dumps({"message": f"{parent.__tablename__} not found"}))
+    if hub.subscribers >= flask_app.config["PUSH_MAX_SUBSCRIBERS"]:
+        return await send_response(send, 503, dumps({"message": "Too many subscribers"}))
+
+    subscription = hub.subscribe(AsyncSubscription(
+        [(view_class.topic, key)], flask_app.config["PUSH_QUEUE_SIZE"], asyncio.get_running_loop()
+    ))
+    closed = asyncio.ensure_future(disconnected(receive))
+    pending = None
+    try:
+        raw = [(b"content-type", EVENT_STREAM.encode())]
+        raw += [(k.lower().encode(), v.encode()) for k, v in EVENT_STREAM_HEADERS.items()]
+        await send({"type": "http.response.start", "status": 200, "headers": raw})
+        await send({"type": "http.response.body", "body": sse_retry(flask_app.config["PUSH_RETRY_MS"]), "more_body": True})
+        while True:
+            # Незавершене очікування черги переживає heartbeat: повідомлення не губиться
+            if pending is None:
+                pending = asyncio.ensure_future(subscription.queue.get())
+            done, _ = await asyncio.wait(
+                (pending, closed), timeout=flask_app.config["PUSH_HEARTBEAT"], return_when=asyncio.FIRST_COMPLETED
+            )
+            if closed in done:
+                return
+            body = HEARTBEAT
+            if pending in done:
+                body, pending = pending.result(), None
+                if body is CLOSED:
+                    break
+            await send({"type": "http.response.body", "body": body, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        hub.unsubscribe(subscription)
+        closed.cancel()
+        if pending is not None:
+            pending.cancel()
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        return await lifespan(receive, send)
+    stream = resolve_stream(scope)
+    if stream is not None:
+        return await event_stream(send, receive, *stream)
+    target = resolve(scope)
+    if target is None:
+        return await wsgi(scope, receive, send)
+    view_class, args = target
+    model = view_class.model
+
+    try:
+        with request_context(scope):
+            headers = {}
+            tables = request_tables(view_class)
+            if tables:
+                # Знімок версій може читатися з БД синхронним engine — у потоці,
+                # а не в циклі подій; контекст запиту Flask потік успадковує
+                etag, last_modified, fresh = await asyncio.to_thread(check_preconditions, table_versions, tables)
+                headers = {"ETag": f'"{etag}"', "Last-Modified": http_date(last_modified), "Cache-Control": REVALIDATE}
+                if fresh:
+                    return await send_response(send, 304, headers=headers)
+            kind, query, serialize, page = build(view_class, args)
+            statement = query.statement
+            objects = returns_objects(query, model)
+
+        async with Session() as session:
+            if kind == "stream":
+                return await stream_rows(send, session, statement, objects, serialize, headers)
+            result = await session.execute(statement)
+            rows = result.scalars().all() if objects else result.all()
+
+        if kind == "item":
+            if not rows:
+                # Повідомлення 404 формує сам ресурс
+                return await wsgi(scope, receive, send)
+            data = serialize(rows[0])
+        else:
+            with request_context(scope):
+                rows, links = page_rows(rows, model.id, *page)
+            headers.update(links)
+            data = [serialize(row) for row in rows]
+    except HTTPException as e:
+        return await send_response(send, e.code, dumps({"message": e.description}))
+
+    await send_response(send, 200, dumps(data), headers, head=scope["method"] == "HEAD")
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await engine.dispose()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
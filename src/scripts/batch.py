@@ -0,0 +1,223 @@
+from flask import request, abort, current_app
+from flask_restful import Resource
+from sqlalchemy import insert, update, delete, text
+from filtering import coerce_value
+from integrity import commit_or_abort
+from outbox import record_changes
+
+
+def id_step(executor, dialect):
+    # Крок AUTO_INCREMENT: @@auto_increment_increment у MySQL (не 1 у
+    # кластерах з кількома primary), 1 в інших БД. executor — Session або Connection
+    if dialect.name != "mysql":
+        return 1
+    return executor.scalar(text("SELECT @@auto_increment_increment"))
+
+
+def insert_ids(executor, dialect, table, rows):
+    # Один багаторядковий INSERT -> id вставлених рядків у порядку rows.
+    # executor — Session або Connection
+    if dialect.insert_returning:
+        result = executor.execute(insert(table).values(rows).returning(table.c.id))
+        return [row_id for (row_id,) in result]
+    # MySQL: багаторядковий INSERT без явних id ("simple insert") отримує
+    # весь блок AUTO_INCREMENT одразу за будь-якого innodb_autoinc_lock_mode;
+    # значення йдуть з кроком id_step(), LAST_INSERT_ID() — id першого рядка
+    first = executor.execute(insert(table).values(rows)).lastrowid
+    step = id_step(executor, dialect)
+    return list(range(first, first + step * len(rows), step))
+
+
+class BatchResource(Resource):
+    # Масові операції над колекцією: POST — створення, PUT — оновлення,
+    # DELETE — видалення. Валідація виконується для всього масиву одразу
+    # (один SELECT ... IN на кожну звʼязану таблицю), запис — одним
+    # запитом в одній транзакції. Відповідь містить результат для кожного елемента.
+    model = None
+    required = ()
+    fields = ()
+    strip = ()
+    references = {}
+
+    @property
+    def session(self):
+        return current_app.extensions["sqlalchemy"].session
+
+    def record(self, op, ids, cascade=False):
+        # Журнал змін (outbox) у транзакції запису, до commit
+        record_changes(self.session, self.model.__table__, op, ids, cascade)
+
+    def items(self):
+        data = request.get_json(force=True)
+        if not isinstance(data, list):
+            abort(400, description="Request body must be a JSON array")
+        limit = current_app.config["BATCH_SIZE_MAX"]
+        if len(data) > limit:
+            abort(413, description=f"Batch size exceeds {limit} items")
+        return data
+
+    def clean(self, item, required):
+        # Повертає (рядок для запису, None) або (None, помилка елемента)
+        if not isinstance(item, dict):
+            return None, (400, "Item must be a JSON object")
+        missing = [k for k in required if k not in item]
+        if len(missing) == 1:
+            return None, (400, f"Field '{missing[0]}' required")
+        if missing:
+            names = "', '".join(missing)
+            return None, (400, f"Fields '{names}' required")
+
+        row = {}
+        for name in self.fields:
+            if name not in item:
+                continue
+            value = item[name]
+            if name in self.strip:
+                if not isinstance(value, str) or not value.strip():
+                    return None, (400, f"Field '{name}' required")
+                value = value.strip()
+            try:
+                row[name] = coerce_value(getattr(self.model, name), value)
+            except (ValueError, TypeError):
+                return None, (400, f"Invalid value for '{name}'")
+        return row, None
+
+    def missing_references(self, rows):
+        # {колонка: множина id, яких немає у звʼязаній таблиці}
+        missing = {}
+        for name, target in self.references.items():
+            ids = {row[name] for row in rows if row.get(name) is not None}
+            if not ids:
+                continue
+            found = {v for (v,) in self.session.query(target.id).filter(target.id.in_(ids))}
+            missing[name] = ids - found
+        return missing
+
+    def reference_error(self, row, missing):
+        for name, ids in missing.items():
+            if row.get(name) in ids:
+                return 404, f"{self.references[name].__tablename__} not found"
+        return None
+
+    def existing_ids(self, ids):
+        key = self.model.id
+        return {v for (v,) in self.session.query(key).filter(key.in_(ids))}
+
+    def insert_rows(self, rows):
+        # Багаторядковий VALUES вимагає однакового набору колонок у кожному рядку
+        rows = [{name: row.get(name) for name in self.fields} for row in rows]
+        return insert_ids(self.session, self.session.get_bind().dialect, self.model.__table__, rows)
+
+    def writing(self, op, ids):
+        # Перед масовим UPDATE/DELETE: id рядків, які буде змінено
+        pass
+
+    def written(self, op, ids):
+        # Після commit: операція і id створених, змінених або видалених рядків
+        pass
+
+    def respond(self, results, success):
+        body = []
+        for index, (status, payload) in enumerate(results):
+            entry = {"index": index, "status": status}
+            entry.update(payload if isinstance(payload, dict) else {"message": payload})
+            body.append(entry)
+        ok = all(status == success for status, _ in results)
+        return body, success if ok else 207
+
+    def post(self):
+        items = self.items()
+        results = [None] * len(items)
+        rows = {}
+        for index, item in enumerate(items):
+            row, error = self.clean(item, self.required)
+            if error:
+                results[index] = error
+            else:
+                rows[index] = row
+
+        missing = self.missing_references(rows.values())
+        for index in list(rows):
+            error = self.reference_error(rows[index], missing)
+            if error:
+                results[index] = error
+                del rows[index]
+
+        if rows:
+            ids = self.insert_rows(list(rows.values()))
+            self.record("insert", ids)
+            commit_or_abort(self.session)
+            self.written("insert", ids)
+            for index, row_id in zip(rows, ids):
+                results[index] = (201, {"id": row_id})
+        return self.respond(results, 201)
+
+    def put(self):
+        items = self.items()
+        results = [None] * len(items)
+        rows = {}
+        for index, item in enumerate(items):
+            row, error = self.clean(item, ())
+            if error:
+                results[index] = error
+                continue
+            try:
+                row["id"] = coerce_value(self.model.id, item.get("id"))
+            except (ValueError, TypeError):
+                row["id"] = None
+            if row["id"] is None:
+                results[index] = (400, "Field 'id' required")
+            else:
+                rows[index] = row
+
+        existing = self.existing_ids({row["id"] for row in rows.values()}) if rows else set()
+        missing = self.missing_references(rows.values())
+        for index in list(rows):
+            row = rows[index]
+            if row["id"] not in existing:
+                error = (404, f"{self.model.__tablename__} not found")
+            else:
+                error = self.reference_error(row, missing)
+            if error:
+                results[index] = error
+                del rows[index]
+
+        if rows:
+            ids = [row["id"] for row in rows.values()]
+            self.writing("update", ids)
+            # ORM bulk UPDATE за первинним ключем (executemany)
+            self.session.execute(update(self.model), list(rows.values()))
+            self.record("update", ids)
+            commit_or_abort(self.session)
+            self.written("update", ids)
+            for index, row in rows.items():
+                results[index] = (200, {"id": row["id"]})
+        return self.respond(results, 200)
+
+    def delete(self):
+        items = self.items()
+        results = [None] * len(items)
+        ids = {}
+        for index, raw in enumerate(items):
+            try:
+                ids[index] = coerce_value(self.model.id, raw)
+            except (ValueError, TypeError):
+                ids[index] = None
+            if ids[index] is None:
+                results[index] = (400, "Invalid id")
+                del ids[index]
+
+        existing = self.existing_ids(set(ids.values())) if ids else set()
+        for index, row_id in ids.items():
+            if row_id in existing:
+                results[index] = (200, {"id": row_id})
+            else:
+                results[index] = (404, f"{self.model.__tablename__} not found")
+
+        if existing:
+            self.writing("delete", existing)
+            self.record("delete", existing, cascade=True)
+            self.session.execute(delete(self.model).where(self.model.id.in_(existing)))
+            commit_or_abort(self.session)
+            self.written("delete", existing)
+        return self.respond(results, 200)
@@ -0,0 +1,198 @@
+import hashlib
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+from flask import request, g, make_response
+from sqlalchemy import event, func, select
+from sqlalchemy.sql.dml import UpdateBase, Update, Delete
+
+
+# Клієнт і проміжні кеші перевіряють копію (If-None-Match) перед кожним
+# використанням, а не вважають її свіжою евристично за Last-Modified
+REVALIDATE = "no-cache"
+
+
+class TableVersions:
+    # Версії таблиць для ETag і Last-Modified. Джерело — load() -> {таблиця:
+    # токен} зі стану, спільного для всіх воркерів (change_log_versions,
+    # підключається в create_app): ETag однаковий у всіх процесах і після
+    # перезапуску. Знімок кешується на ttl секунд, тож більшість перевірок
+    # If-None-Match не звертається до БД, а запис в іншому воркері чи поза
+    # API стає видимим не пізніше ніж через ttl. Запис у цьому процесі
+    # (bump) скидає знімок одразу. Без load — лише лічильники процесу з
+    # epoch, що змінюється з кожним запуском.
+    def __init__(self, ttl=1.0, load=None):
+        self.ttl = ttl
+        self.load = load
+        self.epoch = uuid.uuid4().hex
+        self.started = time.time()
+        self.counters = {}
+        self.modified = {}
+        self.tokens = None
+        self.expires = 0.0
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def bump(self, *tables):
+        now = time.time()
+        with self.lock:
+            for table in tables:
+                self.counters[table] = self.counters.get(table, 0) + 1
+                self.modified[table] = now
+            self.generation += 1
+            self.expires = 0.0
+
+    def snapshot(self):
+        # {таблиця: токен}; load() виконується поза блокуванням, а лічильник
+        # поколінь не дає закешувати знімок, прочитаний до запису в процесі
+        with self.lock:
+            if self.load is None:
+                return {table: f"{self.epoch}:{n}" for table, n in self.counters.items()}
+            if self.tokens is not None and time.monotonic() < self.expires:
+                return self.tokens
+            generation = self.generation
+        tokens = self.load()
+        now = time.time()
+        with self.lock:
+            if self.tokens is not None:
+                # Зміни, зроблені іншими процесами, — для Last-Modified
+                for table in set(tokens) | set(self.tokens):
+                    if tokens.get(table) != self.tokens.get(table):
+                        self.modified[table] = max(self.modified.get(table, 0), now)
+            self.tokens = tokens
+            if generation == self.generation:
+                self.expires = time.monotonic() + self.ttl
+        return tokens
+
+    def etag(self, tables, key=""):
+        tokens = self.snapshot()
+        token = ",".join(f"{t}:{tokens.get(t, 0)}" for t in tables)
+        return hashlib.sha1(f"{token}|{key}".encode()).hexdigest()
+
+    def modified_since(self, tables, since):
+        with self.lock:
+            return any(self.modified.get(t, 0) > since for t in tables)
+
+    def last_modified(self, tables):
+        # Після etag(): знімок уже прочитано. Зміни до запуску процесу
+        # датуються часом запуску — пізніше за справжній, тож без хибних 304
+        with self.lock:
+            ts = max((self.modified.get(t, self.started) for t in tables), default=self.started)
+        # HTTP-дати мають секундну точність
+        return datetime.fromtimestamp(int(ts) + 1, timezone.utc)
+
+
+def change_log_versions(engine, log, appended=()):
+    # load() для TableVersions: токен таблиці — id останнього запису журналу
+    # змін (log, індекс (entity, id)) для неї; для таблиць, INSERT яких у
+    # журнал не пишеться (Event, ChangeLog.appended), — ще найменший і
+    # найбільший id: нові записи й очищення старих. Читається з primary, два запити
+    def load():
+        with engine.connect() as conn:
+            query = select(log.c.entity, func.max(log.c.id)).group_by(log.c.entity)
+            tokens = {entity: str(last) for entity, last in conn.execute(query)}
+            for table in appended:
+                low, high = conn.execute(select(func.min(table.c.id), func.max(table.c.id))).one()
+                tokens[table.name] = f"{low}-{high}:{tokens.get(table.name)}"
+        return tokens
+    return load
+
+
+def dependent_tables(metadata):
+    # Таблиця -> вона сама та всі таблиці, що посилаються на неї (транзитивно):
+    # UPDATE/DELETE батьківського рядка змінює їх через ON DELETE/UPDATE CASCADE / SET NULL
+    children = {name: set() for name in metadata.tables}
+    for table in metadata.tables.values():
+        for fk in table.foreign_keys:
+            children[fk.column.table.name].add(table.name)
+
+    closure = {}
+    for name in metadata.tables:
+        seen, stack = set(), [name]
+        while stack:
+            current = stack.pop()
+            if current not in seen:
+                seen.add(current)
+                stack.extend(children.get(current, ()))
+        closure[name] = seen
+    return closure
+
+
+def track_writes(engine, metadata, versions):
+    # Версію таблиці підвищуємо двічі: під час виконання INSERT/UPDATE/DELETE
+    # і після завершення транзакції (повернення зʼєднання в пул). ETag,
+    # обчислений у проміжку, ніколи не збігається з фінальним.
+    closure = dependent_tables(metadata)
+
+    @event.listens_for(engine, "after_execute")
+    def _after_execute(conn, clauseelement, multiparams, params, execution_options, result):
+        if not isinstance(clauseelement, UpdateBase):
+            return
+        name = clauseelement.table.name
+        if isinstance(clauseelement, (Update, Delete)):
+            tables = closure.get(name, {name})
+        else:
+            tables = {name}
+        conn.info.setdefault("written_tables", set()).update(tables)
+        versions.bump(*tables)
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        tables = connection_record.info.pop("written_tables", None)
+        if tables:
+            versions.bump(*tables)
+
+
+def request_tables(view_class):
+    # Таблиці відповіді ресурсу; tables може залежати від запиту (?expand=)
+    tables = getattr(view_class, "tables", None)
+    return tables() if callable(tables) else tables
+
+
+def check_preconditions(versions, tables):
+    # Для поточного запиту -> (etag, last_modified, чи актуальна копія клієнта)
+    key = f"{request.full_path}|{request.headers.get('Accept', '')}"
+    etag = versions.etag(tables, key)
+    last_modified = versions.last_modified(tables)
+    if request.if_none_match:
+        fresh = request.if_none_match.contains(etag)
+    else:
+        since = request.if_modified_since
+        fresh = since is not None and last_modified <= since
+    return etag, last_modified, fresh
+
+
+def init_conditional(app, versions):
+    # GET/HEAD ресурсу з атрибутом `tables` отримує ETag і Last-Modified;
+    # If-None-Match / If-Modified-Since відповідають 304 до виклику обробника
+    def resource_tables():
+        if request.method not in ("GET", "HEAD") or request.endpoint is None:
+            return None
+        view = app.view_functions.get(request.endpoint)
+        return request_tables(getattr(view, "view_class", None))
+
+    @app.before_request
+    def _check_preconditions():
+        tables = resource_tables()
+        if not tables:
+            return None
+        g.etag, g.last_modified, fresh = check_preconditions(versions, tables)
+        if fresh:
+            response = make_response("", 304)
+            response.set_etag(g.etag)
+            response.last_modified = g.last_modified
+            response.headers["Cache-Control"] = REVALIDATE
+            return response
+        return None
+
+    @app.after_request
+    def _add_validators(response):
+        etag = g.pop("etag", None)
+        last_modified = g.pop("last_modified", None)
+        if etag and response.status_code == 200:
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.headers.setdefault("Cache-Control", REVALIDATE)
+        return response
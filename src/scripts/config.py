@@ -1,13 +1,136 @@
 import os
 
+from pool import MeteredQueuePool
+
 MYSQL_USER = os.getenv("MYSQL_USER", "root")
 MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "rakarak")
 MYSQL_HOST = os.getenv("MYSQL_HOST", "localhost")
 MYSQL_PORT = os.getenv("MYSQL_PORT", "3308")
 MYSQL_DATABASE = os.getenv("MYSQL_DATABASE", "lab5")
 
-SQLALCHEMY_DATABASE_URI = (
+# DATABASE_URL дозволяє підключити іншу БД (наприклад, SQLite для бенчмарків)
+SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL") or (
     f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}"
     f"@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}"
 )
-SQLALCHEMY_TRACK_MODIFICATIONS = False
\ No newline at end of file
+SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+# ASGI-режим (asgi.py): той самий сервер БД через асинхронний драйвер
+ASYNC_DATABASE_URI = os.getenv("ASYNC_DATABASE_URL") or (
+    SQLALCHEMY_DATABASE_URI
+    .replace("mysql+pymysql://", "mysql+aiomysql://", 1)
+    .replace("sqlite://", "sqlite+aiosqlite://", 1)
+)
+
+# Пул зʼєднань. Пул створюється в кожному процесі-воркері окремо, тому
+# загальна кількість зʼєднань = WEB_CONCURRENCY * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+# і має бути меншою за max_connections MySQL. За замовчуванням розмір пулу
+# дорівнює кількості потоків воркера.
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+WORKER_THREADS = int(os.getenv("WORKER_THREADS", "5"))
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", str(WORKER_THREADS)))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+# Менше за wait_timeout MySQL, щоб сервер не закривав зʼєднання, що простоюють у пулі
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "1") == "1"
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "5"))
+DB_READ_TIMEOUT = int(os.getenv("DB_READ_TIMEOUT", "30"))
+DB_WRITE_TIMEOUT = int(os.getenv("DB_WRITE_TIMEOUT", "30"))
+
+SQLALCHEMY_ENGINE_OPTIONS = {
+    "poolclass": MeteredQueuePool,
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+    "pool_timeout": DB_POOL_TIMEOUT,
+}
+if SQLALCHEMY_DATABASE_URI.startswith("mysql+pymysql"):
+    SQLALCHEMY_ENGINE_OPTIONS["connect_args"] = {
+        "connect_timeout": DB_CONNECT_TIMEOUT,
+        "read_timeout": DB_READ_TIMEOUT,
+        "write_timeout": DB_WRITE_TIMEOUT,
+    }
+
+# Репліки для читання: DB_REPLICA_URLS — URL через кому, біндинги replica_0, replica_1, ...
+# з тими самими параметрами пулу (пул на кожну репліку). GET/HEAD читають з
+# репліки, що пройшла перевірку (кожні DB_REPLICA_CHECK_INTERVAL с, відставання
+# не більше DB_REPLICA_MAX_LAG с). Клієнт, що записував, наступні
+# DB_PRIMARY_PIN_SECONDS с читає з primary; значення має перевищувати
+# DB_REPLICA_MAX_LAG + DB_REPLICA_CHECK_INTERVAL.
+DB_REPLICA_URLS = [url.strip() for url in os.getenv("DB_REPLICA_URLS", "").split(",") if url.strip()]
+DB_REPLICA_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_CHECK_INTERVAL", "2"))
+DB_REPLICA_MAX_LAG = float(os.getenv("DB_REPLICA_MAX_LAG", "3"))
+DB_PRIMARY_PIN_SECONDS = float(os.getenv("DB_PRIMARY_PIN_SECONDS", "5"))
+REPLICA_BINDS = {f"replica_{i}": url for i, url in enumerate(DB_REPLICA_URLS)}
+SQLALCHEMY_BINDS = dict(REPLICA_BINDS)
+
+# ETag/Last-Modified: версії таблиць читаються з журналу змін (Change) не
+# частіше ніж раз на CONDITIONAL_VERSION_TTL с на воркер; запис через інший
+# воркер стає видимим для If-None-Match не пізніше ніж через цей час
+CONDITIONAL_VERSION_TTL = float(os.getenv("CONDITIONAL_VERSION_TTL", "1"))
+
+# Пагінація списків: розмір сторінки за замовчуванням та жорстка межа
+PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", "100"))
+PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", "1000"))
+
+# Кількість рядків, що вибираються з курсора за раз у потоковому режимі
+STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", "1000"))
+
+# Пошук (/search): мінімальна довжина слова запиту (= innodb_ft_min_token_size
+# MySQL, коротші слова не індексуються) і глибина результатів для пагінації
+SEARCH_MIN_WORD_LENGTH = int(os.getenv("SEARCH_MIN_WORD_LENGTH", "3"))
+SEARCH_MAX_RESULTS = int(os.getenv("SEARCH_MAX_RESULTS", "1000"))
+
+# Журнал змін (/changes): пропуск у послідовності id, за яким рядки молодші
+# за CHANGE_FEED_SETTLE_SECONDS с, вважається незавершеною транзакцією —
+# сторінка зупиняється перед ним. Має перевищувати тривалість транзакцій запису
+CHANGE_FEED_SETTLE_SECONDS = int(os.getenv("CHANGE_FEED_SETTLE_SECONDS", "5"))
+
+# Push-сповіщення про зміни задач і артефактів (Server-Sent Events,
+# /teams/<id>/stream, /projects/<id>/stream): клієнт, що не встигає прочитати
+# PUSH_QUEUE_SIZE повідомлень, відключається; коментар-heartbeat кожні
+# PUSH_HEARTBEAT с тримає зʼєднання крізь проксі; PUSH_RETRY_MS — затримка
+# перепідключення браузера. Не більше PUSH_MAX_SUBSCRIBERS підписників на
+# процес (у WSGI-режимі кожен займає потік воркера), понад межу — 503
+PUSH_QUEUE_SIZE = int(os.getenv("PUSH_QUEUE_SIZE", "1000"))
+PUSH_HEARTBEAT = float(os.getenv("PUSH_HEARTBEAT", "15"))
+PUSH_RETRY_MS = int(os.getenv("PUSH_RETRY_MS", "3000"))
+PUSH_MAX_SUBSCRIBERS = int(os.getenv("PUSH_MAX_SUBSCRIBERS", "1000"))
+
+# Максимальна кількість елементів у масовому запиті (/tasks:batch, ...)
+BATCH_SIZE_MAX = int(os.getenv("BATCH_SIZE_MAX", "1000"))
+
+# Запис подій (Event): "sync" — одразу в транзакції запиту,
+# "enqueue" — відповідь 202 після постановки в чергу,
+# "flush" — відповідь 201 після запису партії в БД
+EVENT_INGEST_MODE = os.getenv("EVENT_INGEST_MODE", "sync")
+EVENT_INGEST_BATCH_SIZE = int(os.getenv("EVENT_INGEST_BATCH_SIZE", "500"))
+EVENT_INGEST_INTERVAL = float(os.getenv("EVENT_INGEST_INTERVAL", "0.05"))
+EVENT_INGEST_QUEUE_SIZE = int(os.getenv("EVENT_INGEST_QUEUE_SIZE", "100000"))
+EVENT_INGEST_ACK_TIMEOUT = float(os.getenv("EVENT_INGEST_ACK_TIMEOUT", "5"))
+
+# Інструментування: заголовок Server-Timing у відповідях та журнал SQL-запитів,
+# довших за SLOW_QUERY_MS мілісекунд (0 — вимкнено)
+SERVER_TIMING = os.getenv("SERVER_TIMING", "1") == "1"
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "0"))
+
+# Кеш прав ролей (/roles/<id>/permissions): записи через API скидають його
+# в процесі, що записував; інші воркери бачать зміну прав (зокрема
+# відкликання дії) не пізніше ніж через PERMISSION_CACHE_TTL с (0 — без кешу)
+PERMISSION_CACHE_TTL = float(os.getenv("PERMISSION_CACHE_TTL", "5"))
+
+# Кеш окремих записів (GET /projects/<id>, /teams/<id>, /users/<id>, /roles/<id>,
+# /tasks/<id>): LRU у памʼяті процесу на ENTITY_CACHE_SIZE записів (0 — вимкнено)
+# з TTL ENTITY_CACHE_TTL с і, якщо задано ENTITY_CACHE_URL (redis://...), спільний
+# кеш для всіх воркерів з TTL ENTITY_CACHE_SHARED_TTL с. Запис видаляє ключі в
+# процесі, що записував, а в спільному кеші на ENTITY_CACHE_TOMBSTONE_TTL с
+# ставить позначку, яку не перезапише рядок, прочитаний до запису (має
+# перевищувати найдовше читання рядка); локальні копії інших воркерів
+# застарівають не довше ніж на ENTITY_CACHE_TTL.
+ENTITY_CACHE_SIZE = int(os.getenv("ENTITY_CACHE_SIZE", "10000"))
+ENTITY_CACHE_TTL = float(os.getenv("ENTITY_CACHE_TTL", "5"))
+ENTITY_CACHE_URL = os.getenv("ENTITY_CACHE_URL", "")
+ENTITY_CACHE_SHARED_TTL = int(os.getenv("ENTITY_CACHE_SHARED_TTL", "300"))
+ENTITY_CACHE_TOMBSTONE_TTL = int(os.getenv("ENTITY_CACHE_TOMBSTONE_TTL", "5"))
@@ -0,0 +1,154 @@
+import threading
+import time
+from collections import OrderedDict
+
+from integrity import cascade_rows
+from serializer import dumps, loads
+
+RESULTS = ("local_hits", "shared_hits", "misses", "invalidations", "shared_errors")
+# Значення ключа у спільному кеші після інвалідації; dumps() такого не повертає
+TOMBSTONE = b"~"
+
+
+def connect(url, timeout=0.05):
+    # Спільний рівень — Redis або сумісний сервер; пакет redis потрібен лише з ENTITY_CACHE_URL
+    import redis
+    return redis.Redis.from_url(url, socket_timeout=timeout, socket_connect_timeout=timeout)
+
+
+class EntityCache:
+    # Кеш серіалізованих записів за (таблиця, первинний ключ) у два рівні:
+    # LRU у памʼяті процесу з TTL і необовʼязковий спільний кеш для всіх
+    # воркерів — будь-який клієнт з інтерфейсом Redis (get, set(ex=), delete),
+    # наприклад redis.Redis або fakeredis.FakeRedis у тестах.
+    # Запис у процесі видаляє ключ з локального рівня, а у спільному на
+    # tombstone_ttl секунд заміняє його позначкою TOMBSTONE; локальні копії
+    # інших воркерів живуть не довше за ttl. Лічильник поколінь, як у
+    # PermissionCache, не дає зберегти рядок, прочитаний до інвалідації в
+    # цьому процесі, а спільний рівень заповнюється лише за відсутності ключа
+    # (SET NX): рядок, прочитаний до запису в іншому воркері, не перезапише
+    # позначку. tombstone_ttl має перевищувати найдовше читання рядка з БД.
+    # Помилки спільного кешу рахуються і трактуються як промах.
+    def __init__(self, size, ttl, shared=None, shared_ttl=300, tombstone_ttl=5, prefix="entity"):
+        self.size = size
+        self.ttl = ttl
+        self.shared = shared
+        self.shared_ttl = shared_ttl
+        self.tombstone_ttl = tombstone_ttl
+        self.prefix = prefix
+        self.entries = OrderedDict()
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.stats = {}
+
+    def count(self, table, result, n=1):
+        stats = self.stats.setdefault(table, dict.fromkeys(RESULTS, 0))
+        stats[result] += n
+
+    def get(self, table, key, loader):
+        # Повертає dict запису (не змінювати) або None, якщо loader() його не знайшов
+        name = f"{table}:{key}"
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is not None and entry[0] > time.monotonic():
+                self.entries.move_to_end(name)
+                self.count(table, "local_hits")
+                return entry[1]
+            generation = self.generation
+
+        value = self.shared_get(table, name)
+        if value is not None:
+            with self.lock:
+                self.count(table, "shared_hits")
+        else:
+            with self.lock:
+                self.count(table, "misses")
+            value = loader()
+            if value is None:
+                return None
+            if generation == self.generation:
+                self.shared_set(table, name, value)
+
+        with self.lock:
+            if generation == self.generation and self.size:
+                self.entries[name] = (time.monotonic() + self.ttl, value)
+                self.entries.move_to_end(name)
+                while len(self.entries) > self.size:
+                    self.entries.popitem(last=False)
+        return value
+
+    def shared_get(self, table, name):
+        if self.shared is None:
+            return None
+        try:
+            raw = self.shared.get(f"{self.prefix}:{name}")
+        except Exception:
+            with self.lock:
+                self.count(table, "shared_errors")
+            return None
+        return None if raw is None or raw == TOMBSTONE else loads(raw)
+
+    def shared_set(self, table, name, value):
+        if self.shared is None:
+            return
+        try:
+            self.shared.set(f"{self.prefix}:{name}", dumps(value), ex=self.shared_ttl, nx=True)
+        except Exception:
+            with self.lock:
+                self.count(table, "shared_errors")
+
+    def invalidate(self, keys):
+        # keys: [(таблиця, первинний ключ)]; викликати після commit
+        keys = list(keys)
+        names = [f"{table}:{key}" for table, key in keys]
+        if not names:
+            return
+        with self.lock:
+            self.generation += 1
+            for (table, _), name in zip(keys, names):
+                self.entries.pop(name, None)
+                self.count(table, "invalidations")
+        if self.shared is not None:
+            try:
+                # Pipeline (redis.Redis) — один обмін з сервером на всі ключі
+                pipe = self.shared.pipeline(transaction=False) if hasattr(self.shared, "pipeline") else self.shared
+                for name in names:
+                    pipe.set(f"{self.prefix}:{name}", TOMBSTONE, ex=self.tombstone_ttl)
+                if pipe is not self.shared:
+                    pipe.execute()
+            except Exception:
+                with self.lock:
+                    for table, _ in keys:
+                        self.count(table, "shared_errors")
+
+    def clear(self):
+        # Лише локальний рівень
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+
+    def metrics(self):
+        with self.lock:
+            return {
+                "size": len(self.entries),
+                "shared": self.shared is not None,
+                "models": {table: dict(stats) for table, stats in sorted(self.stats.items())}
+            }
+
+    def exposition(self):
+        lines = ["# TYPE entity_cache_requests_total counter"]
+        metrics = self.metrics()
+        for table, stats in metrics["models"].items():
+            for result in RESULTS:
+                lines.append(f'entity_cache_requests_total{{model="{table}",result="{result}"}} {stats[result]}')
+        lines.append(f"entity_cache_size {metrics['size']}")
+        return lines
+
+
+def cascade_keys(session, table, ids, cached):
+    # Ключі кешу, яких торкнеться DELETE рядків ids з table: самі рядки і
+    # дочірні рядки з ON DELETE CASCADE / SET NULL. Викликати до DELETE
+    ids = list(ids)
+    keys = {(table.name, key) for key in ids} if table.name in cached else set()
+    keys.update((name, key) for name, key, _ in cascade_rows(session, table, ids, cached))
+    return keys
@@ -0,0 +1,74 @@
+from flask import request, abort
+from sqlalchemy.orm import selectinload
+
+# Найбільша глибина шляху ?expand=teams.users.events
+MAX_DEPTH = 3
+
+
+class Expander:
+    # Вкладені звʼязки у відповіді: ?expand=teams.users,teams.tasks,roles.
+    # serializers: {Model: Serializer}, relations: {Model: (назви relationship)}.
+    # Кожен рівень кожного звʼязку завантажується одним SELECT ... WHERE fk IN (...)
+    # (selectinload), тож кількість запитів залежить від ?expand, а не від
+    # кількості рядків.
+    def __init__(self, serializers, relations):
+        self.serializers = serializers
+        self.relations = relations
+
+    def parse(self, model):
+        # "teams.users,teams.tasks,roles" -> {"teams": {"users": {}, "tasks": {}}, "roles": {}}
+        tree = {}
+        raw = request.args.get("expand", "")
+        for path in filter(None, (p.strip() for p in raw.split(","))):
+            names = path.split(".")
+            if len(names) > MAX_DEPTH:
+                abort(400, description=f"Expansion '{path}' is too deep")
+            current, node = model, tree
+            for name in names:
+                if name not in self.relations.get(current, ()):
+                    abort(400, description=f"Expansion '{path}' is not supported")
+                current = getattr(current, name).property.mapper.class_
+                node = node.setdefault(name, {})
+        return tree
+
+    def options(self, model, tree):
+        loaders = []
+        for name, subtree in tree.items():
+            attr = getattr(model, name)
+            loader = selectinload(attr)
+            children = self.options(attr.property.mapper.class_, subtree)
+            loaders.append(loader.options(*children) if children else loader)
+        return loaders
+
+    def tables(self, model, tree):
+        names = {model.__tablename__}
+        for name, subtree in tree.items():
+            names |= self.tables(getattr(model, name).property.mapper.class_, subtree)
+        return names
+
+    def request_tables(self, model):
+        # Для ETag: таблиці, з яких складається відповідь на поточний запит
+        return lambda: tuple(sorted(self.tables(model, self.parse(model))))
+
+    def serialize(self, obj, tree, fields=None):
+        # fields (?fields=) обмежує лише поля верхнього рівня
+        data = self.serializers[type(obj)](obj, fields)
+        for name, subtree in tree.items():
+            value = getattr(obj, name)
+            if value is None:
+                data[name] = None
+            elif isinstance(value, list):
+                data[name] = [self.serialize(item, subtree) for item in value]
+            else:
+                data[name] = self.serialize(value, subtree)
+        return data
+
+    def query(self, query, model):
+        # -> (query, функція серіалізації). Без ?expand= читаються лише
+        # колонки з ?fields= (проєкція), інакше — ORM-обʼєкти зі звʼязками.
+        tree = self.parse(model)
+        serializer = self.serializers[model]
+        fields = serializer.selected()
+        if not tree:
+            return serializer.project(query, fields)
+        return query.options(*self.options(model, tree)), lambda obj: self.serialize(obj, tree, fields)
@@ -0,0 +1,68 @@
+from datetime import datetime
+
+from flask import request, abort
+
+# Допустимі оператори для колонки: ?team_id=3, ?team_id__in=1,2,
+# ?deadlineDate__lt=2025-06-10T00:00:00
+EQ = ("eq", "in")
+RANGE = ("eq", "lt", "lte", "gt", "gte")
+
+OPERATORS = {
+    "eq":  lambda column, value: column == value,
+    "in":  lambda column, value: column.in_(value),
+    "lt":  lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "gt":  lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+}
+
+# Параметри, які не є фільтрами
+RESERVED = {"after", "limit", "sort", "stream", "expand", "fields"}
+
+
+def coerce_value(column, raw):
+    # Приведення рядка/JSON-значення до типу колонки; ValueError, якщо неможливо
+    python_type = column.type.python_type
+    if raw is None or isinstance(raw, python_type):
+        return raw
+    if python_type is datetime:
+        return datetime.fromisoformat(raw)
+    return python_type(raw)
+
+
+def parse_value(column, raw):
+    try:
+        return coerce_value(column, raw)
+    except (ValueError, TypeError):
+        abort(400, description=f"Invalid value for '{column.key}'")
+
+
+def apply_filters(query, model, allowed):
+    # allowed: {назва колонки: оператори}; дозволяються лише колонки,
+    # що мають індекс у database.sql
+    for name, raw in request.args.items(multi=True):
+        if name in RESERVED:
+            continue
+        field, _, op = name.partition("__")
+        op = op or "eq"
+        if op not in allowed.get(field, ()):
+            abort(400, description=f"Filter '{name}' is not supported")
+        column = getattr(model, field)
+        if op == "in":
+            value = [parse_value(column, v) for v in raw.split(",")]
+        else:
+            value = parse_value(column, raw)
+        query = query.filter(OPERATORS[op](column, value))
+    return query
+
+
+def parse_sort(model, key, allowed):
+    # ?sort=startDate або ?sort=-startDate; первинний ключ дозволений завжди
+    raw = request.args.get("sort", "").strip()
+    if not raw:
+        return None
+    desc = raw.startswith("-")
+    field = raw.lstrip("+-")
+    if field != key.key and field not in allowed:
+        abort(400, description=f"Sorting by '{field}' is not supported")
+    return getattr(model, field), desc
@@ -0,0 +1,26 @@
+import re
+
+from sqlalchemy import and_, case, literal, or_
+from sqlalchemy.dialects.mysql import match
+
+WORD = re.compile(r"\w+")
+
+
+def query_terms(q, min_length):
+    # Слова запиту без операторів булевого режиму MySQL (+ - * " ( ) ~ < > @).
+    # Слова, коротші за innodb_ft_min_token_size, не потрапляють в індекс
+    return list(dict.fromkeys(w.lower() for w in WORD.findall(q) if len(w) >= min_length))
+
+
+def relevance(columns, terms, dialect):
+    # -> (оцінка релевантності, умова WHERE): усі слова обовʼязкові, кожне —
+    # як префікс. MySQL: MATCH ... AGAINST у булевому режимі за FULLTEXT-індексом
+    # з тими самими колонками. Інші БД (SQLite для розробки): LIKE по кожній
+    # колонці, оцінка — кількість збігів слово/колонка
+    if dialect == "mysql":
+        score = match(*columns, against=" ".join(f"+{t}*" for t in terms)).in_boolean_mode()
+        return score, score
+    hits = [column.icontains(t, autoescape=True) for t in terms for column in columns]
+    score = sum((case((hit, 1), else_=0) for hit in hits), literal(0))
+    condition = and_(*(or_(*(column.icontains(t, autoescape=True) for column in columns)) for t in terms))
+    return score, condition
@@ -0,0 +1,118 @@
+import queue
+import threading
+
+from serializer import dumps
+
+# Повідомлення, що завершує підписку: клієнт не встигав читати
+CLOSED = b""
+HEARTBEAT = b": keepalive\n\n"
+
+
+def sse_message(event, data):
+    # Кадр Server-Sent Events; кодується один раз для всіх підписників
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+
+def sse_retry(milliseconds):
+    # Затримка перепідключення EventSource після розриву
+    return f"retry: {int(milliseconds)}\n\n".encode()
+
+
+class Subscription:
+    # Черга повідомлень одного клієнта (тем topics). Клієнт, у черзі якого
+    # накопичилось size непрочитаних повідомлень, відключається (отримує
+    # CLOSED): після перепідключення він дочитує пропущене з /changes, а
+    # публікація не чекає на нього і не тримає памʼять без меж.
+    def __init__(self, topics, size):
+        self.topics = frozenset(topics)
+        self.size = size
+        self.closed = False
+        self.queue = queue.Queue()
+
+    def push(self, message):
+        self.queue.put_nowait(message)
+
+    def backlog(self):
+        return self.queue.qsize()
+
+    def put(self, message):
+        # -> False, якщо підписку закрито
+        if self.closed:
+            return False
+        if self.backlog() >= self.size:
+            self.close()
+            return False
+        self.push(message)
+        return True
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.push(CLOSED)
+
+    def get(self, timeout):
+        # Повідомлення або None, якщо за timeout секунд нічого не надійшло
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class Hub:
+    # Розсилка повідомлень підписникам у памʼяті процесу. Тема — кортеж,
+    # наприклад ("team", 3). publish() лише кладе готовий кадр у черги
+    # підписників, тож запис не чекає на мережу клієнтів.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.topics = {}
+        self.subscriptions = set()
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    @property
+    def active(self):
+        return bool(self.subscriptions)
+
+    @property
+    def subscribers(self):
+        return len(self.subscriptions)
+
+    def subscribe(self, subscription):
+        with self.lock:
+            for topic in subscription.topics:
+                self.topics.setdefault(topic, set()).add(subscription)
+            self.subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        subscription.closed = True
+        with self.lock:
+            if subscription not in self.subscriptions:
+                return
+            self.subscriptions.discard(subscription)
+            for topic in subscription.topics:
+                subscribers = self.topics[topic]
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self.topics[topic]
+
+    def publish(self, topics, message):
+        # Підписник кількох тем отримує повідомлення один раз
+        with self.lock:
+            targets = set().union(*(self.topics.get(topic, ()) for topic in topics))
+            delivered = sum(subscription.put(message) for subscription in targets)
+            self.published += 1
+            self.delivered += delivered
+            self.dropped += len(targets) - delivered
+        return delivered
+
+    def metrics(self):
+        with self.lock:
+            return {
+                "subscribers": len(self.subscriptions),
+                "topics": len(self.topics),
+                "published": self.published,
+                "delivered": self.delivered,
+                "dropped": self.dropped
+            }
@@ -0,0 +1,141 @@
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from batch import insert_ids
+
+
+class BatchIngestor:
+    # Черга подій у памʼяті процесу: фоновий потік забирає події партіями
+    # (до batch_size штук або через interval секунд після першої) і записує
+    # їх одним багаторядковим INSERT. Кожна подія отримує Future, який
+    # завершується після запису — це дозволяє відповідати клієнту як після
+    # постановки в чергу, так і після фактичного запису.
+    def __init__(self, app, table, batch_size, interval, max_queue):
+        self.app = app
+        self.table = table
+        self.batch_size = batch_size
+        self.interval = interval
+        self.queue = queue.Queue(max_queue)
+        self.lock = threading.Lock()
+        self.thread = None
+
+        self.enqueued = 0
+        self.flushed = 0
+        self.rejected = 0
+        self.batches = 0
+        self.flush_seconds_total = 0.0
+        self.flush_seconds_last = 0.0
+        self.flush_seconds_max = 0.0
+
+    def start(self):
+        with self.lock:
+            if self.thread is None:
+                atexit.register(self.drain)
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name="event-ingest", daemon=True)
+                self.thread.start()
+
+    def submit(self, row):
+        # queue.Full, якщо черга переповнена
+        self.start()
+        future = Future()
+        self.queue.put_nowait((row, future))
+        with self.lock:
+            self.enqueued += 1
+        return future
+
+    def run(self):
+        while True:
+            self.flush(self.collect())
+
+    def collect(self):
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + self.interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def drain(self):
+        batch = []
+        while True:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+            if len(batch) == self.batch_size:
+                self.flush(batch)
+                batch = []
+        if batch:
+            self.flush(batch)
+
+    def flush(self, batch):
+        started = time.perf_counter()
+        with self.app.app_context():
+            engine = current_app.extensions["sqlalchemy"].engine
+            try:
+                with engine.begin() as conn:
+                    ids = insert_ids(conn, engine.dialect, self.table, [row for row, _ in batch])
+                    results = self.stored(conn, ids)
+            except IntegrityError:
+                # Одна подія з неіснуючим user_id/role_id не повинна
+                # відкидати всю партію: повторюємо записи поодинці
+                results = [self.insert_one(engine, row) for row, _ in batch]
+            except Exception as e:
+                current_app.logger.exception("Event batch flush failed")
+                results = [e] * len(batch)
+
+        elapsed = time.perf_counter() - started
+        failed = sum(1 for r in results if isinstance(r, Exception))
+        with self.lock:
+            self.batches += 1
+            self.flushed += len(batch) - failed
+            self.rejected += failed
+            self.flush_seconds_total += elapsed
+            self.flush_seconds_last = elapsed
+            self.flush_seconds_max = max(self.flush_seconds_max, elapsed)
+
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stored(self, conn, ids):
+        # Збережені рядки (зі значеннями за замовчуванням БД) у порядку ids
+        rows = conn.execute(select(self.table).where(self.table.c.id.in_(ids)))
+        by_id = {row.id: row for row in rows}
+        return [by_id[key] for key in ids]
+
+    def insert_one(self, engine, row):
+        try:
+            with engine.begin() as conn:
+                ids = insert_ids(conn, engine.dialect, self.table, [row])
+                return self.stored(conn, ids)[0]
+        except IntegrityError as e:
+            return e
+
+    def metrics(self):
+        with self.lock:
+            return {
+                "mode": self.app.config["EVENT_INGEST_MODE"],
+                "queue_depth": self.queue.qsize(),
+                "enqueued": self.enqueued,
+                "flushed": self.flushed,
+                "rejected": self.rejected,
+                "batches": self.batches,
+                "flush_ms_last": round(self.flush_seconds_last * 1000, 3),
+                "flush_ms_avg": round(self.flush_seconds_total * 1000 / self.batches, 3) if self.batches else 0.0,
+                "flush_ms_max": round(self.flush_seconds_max * 1000, 3)
+            }
@@ -0,0 +1,123 @@
+import threading
+import time
+
+from flask import g, request, has_app_context
+from sqlalchemy import event
+
+# Межі гістограми тривалості запитів, с
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class RequestMetrics:
+    # Лічильники по ендпоінтах у памʼяті процесу для /metrics (формат Prometheus)
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = {}
+        self.endpoints = {}
+
+    def observe(self, endpoint, method, status, seconds, sql):
+        with self.lock:
+            key = (endpoint, method, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            stats = self.endpoints.setdefault(endpoint, {
+                "buckets": [0] * len(BUCKETS),
+                "count": 0,
+                "seconds": 0.0,
+                "queries": 0,
+                "db_seconds": 0.0,
+                "serialize_seconds": 0.0
+            })
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    stats["buckets"][i] += 1
+            stats["count"] += 1
+            stats["seconds"] += seconds
+            stats["queries"] += sql["count"]
+            stats["db_seconds"] += sql["seconds"]
+            stats["serialize_seconds"] += sql["serialize"]
+
+    def exposition(self):
+        lines = [
+            "# TYPE http_requests_total counter",
+        ]
+        with self.lock:
+            for (endpoint, method, status), count in sorted(self.requests.items()):
+                lines.append(f'http_requests_total{{endpoint="{endpoint}",method="{method}",status="{status}"}} {count}')
+
+            lines.append("# TYPE http_request_duration_seconds histogram")
+            for endpoint, stats in sorted(self.endpoints.items()):
+                label = f'endpoint="{endpoint}"'
+                for bound, count in zip(BUCKETS, stats["buckets"]):
+                    lines.append(f'http_request_duration_seconds_bucket{{{label},le="{bound}"}} {count}')
+                lines.append(f'http_request_duration_seconds_bucket{{{label},le="+Inf"}} {stats["count"]}')
+                lines.append(f'http_request_duration_seconds_sum{{{label}}} {stats["seconds"]:.6f}')
+                lines.append(f'http_request_duration_seconds_count{{{label}}} {stats["count"]}')
+
+            for name, field, kind in (
+                ("db_queries_total", "queries", "counter"),
+                ("db_query_duration_seconds_total", "db_seconds", "counter"),
+                ("serialization_duration_seconds_total", "serialize_seconds", "counter"),
+            ):
+                lines.append(f"# TYPE {name} {kind}")
+                for endpoint, stats in sorted(self.endpoints.items()):
+                    value = stats[field]
+                    value = f"{value:.6f}" if isinstance(value, float) else value
+                    lines.append(f'{name}{{endpoint="{endpoint}"}} {value}')
+        return lines
+
+
+def current_sql():
+    # Статистика SQL поточного запиту або None (фонові потоки, CLI)
+    return g.get("sql") if has_app_context() else None
+
+
+def record_serialization(seconds):
+    sql = current_sql()
+    if sql is not None:
+        sql["serialize"] += seconds
+
+
+def init_instrumentation(app, engines, metrics, slow_query_ms=0, server_timing=True):
+    # Кількість і сумарний час SQL-запитів на HTTP-запит, найповільніший
+    # запит і час кодування JSON: заголовок Server-Timing і /metrics.
+    # slow_query_ms > 0 — запити, довші за межу, пишуться в лог.
+    # engines — primary і репліки: запити до всіх рахуються разом.
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        if slow_query_ms and elapsed * 1000 >= slow_query_ms:
+            app.logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, statement)
+        sql = current_sql()
+        if sql is None:
+            return
+        sql["count"] += 1
+        sql["seconds"] += elapsed
+        if elapsed > sql["slowest"]:
+            sql["slowest"] = elapsed
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    @app.before_request
+    def _start_request():
+        g.started = time.perf_counter()
+        g.sql = {"count": 0, "seconds": 0.0, "slowest": 0.0, "serialize": 0.0}
+
+    @app.after_request
+    def _finish_request(response):
+        sql = g.pop("sql", None)
+        if sql is None:
+            return response
+        elapsed = time.perf_counter() - g.pop("started")
+        metrics.observe(request.endpoint or "unknown", request.method, response.status_code, elapsed, sql)
+        if server_timing:
+            response.headers["Server-Timing"] = ", ".join((
+                f'db;dur={sql["seconds"] * 1000:.2f};desc="{sql["count"]} queries"',
+                f'db-slowest;dur={sql["slowest"] * 1000:.2f}',
+                f'serialize;dur={sql["serialize"] * 1000:.2f}',
+                f'app;dur={elapsed * 1000:.2f}'
+            ))
+        return response
@@ -0,0 +1,86 @@
+import re
+from contextlib import contextmanager
+
+from flask import abort
+from sqlalchemy import event, exists, select
+from sqlalchemy.exc import IntegrityError
+
+# MySQL: "... FOREIGN KEY (`team_id`) REFERENCES `Team` (`id`) ..."
+FK_REFERENCE = re.compile(r"REFERENCES `(\w+)`")
+# MySQL: "Duplicate entry 'x' for key 'User.email'", SQLite: "UNIQUE constraint failed: User.email"
+UNIQUE_KEY = re.compile(r"for key '(?:\w+\.)?(\w+)'|UNIQUE constraint failed: \w+\.(\w+)")
+
+
+def _sqlite_foreign_keys(dbapi_connection, connection_record):
+    dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+
+def enforce_foreign_keys(engine):
+    # Ресурси не перевіряють батьківські рядки перед записом, а покладаються
+    # на FOREIGN KEY. SQLite перевіряє їх (і виконує ON DELETE CASCADE /
+    # SET NULL) лише після PRAGMA foreign_keys=ON на кожному зʼєднанні
+    if engine.dialect.name == "sqlite" and not event.contains(engine, "connect", _sqlite_foreign_keys):
+        event.listen(engine, "connect", _sqlite_foreign_keys)
+
+
+def missing_reference(session, refs):
+    # Перевірка всіх посилань одним SELECT EXISTS(...), EXISTS(...), ...
+    refs = [(model, value) for model, value in refs if value is not None]
+    if not refs:
+        return None
+    found = session.query(*[exists().where(model.id == value) for model, value in refs]).one()
+    for (model, _), ok in zip(refs, found):
+        if not ok:
+            return model
+    return None
+
+
+@contextmanager
+def constraint_errors(session, refs=(), conflicts=None):
+    # Зовнішні ключі та UNIQUE перевіряє сама БД: на успішному шляху
+    # це лише INSERT/UPDATE. Порушення обмежень перетворюються на 404/409.
+    # refs: [(Model, id)], conflicts: {колонка: повідомлення для 409}
+    try:
+        yield
+    except IntegrityError as e:
+        session.rollback()
+        message = str(e.orig)
+
+        if "foreign key" in message.lower():
+            match = FK_REFERENCE.search(message)
+            if match:
+                abort(404, description=f"{match.group(1)} not found")
+            model = missing_reference(session, refs)
+            if model is not None:
+                abort(404, description=f"{model.__name__} not found")
+
+        match = UNIQUE_KEY.search(message)
+        if match and conflicts:
+            column = match.group(1) or match.group(2)
+            abort(409, description=conflicts.get(column, next(iter(conflicts.values()))))
+        raise
+
+
+def commit_or_abort(session, refs=(), conflicts=None):
+    with constraint_errors(session, refs, conflicts):
+        session.commit()
+
+
+def cascade_rows(session, table, ids, tables):
+    # (таблиця, id, правило) для рядків, які DELETE рядків ids з table змінить
+    # через ON DELETE CASCADE / SET NULL (транзитивно), — лише таблиці з tables.
+    # Викликати до DELETE; по одному SELECT на кожну таблицю з tables
+    pending = [(table, list(ids))]
+    while pending:
+        parent, parent_ids = pending.pop()
+        for child in parent.metadata.tables.values():
+            for fk in child.foreign_keys:
+                rule = (fk.ondelete or "").upper()
+                if fk.column.table is not parent or rule not in ("CASCADE", "SET NULL"):
+                    continue
+                child_ids = select(child.c.id).where(fk.parent.in_(parent_ids))
+                if child.name in tables:
+                    for key in session.execute(child_ids).scalars():
+                        yield child.name, key, rule
+                if rule == "CASCADE":
+                    pending.append((child, child_ids))
@@ -0,0 +1,264 @@
+"""Версійні міграції схеми БД (src/sql/migrations/NNNN_назва.sql).
+
+    python migrate.py status
+    python migrate.py check [--no-db]
+    python migrate.py up [--dry-run] [--allow-copy]
+    python migrate.py diff
+    python migrate.py stamp [VERSION ...]
+
+Джерело істини — src/sql/database.sql: check порівнює з ним моделі
+(api.models) і фактичну схему БД та перевіряє, що скрипт уже містить усі
+міграції. up по черзі застосовує файли, яких ще немає в `schema_migrations`.
+ALTER TABLE виконується як онлайн-DDL MySQL (ALGORITHM=INPLACE, LOCK=NONE):
+читання й запис у таблицю тривають під час побудови індексу, а хід
+операції виводиться з performance_schema. Якщо зміну не можна виконати
+без копіювання таблиці, міграція зупиняється; --allow-copy дозволяє
+ALGORITHM=COPY, LOCK=SHARED (запис у таблицю блокується).
+"""
+import argparse
+import re
+import sys
+import threading
+import time
+
+from sqlalchemy import Column, MetaData, Table, func, insert, inspect, select
+from sqlalchemy.dialects.mysql import DOUBLE, TIMESTAMP, VARCHAR
+from sqlalchemy.exc import DBAPIError
+
+from api import create_app, db
+from schema import (
+    SQL_DIR, MIGRATIONS_TABLE, alter_statements, compare, from_database, from_metadata, from_sql,
+    recorded_migrations
+)
+
+MIGRATIONS_DIR = SQL_DIR / "migrations"
+# ER_ALTER_OPERATION_NOT_SUPPORTED(_REASON): ALGORITHM/LOCK не підтримуються для цієї зміни
+NOT_ONLINE = (1845, 1846)
+
+migrations = Table(
+    MIGRATIONS_TABLE, MetaData(),
+    Column("version", VARCHAR(255), primary_key=True),
+    Column("applied_at", TIMESTAMP, nullable=False, server_default=func.current_timestamp()),
+    Column("seconds", DOUBLE, nullable=True)
+)
+
+
+def available():
+    # [(версія, шлях)] у порядку номерів
+    return [(path.stem, path) for path in sorted(MIGRATIONS_DIR.glob("[0-9]*.sql"))]
+
+
+def applied(conn):
+    if not inspect(conn).has_table(MIGRATIONS_TABLE):
+        return {}
+    return dict(conn.execute(select(migrations.c.version, migrations.c.applied_at)).all())
+
+
+def stamp(conn, versions, seconds=None):
+    migrations.create(conn, checkfirst=True)
+    done = applied(conn)
+    for version in versions:
+        if version not in done:
+            conn.execute(insert(migrations).values(version=version, seconds=seconds))
+    conn.commit()
+
+
+def statements(sql):
+    lines = [line for line in sql.splitlines() if not line.lstrip().startswith("--")]
+    return [s.strip() for s in re.split(r";\s*$", "\n".join(lines), flags=re.M) if s.strip()]
+
+
+def online(statement, algorithm="INPLACE", lock="NONE"):
+    # ALTER TABLE / CREATE INDEX / DROP INDEX без явного ALGORITHM — онлайн
+    if "ALGORITHM" in statement.upper():
+        return statement
+    if re.match(r"ALTER\s+TABLE", statement, re.I):
+        return f"{statement},\n  ALGORITHM={algorithm}, LOCK={lock}"
+    if re.match(r"(CREATE\s+(UNIQUE\s+)?INDEX|DROP\s+INDEX)", statement, re.I):
+        return f"{statement} ALGORITHM={algorithm} LOCK={lock}"
+    return statement
+
+
+def enable_progress(conn):
+    # Стадії InnoDB ALTER з WORK_COMPLETED/WORK_ESTIMATED; потрібне право UPDATE на performance_schema
+    try:
+        conn.exec_driver_sql(
+            "UPDATE performance_schema.setup_instruments SET ENABLED = 'YES', TIMED = 'YES' "
+            "WHERE NAME LIKE 'stage/innodb/alter%'"
+        )
+        conn.exec_driver_sql(
+            "UPDATE performance_schema.setup_consumers SET ENABLED = 'YES' "
+            "WHERE NAME LIKE 'events_stages_%'"
+        )
+        conn.commit()
+        return True
+    except DBAPIError:
+        conn.rollback()
+        return False
+
+
+def alter_progress(conn, connection_id):
+    # -> (стадія, виконано, оцінка) для ALTER у зʼєднанні connection_id або None
+    return conn.exec_driver_sql(
+        "SELECT s.EVENT_NAME, s.WORK_COMPLETED, s.WORK_ESTIMATED "
+        "FROM performance_schema.events_stages_current s "
+        "JOIN performance_schema.threads t ON t.THREAD_ID = s.THREAD_ID "
+        "WHERE t.PROCESSLIST_ID = %s AND s.EVENT_NAME LIKE 'stage/innodb/alter%%'",
+        (connection_id,)
+    ).first()
+
+
+def execute(engine, statement, interval, lock_wait_timeout):
+    # Оператор виконується у фоновому потоці, головний потік кожні
+    # interval секунд виводить стадію та відсоток виконання
+    with engine.connect() as conn, engine.connect() as monitor:
+        connection_id = conn.exec_driver_sql("SELECT CONNECTION_ID()").scalar()
+        # Навіть онлайн-DDL ненадовго бере metadata lock: не чекати його довше
+        # за lock_wait_timeout, щоб не блокувати запити, що стали в чергу за ALTER
+        conn.exec_driver_sql(f"SET SESSION lock_wait_timeout = {int(lock_wait_timeout)}")
+        tracked = enable_progress(monitor)
+
+        errors = []
+
+        def run():
+            try:
+                conn.exec_driver_sql(statement)
+                conn.commit()
+            except DBAPIError as e:
+                errors.append(e)
+
+        started = time.perf_counter()
+        worker = threading.Thread(target=run, name="migration")
+        worker.start()
+        while True:
+            worker.join(interval)
+            if not worker.is_alive():
+                break
+            elapsed = time.perf_counter() - started
+            progress = alter_progress(monitor, connection_id) if tracked else None
+            monitor.rollback()
+            if progress and progress[2]:
+                stage, completed, estimated = progress
+                print(f"    {completed / estimated:6.1%}  {stage.rsplit('/', 1)[-1]}  {elapsed:.0f}s", flush=True)
+            else:
+                print(f"    running  {elapsed:.0f}s", flush=True)
+        if errors:
+            raise errors[0]
+        return time.perf_counter() - started
+
+
+def error_code(e):
+    args = getattr(e.orig, "args", ())
+    return args[0] if args else None
+
+
+def cmd_status(engine, args):
+    with engine.connect() as conn:
+        done = applied(conn)
+    files = dict(available())
+    for version in sorted(set(files) | set(done)):
+        if version not in files:
+            print(f"{version}  applied {done[version]:%Y-%m-%d %H:%M}  (file missing)")
+        elif version in done:
+            print(f"{version}  applied {done[version]:%Y-%m-%d %H:%M}")
+        else:
+            print(f"{version}  pending")
+
+
+def cmd_up(engine, args):
+    if engine.dialect.name != "mysql" and not args.dry_run:
+        sys.exit("up: MySQL only; create a local SQLite schema with `flask --app app init-db`")
+    with engine.connect() as conn:
+        done = applied(conn)
+    pending = [(v, p) for v, p in available() if v not in done]
+    if not pending:
+        print("Schema is up to date")
+        return
+
+    for version, path in pending:
+        print(f"{version}:")
+        total = 0.0
+        for statement in statements(path.read_text(encoding="utf-8")):
+            sql = online(statement)
+            print("  " + sql.replace("\n", "\n  ") + ";", flush=True)
+            if args.dry_run:
+                continue
+            try:
+                total += execute(engine, sql, args.progress_interval, args.lock_wait_timeout)
+            except DBAPIError as e:
+                copy = error_code(e) in NOT_ONLINE
+                if not (copy and args.allow_copy):
+                    # DDL у MySQL не транзакційний: попередні оператори файлу вже виконані
+                    hint = " Use --allow-copy to rebuild the table with ALGORITHM=COPY, LOCK=SHARED." if copy else ""
+                    sys.exit(f"{version}: {e.orig}\n"
+                             f"Stopped; earlier statements of {path.name} are already applied.{hint}")
+                sql = online(statement, "COPY", "SHARED")
+                print("  retry: " + sql.replace("\n", "\n  ") + ";", flush=True)
+                total += execute(engine, sql, args.progress_interval, args.lock_wait_timeout)
+        if not args.dry_run:
+            with engine.connect() as conn:
+                stamp(conn, [version], seconds=round(total, 3))
+            print(f"{version}: applied in {total:.1f}s")
+
+
+def cmd_check(engine, args):
+    expected = from_sql()
+    problems = [f"models: {p}" for p in compare(expected, from_metadata(db.metadata))]
+
+    recorded = set(recorded_migrations())
+    problems += [f"database.sql: migration {v} is not recorded in schema_migrations"
+                 for v, _ in available() if v not in recorded]
+
+    if not args.no_db:
+        with engine.connect() as conn:
+            actual, partitioned = from_database(conn)
+            pending = [v for v, _ in available() if v not in applied(conn)]
+        # Партиційовані таблиці (src/sql/partitioning.sql) не мають зовнішніх ключів
+        problems += [f"database: {p}" for p in compare(expected, actual, skip_foreign_keys=partitioned)]
+        if pending:
+            problems.append(f"database: pending migrations {', '.join(pending)}")
+
+    for problem in problems:
+        print(problem)
+    if problems:
+        sys.exit(1)
+    print("Schema matches database.sql")
+
+
+def cmd_diff(engine, args):
+    with engine.connect() as conn:
+        actual, _ = from_database(conn)
+    sql = alter_statements(from_sql(), actual)
+    print("\n\n".join(sql) if sql else "-- no index or column changes")
+
+
+def cmd_stamp(engine, args):
+    versions = args.versions or [v for v, _ in available()]
+    with engine.connect() as conn:
+        stamp(conn, versions)
+    print(f"Stamped {', '.join(versions)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="застосовані та очікувані міграції")
+    check = commands.add_parser("check", help="розбіжності моделей і БД з database.sql")
+    check.add_argument("--no-db", action="store_true", help="лише моделі та database.sql (без підключення)")
+    up = commands.add_parser("up", help="застосувати очікувані міграції")
+    up.add_argument("--dry-run", action="store_true")
+    up.add_argument("--allow-copy", action="store_true", help="дозволити ALGORITHM=COPY, якщо INPLACE неможливий")
+    up.add_argument("--progress-interval", type=float, default=5, metavar="SECONDS")
+    up.add_argument("--lock-wait-timeout", type=int, default=10, metavar="SECONDS")
+    commands.add_parser("diff", help="ALTER TABLE для індексів і колонок, що відрізняються від database.sql")
+    stamped = commands.add_parser("stamp", help="позначити міграції застосованими без виконання")
+    stamped.add_argument("versions", nargs="*")
+    args = parser.parse_args()
+
+    command = globals()[f"cmd_{args.command}"]
+    with create_app().app_context():
+        command(db.engine, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+from flask import current_app, has_app_context
+from sqlalchemy import event, insert
+
+from integrity import cascade_rows
+
+OPS = ("insert", "update", "delete")
+
+
+class ChangeLog:
+    # Журнал змін (transactional outbox): кожен INSERT/UPDATE/DELETE рядків
+    # таблиць tracked дописує (таблиця, id, операція) у table в тій самій
+    # транзакції, тож запис журналу видимий рівно тоді, коли й сама зміна.
+    # ORM-записи фіксуються подіями flush сесії (init_change_log), масові
+    # Core-запити викликають record_changes() самі, до commit.
+    # Таблиці appended (Event) пишуться потоком нових рядків: INSERT у журнал
+    # не потрапляє (його видно з діапазону id), а UPDATE/DELETE, зокрема
+    # каскадні, — одним записом з id "*" на таблицю: версія для ETag рухається,
+    # а журнал не росте з кожним рядком.
+    def __init__(self, table, tracked, appended=()):
+        self.table = table
+        self.appended = set(appended)
+        self.tracked = set(tracked) | self.appended
+
+    def record(self, session, table, op, ids, cascade=False):
+        # cascade=True — перед DELETE: разом з рядками, які змінить
+        # ON DELETE CASCADE / SET NULL
+        if table.name not in self.tracked:
+            return
+        ids = list(ids)
+        changes = [(table.name, key, op) for key in ids]
+        if cascade:
+            changes += self.cascaded(session, table, ids)
+        self.write(session, changes)
+
+    def cascaded(self, session, table, ids):
+        return [
+            (name, key, "delete" if rule == "CASCADE" else "update")
+            for name, key, rule in cascade_rows(session, table, ids, self.tracked)
+        ]
+
+    def write(self, session, changes):
+        # Один рядок на (таблиця, id); видалення важливіше за оновлення
+        ops = {}
+        for name, key, op in changes:
+            if name in self.appended:
+                if op == "insert":
+                    continue
+                key = "*"
+            if ops.get((name, key)) != "delete":
+                ops[(name, key)] = op
+        if ops:
+            session.execute(insert(self.table), [
+                {"entity": name, "entity_id": str(key), "op": op} for (name, key), op in ops.items()
+            ])
+
+
+def change_log():
+    return current_app.extensions.get("change_log") if has_app_context() else None
+
+
+def record_changes(session, table, op, ids, cascade=False):
+    # Запис журналу для Core-запитів повз flush сесії (:batch, upsert,
+    # очищення) — у їхній транзакції, до commit. session — Session або Connection
+    log = change_log()
+    if log is not None:
+        log.record(session, table, op, ids, cascade)
+
+
+def tracked_objects(log, objects):
+    return [obj for obj in objects if getattr(obj, "__table__", None) is not None and obj.__table__.name in log.tracked]
+
+
+def _before_flush(session, flush_context, instances):
+    # Дочірні рядки, які БД змінить каскадно, можна знайти лише до DELETE
+    log = change_log()
+    if log is None:
+        return
+    deleted = {}
+    for obj in tracked_objects(log, session.deleted):
+        deleted.setdefault(obj.__table__, []).append(obj.id)
+    cascaded = session.info.setdefault("cascaded_changes", [])
+    for table, ids in deleted.items():
+        cascaded += log.cascaded(session, table, ids)
+
+
+def _after_flush(session, flush_context):
+    # new/dirty/deleted ще містять стан до flush, а нові обʼєкти вже мають id
+    log = change_log()
+    if log is None:
+        return
+    changes = [(obj.__table__.name, obj.id, "insert") for obj in tracked_objects(log, session.new)]
+    changes += [
+        (obj.__table__.name, obj.id, "update") for obj in tracked_objects(log, session.dirty)
+        if session.is_modified(obj, include_collections=False)
+    ]
+    changes += [(obj.__table__.name, obj.id, "delete") for obj in tracked_objects(log, session.deleted)]
+    changes += session.info.pop("cascaded_changes", [])
+    log.write(session, changes)
+
+
+def init_change_log(app, session, table, tracked, appended=()):
+    # session — db.session; обробники подій реєструються один раз на процес
+    app.extensions["change_log"] = ChangeLog(table, tracked, appended)
+    for name, listener in (("before_flush", _before_flush), ("after_flush", _after_flush)):
+        if not event.contains(session, name, listener):
+            event.listen(session, name, listener)
@@ -0,0 +1,130 @@
+import base64
+import json
+from datetime import datetime
+from urllib.parse import urlencode
+
+from flask import request, abort, current_app
+from sqlalchemy import and_, or_
+from filtering import apply_filters, parse_sort
+from streaming import wants_stream, stream_ndjson
+
+
+def encode_cursor(values):
+    raw = json.dumps(values, separators=(",", ":"), default=datetime.isoformat).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        abort(400, description="Invalid cursor")
+    if not isinstance(values, list) or not values:
+        abort(400, description="Invalid cursor")
+    return values
+
+
+def page_limit():
+    raw = request.args.get("limit")
+    if raw is None:
+        return min(current_app.config["PAGE_SIZE_DEFAULT"], current_app.config["PAGE_SIZE_MAX"])
+    try:
+        limit = int(raw)
+    except ValueError:
+        abort(400, description="Parameter 'limit' must be an integer")
+    if limit < 1:
+        abort(400, description="Parameter 'limit' must be positive")
+    return min(limit, current_app.config["PAGE_SIZE_MAX"])
+
+
+def next_link(cursor, limit):
+    args = request.args.to_dict()
+    args["after"] = cursor
+    args["limit"] = limit
+    return f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+
+
+def sort_columns(key, sort):
+    # Ключ сортування завжди доповнюється первинним ключем, щоб порядок
+    # (а отже й курсор) був однозначним
+    if sort is None or sort[0].key == key.key:
+        return [key]
+    return [sort[0], key]
+
+
+def order_clauses(key, sort):
+    desc = sort is not None and sort[1]
+    return [c.desc() if desc else c.asc() for c in sort_columns(key, sort)]
+
+
+def cursor_value(column, value):
+    if value is None or column.type.python_type is not datetime:
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        abort(400, description="Invalid cursor")
+
+
+def keyset_clause(key, sort, values):
+    desc = sort is not None and sort[1]
+    after_key = key < values[-1] if desc else key > values[-1]
+    if len(values) == 1:
+        return after_key
+
+    column = sort[0]
+    value = cursor_value(column, values[0])
+    # MySQL ставить NULL першими при ASC і останніми при DESC
+    if value is None:
+        if desc:
+            return and_(column.is_(None), after_key)
+        return or_(column.isnot(None), after_key)
+    if desc:
+        beyond = or_(column < value, column.is_(None))
+    else:
+        beyond = column > value
+    return or_(beyond, and_(column == value, after_key))
+
+
+def page_query(query, key, sort=None):
+    # Keyset-пагінація: ?after=<cursor>&limit=N. Вибирається limit + 1 рядок,
+    # щоб дізнатися, чи є наступна сторінка. -> (query, limit)
+    limit = page_limit()
+    after = request.args.get("after")
+    if after is not None:
+        values = decode_cursor(after)
+        if len(values) != len(sort_columns(key, sort)):
+            abort(400, description="Cursor does not match the sort order")
+        query = query.filter(keyset_clause(key, sort, values))
+    return query.order_by(*order_clauses(key, sort)).limit(limit + 1), limit
+
+
+def page_rows(rows, key, sort, limit):
+    # -> (рядки сторінки, заголовки з посиланням на наступну)
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        cursor = encode_cursor([getattr(rows[-1], c.key) for c in sort_columns(key, sort)])
+        headers["Link"] = next_link(cursor, limit)
+    return rows, headers
+
+
+def paginate(query, key, sort=None):
+    query, limit = page_query(query, key, sort)
+    return page_rows(query.all(), key, sort, limit)
+
+
+def filter_and_sort(query, key, filters=None, sorts=()):
+    # -> (query з фільтрами, (колонка, desc) або None)
+    model = key.class_
+    query = apply_filters(query, model, filters or {})
+    return query, parse_sort(model, key, sorts)
+
+
+def list_response(query, key, serialize, filters=None, sorts=()):
+    query, sort = filter_and_sort(query, key, filters, sorts)
+    if wants_stream():
+        return stream_ndjson(query.order_by(*order_clauses(key, sort)), serialize)
+    rows, headers = paginate(query, key, sort)
+    return [serialize(row) for row in rows], 200, headers
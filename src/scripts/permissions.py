@@ -0,0 +1,52 @@
+import threading
+import time
+
+
+class PermissionCache:
+    # Кеш role_id -> frozenset назв дій (Action.action) у памʼяті процесу.
+    # loader(role_id) повертає множину назв або None, якщо ролі не існує.
+    # Інвалідація викликається після commit лише в процесі, що записував;
+    # інші воркери (і записи поза API) перечитують права не пізніше ніж
+    # через ttl секунд. Лічильник поколінь не дає зберегти результат
+    # завантаження, що почалося до інвалідації.
+    def __init__(self, loader, ttl):
+        self.loader = loader
+        self.ttl = ttl
+        self.entries = {}
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, role_id):
+        with self.lock:
+            entry = self.entries.get(role_id)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self.generation
+
+        actions = self.loader(role_id)
+        if actions is None:
+            return None
+        actions = frozenset(actions)
+        with self.lock:
+            if generation == self.generation and self.ttl > 0:
+                self.entries[role_id] = (time.monotonic() + self.ttl, actions)
+        return actions
+
+    def allows(self, role_id, action):
+        actions = self.get(role_id)
+        return actions is not None and action in actions
+
+    def invalidate(self, *role_ids):
+        with self.lock:
+            self.generation += 1
+            for role_id in role_ids:
+                self.entries.pop(role_id, None)
+
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
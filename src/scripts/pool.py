@@ -0,0 +1,66 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from sqlalchemy.pool import QueuePool
+
+
+class PoolStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, waited, timed_out=False):
+        with self.lock:
+            self.checkouts += 1
+            self.timeouts += timed_out
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+class MeteredQueuePool(QueuePool):
+    # QueuePool, що вимірює час очікування вільного зʼєднання
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeout:
+            self.stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() створює новий пул — статистика зберігається
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+def pool_metrics(pool):
+    metrics = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        metrics.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+        })
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        with stats.lock:
+            metrics.update({
+                "checkouts": stats.checkouts,
+                "timeouts": stats.timeouts,
+                "wait_ms_avg": round(stats.wait_seconds_total * 1000 / stats.checkouts, 3) if stats.checkouts else 0.0,
+                "wait_ms_max": round(stats.wait_seconds_max * 1000, 3)
+            })
+    return metrics
@@ -0,0 +1,206 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, text
+
+from conditional import request_tables
+
+logger = logging.getLogger(__name__)
+
+# Cookie з часом (unix), до якого читання клієнта йдуть на primary
+PIN_COOKIE = "db_primary_until"
+ROUTES = ("replica", "pinned", "recent_write", "no_replica")
+
+
+class ReplicaSet:
+    # Репліки для читання: name -> Engine (біндинги SQLALCHEMY_BINDS).
+    # Фоновий потік кожні interval секунд перевіряє кожну репліку
+    # (SELECT 1 і відставання реплікації MySQL); репліка з помилкою або
+    # відставанням понад max_lag секунд не отримує запитів до наступної
+    # успішної перевірки. Обрив зʼєднання під час запиту вимикає репліку одразу.
+    def __init__(self, interval, max_lag):
+        self.interval = interval
+        self.max_lag = max_lag
+        self.engines = {}
+        self.state = {}
+        self.lock = threading.Lock()
+        self.thread = None
+        self.next = 0
+        self.routes = dict.fromkeys(ROUTES, 0)
+        self.reads = {}
+
+    def attach(self, engines):
+        with self.lock:
+            self.engines = dict(engines)
+            # До першої перевірки репліка вважається недоступною
+            self.state = {name: {"healthy": False, "lag": None, "error": "not checked", "checked": None}
+                          for name in self.engines}
+        for name, engine in self.engines.items():
+            event.listen(engine, "handle_error", self._disconnect_handler(name))
+
+    def _disconnect_handler(self, name):
+        def _handle_error(context):
+            if context.is_disconnect:
+                self.mark(name, False, None, str(context.original_exception))
+        return _handle_error
+
+    def start(self):
+        with self.lock:
+            if self.engines and (self.thread is None or not self.thread.is_alive()):
+                self.thread = threading.Thread(target=self.run, name="replica-health", daemon=True)
+                self.thread.start()
+
+    def run(self):
+        while True:
+            self.check()
+            time.sleep(self.interval)
+
+    def check(self):
+        for name, engine in list(self.engines.items()):
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                    lag = replication_lag(conn)
+            except Exception as e:
+                self.mark(name, False, None, str(e))
+                continue
+            if lag is False:
+                self.mark(name, False, None, "replication stopped")
+            elif lag is not None and lag > self.max_lag:
+                self.mark(name, False, lag, f"lag {lag}s > {self.max_lag}s")
+            else:
+                self.mark(name, True, lag, None)
+
+    def mark(self, name, healthy, lag, error):
+        with self.lock:
+            was = self.state[name]["healthy"]
+            self.state[name] = {"healthy": healthy, "lag": lag, "error": error, "checked": time.time()}
+        if was != healthy:
+            logger.warning("Replica %s is %s%s", name, "up" if healthy else "down", f": {error}" if error else "")
+
+    def choose(self):
+        # Наступна здорова репліка по колу або None
+        self.start()
+        with self.lock:
+            healthy = [name for name, state in self.state.items() if state["healthy"]]
+            if not healthy:
+                return None
+            self.next += 1
+            return healthy[self.next % len(healthy)]
+
+    def count(self, route, name=None):
+        with self.lock:
+            self.routes[route] += 1
+            target = name or "primary"
+            self.reads[target] = self.reads.get(target, 0) + 1
+
+    def metrics(self):
+        with self.lock:
+            return {
+                "replicas": {name: dict(state) for name, state in self.state.items()},
+                "routes": dict(self.routes),
+                "reads": dict(self.reads)
+            }
+
+    def exposition(self):
+        metrics = self.metrics()
+        lines = ["# TYPE db_read_requests_total counter"]
+        for target, count in sorted(metrics["reads"].items()):
+            lines.append(f'db_read_requests_total{{target="{target}"}} {count}')
+        lines.append("# TYPE db_read_routes_total counter")
+        for route, count in metrics["routes"].items():
+            lines.append(f'db_read_routes_total{{route="{route}"}} {count}')
+        for name, state in sorted(metrics["replicas"].items()):
+            lines.append(f'db_replica_healthy{{replica="{name}"}} {int(state["healthy"])}')
+            if state["lag"] is not None:
+                lines.append(f'db_replica_lag_seconds{{replica="{name}"}} {state["lag"]}')
+        return lines
+
+
+def replication_lag(conn):
+    # Секунди відставання, None — сервер не є реплікою (або немає права
+    # REPLICATION CLIENT), False — потоки реплікації зупинені
+    if conn.dialect.name != "mysql":
+        return None
+    for statement, column in (
+        ("SHOW REPLICA STATUS", "Seconds_Behind_Source"),  # MySQL 8.0.22+
+        ("SHOW SLAVE STATUS", "Seconds_Behind_Master")
+    ):
+        try:
+            row = conn.exec_driver_sql(statement).mappings().first()
+        except Exception:
+            conn.rollback()
+            continue
+        if row is None:
+            return None
+        lag = row.get(column)
+        return False if lag is None else int(lag)
+    return None
+
+
+class RoutingSession(Session):
+    # info["replica"] — біндинг репліки, з якої читає поточний запит.
+    # Flush і все, що після нього в тій самій сесії, йде на primary.
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        replica = self.info.get("replica")
+        if bind is None and replica and not self._flushing:
+            return self._db.engines[replica]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _after_flush(session, flush_context):
+    session.info.pop("replica", None)
+    session.info["wrote"] = True
+
+
+@contextmanager
+def primary(session):
+    # Читання в межах блоку — з primary (заповнення кешів, які живуть довше
+    # за допустиме відставання репліки)
+    replica = session.info.pop("replica", None)
+    try:
+        yield
+    finally:
+        if replica and not session.info.get("wrote"):
+            session.info["replica"] = replica
+
+
+def init_replicas(app, session, replicas, versions, pin_seconds):
+    # GET/HEAD читають з репліки, крім випадків, коли клієнт нещодавно писав
+    # (cookie PIN_COOKIE на pin_seconds після успішного POST/PUT/PATCH/DELETE)
+    # або таблиці відповіді змінювались у цьому процесі за останні pin_seconds.
+    # Без здорових реплік усі запити йдуть на primary.
+    def route():
+        try:
+            pinned = float(request.cookies.get(PIN_COOKIE, 0)) > time.time()
+        except ValueError:
+            pinned = False
+        if pinned:
+            return "pinned", None
+        view = app.view_functions.get(request.endpoint)
+        tables = request_tables(getattr(view, "view_class", None))
+        if tables and versions.modified_since(tables, time.time() - pin_seconds):
+            return "recent_write", None
+        name = replicas.choose()
+        return ("replica", name) if name else ("no_replica", None)
+
+    @app.before_request
+    def _route_reads():
+        if not replicas.engines or request.method not in ("GET", "HEAD") or request.endpoint is None:
+            return
+        reason, name = route()
+        replicas.count(reason, name)
+        if name:
+            session.info["replica"] = name
+
+    @app.after_request
+    def _pin_writer(response):
+        if replicas.engines and request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+            response.set_cookie(PIN_COOKIE, f"{time.time() + pin_seconds:.3f}",
+                                max_age=int(pin_seconds) + 1, httponly=True, samesite="Lax")
+        return response
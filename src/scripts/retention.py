@@ -0,0 +1,151 @@
+"""Очищення старих подій, артефактів і журналу змін з необов'язковим архівуванням.
+
+    python retention.py Event --older-than 365 [--export events.ndjson.gz]
+    python retention.py Artifact --older-than 730 --batch 2000
+    python retention.py Change --older-than 30
+    python retention.py Event --add-months 3
+
+Для партиційованої таблиці (src/sql/partitioning.sql) місячні партиції,
+що повністю старші за межу, видаляються через DROP PARTITION — миттєво,
+без построкового DELETE. Решта старих рядків видаляється партіями
+по --batch рядків у окремих транзакціях, щоб не тримати довгих блокувань.
+З --export рядки перед видаленням дописуються у gzip-файл NDJSON.
+"""
+import argparse
+import gzip
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select, delete, text
+
+from api import create_app, db
+from api.models import Event, Artifact, Change
+from outbox import record_changes
+from serializer import dumps
+
+TABLES = {"Event": Event.__table__, "Artifact": Artifact.__table__, "Change": Change.__table__}
+
+
+def partitions(conn, table):
+    # [(назва, верхня межа як UNIX-час або None для MAXVALUE)]
+    if conn.dialect.name != "mysql":
+        return []
+    rows = conn.execute(text(
+        "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL "
+        "ORDER BY PARTITION_ORDINAL_POSITION"
+    ), {"table": table.name}).all()
+    return [(name, None if bound == "MAXVALUE" else int(bound)) for name, bound in rows]
+
+
+def export_rows(archive, rows):
+    for row in rows:
+        archive.write(dumps(dict(row._mapping)) + b"\n")
+
+
+def drop_partitions(engine, table, cutoff_ts, archive, dry_run):
+    with engine.connect() as conn:
+        expired = [(name, bound) for name, bound in partitions(conn, table)
+                   if bound is not None and bound <= cutoff_ts]
+    for name, _ in expired:
+        print(f"{table.name}: drop partition {name}")
+        if dry_run:
+            continue
+        with engine.begin() as conn:
+            if archive is not None:
+                rows = conn.execution_options(stream_results=True).execute(
+                    text(f"SELECT * FROM `{table.name}` PARTITION (`{name}`)"))
+                export_rows(archive, rows)
+            conn.execute(text(f"ALTER TABLE `{table.name}` DROP PARTITION `{name}`"))
+    return len(expired)
+
+
+def delete_batches(engine, table, cutoff, batch, archive, dry_run):
+    old = table.c.datetime < cutoff
+    if table is Change.__table__:
+        # Найновіший запис журналу змін лишається: за ним /changes відрізняє
+        # застарілий курсор від порожнього журналу
+        with engine.connect() as conn:
+            newest = conn.execute(select(func.max(table.c.id))).scalar()
+        old = old & (table.c.id < (newest or 0))
+    if dry_run:
+        with engine.connect() as conn:
+            count = conn.execute(select(db.func.count()).select_from(table).where(old)).scalar()
+        print(f"{table.name}: {count} rows older than {cutoff:%Y-%m-%d %H:%M}")
+        return count
+
+    deleted = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(select(table).where(old).order_by(table.c.datetime).limit(batch)).all()
+            if not rows:
+                break
+            if archive is not None:
+                export_rows(archive, rows)
+            ids = [r.id for r in rows]
+            # Видалення артефактів потрапляє в журнал змін у тій самій транзакції
+            record_changes(conn, table, "delete", ids)
+            conn.execute(delete(table).where(table.c.id.in_(ids)))
+        deleted += len(rows)
+        print(f"{table.name}: deleted {deleted} rows")
+    return deleted
+
+
+def add_months(engine, table, months):
+    # Нові місячні партиції відрізаються від pmax: REORGANIZE порожньої pmax миттєвий
+    with engine.begin() as conn:
+        names = [name for name, bound in partitions(conn, table) if bound is not None]
+        monthly = sorted(n for n in names if n[1:].isdigit())
+        if not monthly:
+            print(f"{table.name}: not partitioned by month")
+            return
+        year, month = int(monthly[-1][1:5]), int(monthly[-1][5:7])
+        parts = []
+        for _ in range(months):
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            upper = (year + 1, 1) if month == 12 else (year, month + 1)
+            parts.append(
+                f"PARTITION p{year}{month:02d} VALUES LESS THAN "
+                f"(UNIX_TIMESTAMP('{upper[0]}-{upper[1]:02d}-01 00:00:00'))"
+            )
+        parts.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+        conn.execute(text(f"ALTER TABLE `{table.name}` REORGANIZE PARTITION pmax INTO ({', '.join(parts)})"))
+        print(f"{table.name}: added partitions up to p{year}{month:02d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("table", choices=sorted(TABLES))
+    parser.add_argument("--older-than", type=int, metavar="DAYS", help="видалити рядки, старші за DAYS днів")
+    parser.add_argument("--export", metavar="FILE", help="архів видалених рядків (NDJSON, gzip)")
+    parser.add_argument("--batch", type=int, default=5000)
+    parser.add_argument("--add-months", type=int, default=0, metavar="N", help="додати N майбутніх місячних партицій")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    if args.older_than is None and not args.add_months:
+        parser.error("nothing to do: pass --older-than and/or --add-months")
+
+    table = TABLES[args.table]
+    with create_app().app_context():
+        engine = db.engine
+        if args.add_months and not args.dry_run:
+            add_months(engine, table, args.add_months)
+        if args.older_than is None:
+            return
+
+        cutoff = datetime.now() - timedelta(days=args.older_than)
+        archive = gzip.open(args.export, "ab") if args.export and not args.dry_run else None
+        try:
+            started = time.perf_counter()
+            dropped = drop_partitions(engine, table, time.time() - args.older_than * 86400, archive, args.dry_run)
+            deleted = delete_batches(engine, table, cutoff, args.batch, archive, args.dry_run)
+        finally:
+            if archive is not None:
+                archive.close()
+        verb = "to drop/delete" if args.dry_run else "dropped/deleted"
+        print(f"{table.name}: {dropped} partitions, {deleted} rows {verb} "
+              f"in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
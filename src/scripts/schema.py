@@ -0,0 +1,241 @@
+import re
+from pathlib import Path
+
+from sqlalchemy import inspect, text
+
+SQL_DIR = Path(__file__).resolve().parent.parent / "sql"
+DATABASE_SQL = SQL_DIR / "database.sql"
+# Службова таблиця міграцій не входить до схеми моделей
+MIGRATIONS_TABLE = "schema_migrations"
+
+CREATE_TABLE = re.compile(r"CREATE TABLE `(\w+)` \((.*?)\n\) ENGINE", re.S)
+COLUMN = re.compile(r"`(\w+)`\s*([A-Z]+(?:\(\d+\))?)(.*)", re.S)
+INDEX = re.compile(r"(UNIQUE |FULLTEXT )?INDEX `(\w+)`\s*\(([^)]*)\)")
+FOREIGN_KEY = re.compile(
+    r"CONSTRAINT `(\w+)`\s+FOREIGN KEY \(([^)]*)\)\s+REFERENCES `(\w+)` \(([^)]*)\)"
+    r"(?:\s+ON DELETE (SET NULL|CASCADE|RESTRICT|NO ACTION))?"
+    r"(?:\s+ON UPDATE (SET NULL|CASCADE|RESTRICT|NO ACTION))?"
+)
+MIGRATION_VERSIONS = re.compile(r"INSERT INTO `schema_migrations` \(`version`\)\s*VALUES\s*(.*?);", re.S)
+
+
+# Опис схеми однаковий для трьох джерел (database.sql, моделі, жива БД):
+# {таблиця: {"columns": {назва: (тип, nullable)},
+#            "indexes": {назва: (колонки,)},
+#            "fulltext": {назва: (колонки,)},
+#            "unique": {(колонки,)},
+#            "foreign_keys": {назва: (колонки, таблиця, колонки, ON DELETE, ON UPDATE)}}}
+
+def new_table():
+    return {"columns": {}, "indexes": {}, "fulltext": {}, "unique": set(), "foreign_keys": {}}
+
+
+def names(raw):
+    # "`team_id`, `deadlineDate`" -> ("team_id", "deadlineDate")
+    return tuple(n.strip(" `") for n in raw.split(","))
+
+
+def type_name(sql_type):
+    # VARCHAR(255), CHAR(36), TEXT, INT, TIMESTAMP — незалежно від діалекту
+    name = sql_type.__visit_name__.upper()
+    name = {"INTEGER": "INT"}.get(name, name)
+    length = getattr(sql_type, "length", None)
+    return f"{name}({length})" if length else name
+
+
+def rule(value):
+    return (value or "RESTRICT").upper()
+
+
+def from_sql(path=DATABASE_SQL):
+    spec = {}
+    for table, body in CREATE_TABLE.findall(Path(path).read_text(encoding="utf-8")):
+        if table == MIGRATIONS_TABLE:
+            continue
+        current = spec[table] = new_table()
+        for item in re.split(r",\s*\n", body):
+            item = item.strip()
+            fk = FOREIGN_KEY.match(item)
+            index = INDEX.match(item)
+            if fk:
+                name, cols, ref_table, ref_cols, on_delete, on_update = fk.groups()
+                current["foreign_keys"][name] = (names(cols), ref_table, names(ref_cols), rule(on_delete), rule(on_update))
+            elif index:
+                kind, name, cols = index.groups()
+                if kind == "UNIQUE ":
+                    current["unique"].add(names(cols))
+                elif kind == "FULLTEXT ":
+                    current["fulltext"][name] = names(cols)
+                else:
+                    current["indexes"][name] = names(cols)
+            else:
+                column = COLUMN.match(item)
+                if column is None:
+                    continue
+                name, sql_type, rest = column.groups()
+                rest = " ".join(rest.upper().split())
+                primary = "PRIMARY KEY" in rest
+                current["columns"][name] = (
+                    {"INTEGER": "INT"}.get(sql_type, sql_type),
+                    not primary and "NOT NULL" not in rest
+                )
+                if "UNIQUE" in rest:
+                    current["unique"].add((name,))
+    return spec
+
+
+def recorded_migrations(path=DATABASE_SQL):
+    # Версії міграцій, які database.sql уже містить (INSERT INTO `schema_migrations`)
+    match = MIGRATION_VERSIONS.search(Path(path).read_text(encoding="utf-8"))
+    return re.findall(r"'([^']+)'", match.group(1)) if match else []
+
+
+def from_metadata(metadata):
+    spec = {}
+    for table in metadata.sorted_tables:
+        current = spec[table.name] = new_table()
+        for column in table.columns:
+            current["columns"][column.name] = (type_name(column.type), bool(column.nullable) and not column.primary_key)
+            if column.unique:
+                current["unique"].add((column.name,))
+        for index in table.indexes:
+            cols = tuple(c.name for c in index.columns)
+            if index.unique:
+                current["unique"].add(cols)
+            elif index.dialect_options["mysql"]["prefix"] == "FULLTEXT":
+                current["fulltext"][index.name] = cols
+            else:
+                current["indexes"][index.name] = cols
+        for fk in table.foreign_key_constraints:
+            current["foreign_keys"][fk.name] = (
+                tuple(fk.column_keys),
+                fk.referred_table.name,
+                tuple(e.column.name for e in fk.elements),
+                rule(fk.ondelete),
+                rule(fk.onupdate)
+            )
+    return spec
+
+
+def partitioned_tables(conn):
+    if conn.dialect.name != "mysql":
+        return set()
+    return set(conn.execute(text(
+        "SELECT DISTINCT TABLE_NAME FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND PARTITION_NAME IS NOT NULL"
+    )).scalars())
+
+
+def from_database(conn):
+    # -> (опис схеми, партиційовані таблиці)
+    inspector = inspect(conn)
+    spec = {}
+    for name in inspector.get_table_names():
+        if name == MIGRATIONS_TABLE:
+            continue
+        current = spec[name] = new_table()
+        for column in inspector.get_columns(name):
+            current["columns"][column["name"]] = (type_name(column["type"]), bool(column["nullable"]))
+        for index in inspector.get_indexes(name):
+            cols = tuple(index["column_names"])
+            if index["unique"]:
+                current["unique"].add(cols)
+            elif index.get("dialect_options", {}).get("mysql_prefix") == "FULLTEXT":
+                current["fulltext"][index["name"]] = cols
+            else:
+                current["indexes"][index["name"]] = cols
+        for unique in inspector.get_unique_constraints(name):
+            current["unique"].add(tuple(unique["column_names"]))
+        for fk in inspector.get_foreign_keys(name):
+            options = fk.get("options", {})
+            current["foreign_keys"][fk["name"]] = (
+                tuple(fk["constrained_columns"]),
+                fk["referred_table"],
+                tuple(fk["referred_columns"]),
+                rule(options.get("ondelete")),
+                rule(options.get("onupdate"))
+            )
+    return spec, partitioned_tables(conn)
+
+
+def describe(section, value):
+    if section == "columns":
+        sql_type, nullable = value
+        return f"{sql_type} {'NULL' if nullable else 'NOT NULL'}"
+    if section == "foreign_keys":
+        cols, ref_table, ref_cols, on_delete, on_update = value
+        return f"({', '.join(cols)}) -> {ref_table} ({', '.join(ref_cols)}) ON DELETE {on_delete} ON UPDATE {on_update}"
+    return f"({', '.join(value)})"
+
+
+def compare(expected, actual, skip_foreign_keys=()):
+    # -> ["Task: index idx_task_team (team_id) != (team_id, deadlineDate)", ...]
+    # Ліворуч — фактичне значення, праворуч — очікуване
+    problems = []
+    for table in sorted(set(expected) | set(actual)):
+        if table not in actual:
+            problems.append(f"{table}: table missing")
+            continue
+        if table not in expected:
+            problems.append(f"{table}: unexpected table")
+            continue
+        want, have = expected[table], actual[table]
+        sections = ["columns", "indexes", "fulltext"]
+        if table not in skip_foreign_keys:
+            sections.append("foreign_keys")
+        for section in sections:
+            kind = {
+                "columns": "column", "indexes": "index", "fulltext": "fulltext index", "foreign_keys": "foreign key"
+            }[section]
+            for name in sorted(set(want[section]) | set(have[section])):
+                if name not in have[section]:
+                    problems.append(f"{table}: {kind} {name} missing")
+                elif name not in want[section]:
+                    problems.append(f"{table}: unexpected {kind} {name}")
+                elif want[section][name] != have[section][name]:
+                    problems.append(
+                        f"{table}: {kind} {name} {describe(section, have[section][name])} "
+                        f"!= {describe(section, want[section][name])}"
+                    )
+        for cols in sorted(want["unique"] - have["unique"]):
+            problems.append(f"{table}: unique {describe('unique', cols)} missing")
+        for cols in sorted(have["unique"] - want["unique"]):
+            problems.append(f"{table}: unexpected unique {describe('unique', cols)}")
+    return problems
+
+
+def quoted(cols):
+    return ", ".join(f"`{c}`" for c in cols)
+
+
+def alter_statements(expected, actual):
+    # ALTER TABLE для індексів і типів колонок, що відрізняються: заготовка
+    # нової міграції. MODIFY COLUMN не переносить DEFAULT — його слід дописати
+    # вручну; таблиці та зовнішні ключі лише звітує compare()
+    statements = []
+    for table in sorted(set(expected) & set(actual)):
+        want, have = expected[table], actual[table]
+        clauses = []
+        for name, (sql_type, nullable) in want["columns"].items():
+            if name in have["columns"] and have["columns"][name] != (sql_type, nullable):
+                clauses.append(f"MODIFY COLUMN `{name}` {sql_type} {'NULL' if nullable else 'NOT NULL'}")
+        for name in sorted(set(have["indexes"]) - set(want["indexes"])):
+            clauses.append(f"DROP INDEX `{name}`")
+        for name, cols in sorted(want["indexes"].items()):
+            if have["indexes"].get(name) == cols:
+                continue
+            if name in have["indexes"]:
+                clauses.append(f"DROP INDEX `{name}`")
+            clauses.append(f"ADD INDEX `{name}` ({quoted(cols)})")
+        if clauses:
+            statements.append(f"ALTER TABLE `{table}`\n  " + ",\n  ".join(clauses) + ";")
+        # InnoDB додає лише один FULLTEXT-індекс за ALTER, і лише з LOCK=SHARED
+        for name, cols in sorted(want["fulltext"].items()):
+            if have["fulltext"].get(name) == cols:
+                continue
+            drop = f"DROP INDEX `{name}`,\n  " if name in have["fulltext"] else ""
+            statements.append(
+                f"ALTER TABLE `{table}`\n  {drop}ADD FULLTEXT INDEX `{name}` ({quoted(cols)}),\n"
+                f"  ALGORITHM=INPLACE, LOCK=SHARED;"
+            )
+    return statements
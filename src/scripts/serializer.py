@@ -0,0 +1,64 @@
+import json
+from datetime import date
+
+from flask import request, abort
+
+try:
+    import orjson
+except ImportError:  # orjson необовʼязковий: без нього — стандартний json
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(data):
+    # -> bytes; дати та час у форматі ISO-8601
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, default=_default).encode()
+
+
+def loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class Serializer:
+    # Перелік полів відповіді для моделі. Працює як з ORM-обʼєктом, так і з
+    # рядком проєкції (Row) — обидва віддають поля через getattr.
+    # Значення datetime залишаються обʼєктами: їх кодує dumps().
+    def __init__(self, model, *fields):
+        self.model = model
+        self.fields = fields
+
+    def __call__(self, obj, fields=None):
+        return {name: getattr(obj, name) for name in fields or self.fields}
+
+    def selected(self):
+        # ?fields=id,name -> ("id", "name"); None — усі поля
+        raw = request.args.get("fields")
+        if raw is None:
+            return None
+        fields = tuple(dict.fromkeys(f.strip() for f in raw.split(",") if f.strip()))
+        if not fields:
+            abort(400, description="Parameter 'fields' is empty")
+        unknown = [f for f in fields if f not in self.fields]
+        if unknown:
+            abort(400, description=f"Unknown fields: {', '.join(unknown)}")
+        return fields
+
+    def project(self, query, fields=None):
+        # Читання лише потрібних колонок без створення ORM-обʼєктів.
+        # Первинний ключ і колонка ?sort= потрібні для курсора пагінації.
+        fields = fields or self.fields
+        names = [self.model.id.key, *fields]
+        sort = request.args.get("sort", "").strip().lstrip("+-")
+        if sort in self.fields:
+            names.append(sort)
+        columns = [getattr(self.model, name) for name in dict.fromkeys(names)]
+        return query.with_entities(*columns), lambda row: self(row, fields)
@@ -0,0 +1,50 @@
+from flask import Response, current_app, request, stream_with_context
+from hub import CLOSED, HEARTBEAT, Subscription, sse_retry
+from serializer import dumps
+
+NDJSON = "application/x-ndjson"
+EVENT_STREAM = "text/event-stream"
+# Проксі (nginx) не повинні буферизувати й кешувати потік подій
+EVENT_STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def wants_stream():
+    if request.args.get("stream") in ("1", "true"):
+        return True
+    return request.accept_mimetypes.best_match(["application/json", NDJSON]) == NDJSON
+
+
+def stream_ndjson(query, serialize):
+    # Серверний курсор (stream_results) + yield_per: у пам'яті лише одна
+    # партія рядків, незалежно від розміру таблиці.
+    rows = query.yield_per(current_app.config["STREAM_BATCH_SIZE"])
+
+    def generate():
+        for row in rows:
+            yield dumps(serialize(row)) + b"\n"
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON)
+
+
+def stream_events(hub, topics):
+    # Server-Sent Events з хабу. Без stream_with_context: контекст запиту і
+    # сесія БД закриваються до початку потоку, зʼєднання повертається в пул.
+    # Розрив клієнта помічається на наступному записі (heartbeat)
+    # Генератор виконується поза контекстом застосунку: параметри читаються заздалегідь
+    size = current_app.config["PUSH_QUEUE_SIZE"]
+    retry = current_app.config["PUSH_RETRY_MS"]
+    heartbeat = current_app.config["PUSH_HEARTBEAT"]
+
+    def generate():
+        subscription = hub.subscribe(Subscription(topics, size))
+        try:
+            yield sse_retry(retry)
+            while True:
+                message = subscription.get(heartbeat)
+                if message is CLOSED:
+                    return
+                yield HEARTBEAT if message is None else message
+        finally:
+            hub.unsubscribe(subscription)
+
+    return Response(generate(), mimetype=EVENT_STREAM, headers=EVENT_STREAM_HEADERS)
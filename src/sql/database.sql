@@ -32,6 +32,7 @@ CREATE TABLE `User` (
   `photo` TEXT NULL,
   `team_id`  INT NOT NULL,
   INDEX `idx_user_team` (`team_id`),
+  FULLTEXT INDEX `ft_user_text` (`nickname`, `email`),
   CONSTRAINT `fk_user_team`
     FOREIGN KEY (`team_id`)
     REFERENCES `Team` (`id`)
@@ -99,7 +100,10 @@ CREATE TABLE `Task` (
   `startDate` TIMESTAMP   NOT NULL DEFAULT CURRENT_TIMESTAMP,
   `deadlineDate` TIMESTAMP   NULL,
   `team_id` INT NOT NULL,
-  INDEX `idx_task_team` (`team_id`),
+  INDEX `idx_task_team` (`team_id`, `deadlineDate`),
+  INDEX `idx_task_start` (`startDate`),
+  INDEX `idx_task_deadline` (`deadlineDate`),
+  FULLTEXT INDEX `ft_task_text` (`name`, `description`),
   CONSTRAINT `fk_task_team`
     FOREIGN KEY (`team_id`)
     REFERENCES `Team` (`id`)
@@ -115,7 +119,9 @@ CREATE TABLE `Artifact` (
   `comment`  TEXT,
   `datetime` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
   `task_id`  INT NOT NULL,
-  INDEX `idx_artifact_task` (`task_id`),
+  INDEX `idx_artifact_task` (`task_id`, `datetime`),
+  INDEX `idx_artifact_datetime` (`datetime`),
+  FULLTEXT INDEX `ft_artifact_comment` (`comment`),
   CONSTRAINT `fk_artifact_task`
     FOREIGN KEY (`task_id`)
     REFERENCES `Task` (`id`)
@@ -159,8 +165,9 @@ CREATE TABLE `Event` (
   `role_id`  INT NOT NULL,
   `action`   VARCHAR(255) NOT NULL,
   `datetime` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-  INDEX `idx_event_user` (`user_id`),
-  INDEX `idx_event_role` (`role_id`),
+  INDEX `idx_event_user` (`user_id`, `datetime`),
+  INDEX `idx_event_role` (`role_id`, `datetime`),
+  INDEX `idx_event_datetime` (`datetime`),
   CONSTRAINT `fk_event_user`
     FOREIGN KEY (`user_id`)
     REFERENCES `User` (`id`)
@@ -175,6 +182,37 @@ CREATE TABLE `Event` (
   DEFAULT CHARSET = utf8mb4;
 
 
+-- Журнал змін для синхронізації клієнтів (GET /changes): рядок на кожен
+-- INSERT/UPDATE/DELETE, записаний у тій самій транзакції, що й зміна
+CREATE TABLE `Change` (
+  `id`        INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+  `entity`    VARCHAR(255) NOT NULL,
+  `entity_id` VARCHAR(36) NOT NULL,
+  `op`        VARCHAR(16) NOT NULL,
+  `datetime`  TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  INDEX `idx_change_datetime` (`datetime`),
+  INDEX `idx_change_entity` (`entity`, `id`)
+) ENGINE=InnoDB
+  DEFAULT CHARSET = utf8mb4;
+
+
+-- Міграції (src/sql/migrations), уже враховані в цьому скрипті
+CREATE TABLE `schema_migrations` (
+  `version` VARCHAR(255) NOT NULL PRIMARY KEY,
+  `applied_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `seconds` DOUBLE NULL
+) ENGINE=InnoDB
+  DEFAULT CHARSET = utf8mb4;
+
+INSERT INTO `schema_migrations` (`version`)
+VALUES
+  ('0001_task_filter_indexes'),
+  ('0002_time_window_indexes'),
+  ('0003_fulltext_search'),
+  ('0004_change_log'),
+  ('0005_change_entity_index');
+
+
 INSERT INTO `Project` (`name`)
 VALUES
   ('Project Alpha'),
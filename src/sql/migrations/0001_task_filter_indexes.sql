@@ -0,0 +1,8 @@
+-- Фільтри та сортування задач за датами, GROUP BY по командах з дедлайном.
+-- Нове idx_task_team покриває зовнішній ключ fk_task_team, тому старий
+-- індекс видаляється в тому ж ALTER.
+ALTER TABLE `Task`
+  DROP INDEX `idx_task_team`,
+  ADD INDEX `idx_task_team` (`team_id`, `deadlineDate`),
+  ADD INDEX `idx_task_start` (`startDate`),
+  ADD INDEX `idx_task_deadline` (`deadlineDate`);
@@ -0,0 +1,12 @@
+-- Вибірки подій і артефактів за часовим вікном
+ALTER TABLE `Artifact`
+  DROP INDEX `idx_artifact_task`,
+  ADD INDEX `idx_artifact_task` (`task_id`, `datetime`),
+  ADD INDEX `idx_artifact_datetime` (`datetime`);
+
+ALTER TABLE `Event`
+  DROP INDEX `idx_event_user`,
+  ADD INDEX `idx_event_user` (`user_id`, `datetime`),
+  DROP INDEX `idx_event_role`,
+  ADD INDEX `idx_event_role` (`role_id`, `datetime`),
+  ADD INDEX `idx_event_datetime` (`datetime`);
@@ -0,0 +1,15 @@
+-- Повнотекстовий пошук (/search). Перший FULLTEXT-індекс таблиці додає
+-- прихований стовпець FTS_DOC_ID і перебудовує таблицю на місці; LOCK=NONE
+-- для FULLTEXT не підтримується, тому читання тривають, а запис чекає
+-- завершення. InnoDB додає лише один FULLTEXT-індекс за один ALTER.
+ALTER TABLE `Task`
+  ADD FULLTEXT INDEX `ft_task_text` (`name`, `description`),
+  ALGORITHM=INPLACE, LOCK=SHARED;
+
+ALTER TABLE `Artifact`
+  ADD FULLTEXT INDEX `ft_artifact_comment` (`comment`),
+  ALGORITHM=INPLACE, LOCK=SHARED;
+
+ALTER TABLE `User`
+  ADD FULLTEXT INDEX `ft_user_text` (`nickname`, `email`),
+  ALGORITHM=INPLACE, LOCK=SHARED;
@@ -0,0 +1,10 @@
+-- Журнал змін (outbox) для GET /changes. Нова таблиця: блокувань наявних немає
+CREATE TABLE `Change` (
+  `id`        INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+  `entity`    VARCHAR(255) NOT NULL,
+  `entity_id` VARCHAR(36) NOT NULL,
+  `op`        VARCHAR(16) NOT NULL,
+  `datetime`  TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  INDEX `idx_change_datetime` (`datetime`)
+) ENGINE=InnoDB
+  DEFAULT CHARSET = utf8mb4;
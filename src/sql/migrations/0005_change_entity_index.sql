@@ -0,0 +1,5 @@
+-- Версії таблиць для ETag (conditional.change_log_versions): останній запис
+-- журналу для кожної таблиці — SELECT entity, MAX(id) ... GROUP BY entity
+-- читає лише по одному рядку індексу на таблицю (loose index scan)
+ALTER TABLE `Change`
+  ADD INDEX `idx_change_entity` (`entity`, `id`);
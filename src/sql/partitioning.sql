@@ -0,0 +1,55 @@
+USE lab5;
+
+-- Необов'язкове місячне партиціювання журналу подій (Event).
+-- Виконується один раз після database.sql.
+--
+-- InnoDB не підтримує зовнішні ключі в партиційованих таблицях, тому
+-- fk_event_user / fk_event_role видаляються: події видалених користувачів
+-- і ролей залишаються в журналі до очищення retention.py, а user_id/role_id
+-- при записі події перевіряє застосунок (перезапустіть його після цього скрипту).
+-- Ключ партиціювання має входити до кожного унікального ключа,
+-- тому первинний ключ стає (id, datetime).
+--
+-- Artifact не партиціюється: артефакти належать задачам і видаляються
+-- разом з ними через fk_artifact_task (ON DELETE CASCADE).
+--
+-- Нові місячні партиції додає `python retention.py Event --add-months N`
+-- (REORGANIZE PARTITION pmax), старі видаляє `--older-than DAYS` (DROP PARTITION).
+
+ALTER TABLE `Event`
+  DROP FOREIGN KEY `fk_event_user`,
+  DROP FOREIGN KEY `fk_event_role`;
+
+ALTER TABLE `Event`
+  DROP PRIMARY KEY,
+  ADD PRIMARY KEY (`id`, `datetime`);
+
+ALTER TABLE `Event`
+PARTITION BY RANGE (UNIX_TIMESTAMP(`datetime`)) (
+  PARTITION p_old VALUES LESS THAN (UNIX_TIMESTAMP('2025-01-01 00:00:00')),
+  PARTITION p202501 VALUES LESS THAN (UNIX_TIMESTAMP('2025-02-01 00:00:00')),
+  PARTITION p202502 VALUES LESS THAN (UNIX_TIMESTAMP('2025-03-01 00:00:00')),
+  PARTITION p202503 VALUES LESS THAN (UNIX_TIMESTAMP('2025-04-01 00:00:00')),
+  PARTITION p202504 VALUES LESS THAN (UNIX_TIMESTAMP('2025-05-01 00:00:00')),
+  PARTITION p202505 VALUES LESS THAN (UNIX_TIMESTAMP('2025-06-01 00:00:00')),
+  PARTITION p202506 VALUES LESS THAN (UNIX_TIMESTAMP('2025-07-01 00:00:00')),
+  PARTITION p202507 VALUES LESS THAN (UNIX_TIMESTAMP('2025-08-01 00:00:00')),
+  PARTITION p202508 VALUES LESS THAN (UNIX_TIMESTAMP('2025-09-01 00:00:00')),
+  PARTITION p202509 VALUES LESS THAN (UNIX_TIMESTAMP('2025-10-01 00:00:00')),
+  PARTITION p202510 VALUES LESS THAN (UNIX_TIMESTAMP('2025-11-01 00:00:00')),
+  PARTITION p202511 VALUES LESS THAN (UNIX_TIMESTAMP('2025-12-01 00:00:00')),
+  PARTITION p202512 VALUES LESS THAN (UNIX_TIMESTAMP('2026-01-01 00:00:00')),
+  PARTITION p202601 VALUES LESS THAN (UNIX_TIMESTAMP('2026-02-01 00:00:00')),
+  PARTITION p202602 VALUES LESS THAN (UNIX_TIMESTAMP('2026-03-01 00:00:00')),
+  PARTITION p202603 VALUES LESS THAN (UNIX_TIMESTAMP('2026-04-01 00:00:00')),
+  PARTITION p202604 VALUES LESS THAN (UNIX_TIMESTAMP('2026-05-01 00:00:00')),
+  PARTITION p202605 VALUES LESS THAN (UNIX_TIMESTAMP('2026-06-01 00:00:00')),
+  PARTITION p202606 VALUES LESS THAN (UNIX_TIMESTAMP('2026-07-01 00:00:00')),
+  PARTITION p202607 VALUES LESS THAN (UNIX_TIMESTAMP('2026-08-01 00:00:00')),
+  PARTITION p202608 VALUES LESS THAN (UNIX_TIMESTAMP('2026-09-01 00:00:00')),
+  PARTITION p202609 VALUES LESS THAN (UNIX_TIMESTAMP('2026-10-01 00:00:00')),
+  PARTITION p202610 VALUES LESS THAN (UNIX_TIMESTAMP('2026-11-01 00:00:00')),
+  PARTITION p202611 VALUES LESS THAN (UNIX_TIMESTAMP('2026-12-01 00:00:00')),
+  PARTITION p202612 VALUES LESS THAN (UNIX_TIMESTAMP('2027-01-01 00:00:00')),
+  PARTITION pmax VALUES LESS THAN MAXVALUE
+);
@@ -0,0 +1,78 @@
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "scripts"))
+
+import config  # noqa: E402
+
+
+class SharedStub:
+    # Спільний рівень кешу в памʼяті: get, set(ex=, nx=), delete, як у redis.Redis.
+    # ex не діє: ключі не застарівають
+    def __init__(self):
+        self.data = {}
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def set(self, name, value, ex=None, nx=False):
+        if nx and name in self.data:
+            return None
+        self.data[name] = value
+        return True
+
+    def delete(self, *names):
+        for name in names:
+            self.data.pop(name, None)
+
+
+def make_config(path, **overrides):
+    # Копія config.py з окремою SQLite-БД і без реплік
+    settings = {name: getattr(config, name) for name in dir(config) if name.isupper()}
+    settings.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{path}",
+        SQLALCHEMY_ENGINE_OPTIONS={},
+        REPLICA_BINDS={},
+        SQLALCHEMY_BINDS={}
+    )
+    settings.update(overrides)
+    return types.SimpleNamespace(**settings)
+
+
+def prepare(app):
+    # Схема в primary і в кожній репліці. Кеш записів і версії таблиць
+    # спільні для процесу, тож скидаються для кожного застосунку
+    from api import db
+    from api.extensions import entity_cache, table_versions
+    with app.app_context():
+        for engine in db.engines.values():
+            db.metadata.create_all(engine)
+    entity_cache.entries.clear()
+    entity_cache.stats.clear()
+    table_versions.tokens = None
+    table_versions.modified.clear()
+    return app
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    # create_app() з тестовим конфігом
+    from api import create_app
+
+    def make(**overrides):
+        return prepare(create_app(make_config(tmp_path / "primary.db", **overrides)))
+
+    return make
+
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,329 @@
+"""Навантажувальне тестування REST API.
+
+    python test/loadtest.py --projects 5 --teams 4 --users 10 --requests 5000 --concurrency 16
+
+Без --url запити виконуються в тому ж процесі через Flask test client над
+тимчасовою SQLite-БД (або БД з DATABASE_URL), і для кожного запиту
+рахується кількість SQL-запитів. З --url навантаження подається на
+запущений сервер по HTTP (кількість SQL-запитів береться із заголовка
+Server-Timing); БД сервера заповнюється тим самим --seed-кроком,
+якщо DATABASE_URL вказує на неї.
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "scripts"))
+
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "loadtest.db")
+
+from sqlalchemy import event  # noqa: E402
+
+from api import create_app, db  # noqa: E402
+from api.models import (  # noqa: E402
+    Project, Team, User, Role, UserProject, Task, Artifact, Action, RoleAction, Event
+)
+
+ACTIONS = ("CREATE_TASK", "UPDATE_TASK", "UPLOAD_ARTIFACT", "REVIEW_ARTIFACT", "COMMENT")
+STATUSES = ("draft", "review", "approved", "rejected")
+# Server-Timing: db;dur=1.23;desc="3 queries"
+SQL_COUNT = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+app = create_app()
+
+
+class Dataset:
+    # Ідентифікатори згенерованих рядків, з яких сценарії беруть параметри
+    def __init__(self):
+        self.projects = []
+        self.teams = []
+        self.users = []
+        self.roles = []
+        self.tasks = []
+
+
+def seed(args):
+    # Синтетичні дані за схемою database.sql:
+    # projects × teams × users, задачі, артефакти та події
+    rnd = random.Random(args.seed)
+    data = Dataset()
+    start = datetime(2025, 1, 1)
+    if args.schema == "create":
+        db.drop_all()
+        db.create_all(bind_key=None)
+
+    def insert(model, rows):
+        if rows:
+            db.session.execute(model.__table__.insert(), rows)
+
+    insert(Action, [{"id": i + 1, "action": a} for i, a in enumerate(ACTIONS)])
+    project_rows, team_rows, role_rows, user_rows, up_rows, ra_rows = [], [], [], [], [], []
+    for p in range(args.projects):
+        project_id = p + 1
+        project_rows.append({"id": project_id, "name": f"Project {project_id}"})
+        data.projects.append(project_id)
+        for r in range(2):
+            role_id = len(role_rows) + 1
+            role_rows.append({"id": role_id, "name": f"Role {r}", "description": None, "project_id": project_id})
+            data.roles.append(role_id)
+            ra_rows += [{"role_id": role_id, "action_id": a + 1} for a in range(r, len(ACTIONS), 2)]
+        for _ in range(args.teams):
+            team_id = len(team_rows) + 1
+            team_rows.append({"id": team_id, "name": f"Team {team_id}", "project_id": project_id})
+            data.teams.append(team_id)
+            for _ in range(args.users):
+                user_id = str(uuid.UUID(int=rnd.getrandbits(128)))
+                n = len(user_rows)
+                user_rows.append({
+                    "id": user_id, "nickname": f"user{n}", "email": f"user{n}@example.com",
+                    "password": "x", "photo": None, "team_id": team_id
+                })
+                up_rows.append({"user_id": user_id, "project_id": project_id,
+                                "role_id": role_rows[-rnd.randint(1, 2)]["id"], "team_id": team_id})
+                data.users.append((user_id, role_rows[-1]["id"]))
+
+    task_rows, artifact_rows, event_rows = [], [], []
+    for team_id in data.teams:
+        for _ in range(args.tasks):
+            task_id = len(task_rows) + 1
+            begin = start + timedelta(hours=rnd.randint(0, 24 * 365))
+            task_rows.append({
+                "id": task_id, "name": f"Task {task_id}", "description": "synthetic",
+                "startDate": begin,
+                "deadlineDate": begin + timedelta(days=rnd.randint(1, 60)) if rnd.random() < 0.8 else None,
+                "team_id": team_id
+            })
+            data.tasks.append(task_id)
+            artifact_rows += [
+                {"status": rnd.choice(STATUSES), "comment": None,
+                 "datetime": begin + timedelta(hours=i), "task_id": task_id}
+                for i in range(args.artifacts)
+            ]
+    for user_id, role_id in data.users:
+        event_rows += [
+            {"user_id": user_id, "role_id": role_id, "action": rnd.choice(ACTIONS),
+             "datetime": start + timedelta(minutes=rnd.randint(0, 60 * 24 * 365))}
+            for _ in range(args.events)
+        ]
+
+    for model, rows in ((Project, project_rows), (Team, team_rows), (Role, role_rows),
+                        (User, user_rows), (UserProject, up_rows), (RoleAction, ra_rows),
+                        (Task, task_rows), (Artifact, artifact_rows), (Event, event_rows)):
+        insert(model, rows)
+    db.session.commit()
+    print(f"seeded: {len(project_rows)} projects, {len(team_rows)} teams, {len(user_rows)} users, "
+          f"{len(task_rows)} tasks, {len(artifact_rows)} artifacts, {len(event_rows)} events")
+    return data
+
+
+def scenarios(data, batch):
+    # (назва, вага, генератор запиту) -> (метод, шлях, тіло)
+    def pick(rnd, items):
+        return rnd.choice(items)
+
+    def events(rnd, n):
+        return [dict(zip(("user_id", "role_id"), pick(rnd, data.users)), action="COMMENT") for _ in range(n)]
+
+    return [
+        ("GET /projects", 5, lambda r: ("GET", "/projects", None)),
+        ("GET /projects/<id>?expand", 5, lambda r: (
+            "GET", f"/projects/{pick(r, data.projects)}?expand=teams.users,teams.tasks,roles", None)),
+        ("GET /teams?project_id", 10, lambda r: ("GET", f"/teams?project_id={pick(r, data.projects)}", None)),
+        ("GET /tasks?team_id&sort", 15, lambda r: (
+            "GET", f"/tasks?team_id={pick(r, data.teams)}&sort=-deadlineDate", None)),
+        ("GET /tasks/<id>", 15, lambda r: ("GET", f"/tasks/{pick(r, data.tasks)}", None)),
+        ("GET /artifacts?task_id", 10, lambda r: ("GET", f"/artifacts?task_id={pick(r, data.tasks)}", None)),
+        ("GET /events?user_id&datetime", 10, lambda r: (
+            "GET", f"/events?user_id={pick(r, data.users)[0]}&datetime__gte=2025-06-01T00:00:00", None)),
+        ("GET /teams/<id>/stats", 5, lambda r: ("GET", f"/teams/{pick(r, data.teams)}/stats", None)),
+        ("POST /tasks", 8, lambda r: (
+            "POST", "/tasks", {"name": "load", "description": "loadtest", "team_id": pick(r, data.teams)})),
+        ("PUT /tasks/<id>", 7, lambda r: (
+            "PUT", f"/tasks/{pick(r, data.tasks)}", {"description": f"updated {r.random():.6f}"})),
+        ("POST /events", 10, lambda r: ("POST", "/events", events(r, 1)[0])),
+        # Масові операції: batch рядків за запит, порівнюються з POST /tasks і POST /events
+        ("POST /tasks:batch", 2, lambda r: (
+            "POST", "/tasks:batch",
+            [{"name": "load", "description": "loadtest", "team_id": pick(r, data.teams)} for _ in range(batch)])),
+        ("PUT /tasks:batch", 2, lambda r: (
+            "PUT", "/tasks:batch",
+            [{"id": pick(r, data.tasks), "description": f"updated {r.random():.6f}"} for _ in range(batch)])),
+        ("POST /events:batch", 2, lambda r: ("POST", "/events:batch", events(r, batch))),
+    ]
+
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {}
+        self.queries = {}
+        self.errors = {}
+        self.rows = {}
+
+    def record(self, name, seconds, status, queries, rows):
+        with self.lock:
+            self.latencies.setdefault(name, []).append(seconds)
+            self.rows[name] = self.rows.get(name, 0) + rows
+            if queries is not None:
+                self.queries.setdefault(name, []).append(queries)
+            if status >= 400:
+                self.errors[name] = self.errors.get(name, 0) + 1
+
+
+def percentile(values, p):
+    # Найближчий ранг
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+class QueryCounter:
+    # Кількість SQL-запитів, виконаних у поточному потоці
+    def __init__(self, engine):
+        self.local = threading.local()
+        event.listen(engine, "before_cursor_execute", self.count)
+
+    def count(self, *_):
+        self.local.count = getattr(self.local, "count", 0) + 1
+
+    def reset(self):
+        self.local.count = 0
+
+    def value(self):
+        return getattr(self.local, "count", 0)
+
+
+def in_process_client(counter):
+    client = app.test_client()
+
+    def send(method, path, body):
+        counter.reset()
+        response = client.open(path, method=method, json=body)
+        response.get_data()
+        return response.status_code, counter.value()
+    return send
+
+
+def http_client(url):
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+
+    def send(method, path, body):
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload else {}
+        connection.request(method, parts.path.rstrip("/") + path, body=payload, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        match = SQL_COUNT.search(response.getheader("Server-Timing", ""))
+        return response.status, int(match.group(1)) if match else None
+    return send
+
+
+def run(args, data):
+    mix = scenarios(data, args.batch)
+    names = [name for name, _, _ in mix]
+    weights = [weight for _, weight, _ in mix]
+    builders = dict((name, build) for name, _, build in mix)
+    stats = Stats()
+    remaining = iter(range(args.requests))
+    remaining_lock = threading.Lock()
+    with app.app_context():
+        counter = QueryCounter(db.engine) if not args.url else None
+
+    def worker(index):
+        rnd = random.Random(args.seed * 1000 + index)
+        send = http_client(args.url) if args.url else in_process_client(counter)
+        while True:
+            with remaining_lock:
+                if next(remaining, None) is None:
+                    return
+            name = rnd.choices(names, weights)[0]
+            method, path, body = builders[name](rnd)
+            started = time.perf_counter()
+            status, queries = send(method, path, body)
+            rows = len(body) if isinstance(body, list) else 1
+            stats.record(name, time.perf_counter() - started, status, queries, rows)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.concurrency)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return stats, time.perf_counter() - started
+
+
+def report(stats, elapsed, args):
+    rows = []
+    for name in sorted(stats.latencies):
+        latencies = stats.latencies[name]
+        queries = stats.queries.get(name)
+        rows.append({
+            "endpoint": name,
+            "requests": len(latencies),
+            "errors": stats.errors.get(name, 0),
+            "rps": len(latencies) / elapsed,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "queries": sum(queries) / len(queries) if queries else None,
+            # Рядків за секунду часу відповіді: пропускна здатність одного клієнта
+            "rows_per_s": stats.rows[name] / sum(latencies)
+        })
+    total = sum(r["requests"] for r in rows)
+    print(f"\n{total} requests, concurrency {args.concurrency}, {elapsed:.2f}s, {total / elapsed:.1f} req/s")
+    print(f"{'endpoint':<30}{'n':>7}{'err':>5}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'SQL':>6}"
+          f"{'rows/s':>10}")
+    for r in rows:
+        sql = f"{r['queries']:.1f}" if r["queries"] is not None else "-"
+        print(f"{r['endpoint']:<30}{r['requests']:>7}{r['errors']:>5}{r['rps']:>9.1f}"
+              f"{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}{sql:>6}{r['rows_per_s']:>10.1f}")
+    by_name = {r["endpoint"]: r for r in rows}
+    for single, batch in (("POST /tasks", "POST /tasks:batch"), ("PUT /tasks/<id>", "PUT /tasks:batch"),
+                          ("POST /events", "POST /events:batch")):
+        if single in by_name and batch in by_name:
+            gain = by_name[batch]["rows_per_s"] / by_name[single]["rows_per_s"]
+            print(f"{batch} vs {single}: {gain:.1f}x rows/s")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": vars(args), "elapsed": elapsed, "endpoints": rows}, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=5)
+    parser.add_argument("--teams", type=int, default=4, help="команд на проєкт")
+    parser.add_argument("--users", type=int, default=10, help="користувачів на команду")
+    parser.add_argument("--tasks", type=int, default=20, help="задач на команду")
+    parser.add_argument("--artifacts", type=int, default=3, help="артефактів на задачу")
+    parser.add_argument("--events", type=int, default=20, help="подій на користувача")
+    parser.add_argument("--batch", type=int, default=100, help="рядків у запиті до :batch")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--schema", choices=("create", "keep"), default="create",
+                        help="create — перестворити таблиці (лише тестова БД!), keep — схема з database.sql")
+    parser.add_argument("--url", help="адреса запущеного сервера, наприклад http://localhost:5000")
+    parser.add_argument("--json", help="зберегти результати у файл")
+    args = parser.parse_args()
+
+    with app.app_context():
+        print(db.engine.url.render_as_string(hide_password=True))
+        data = seed(args)
+    stats, elapsed = run(args, data)
+    report(stats, elapsed, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import asyncio
+import importlib
+import sys
+import threading
+
+import pytest
+
+import config
+from conftest import prepare
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("asgiref")
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture(scope="module")
+def asgi(tmp_path_factory):
+    # asgi.py створює engine і Flask-застосунок під час імпорту — з config.py,
+    # тож адреси БД підміняються до імпорту
+    path = tmp_path_factory.mktemp("asgi") / "asgi.db"
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(config, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{path}")
+        patch.setattr(config, "ASYNC_DATABASE_URI", f"sqlite+aiosqlite:///{path}")
+        patch.setattr(config, "SQLALCHEMY_ENGINE_OPTIONS", {})
+        patch.setattr(config, "REPLICA_BINDS", {})
+        patch.setattr(config, "SQLALCHEMY_BINDS", {})
+        sys.modules.pop("asgi", None)
+        module = importlib.import_module("asgi")
+    client = prepare(module.flask_app).test_client()
+    assert client.post("/projects", json={"name": "P"}).status_code == 201
+    assert client.post("/teams", json={"name": "T", "project_id": 1}).status_code == 201
+    for name in ("A", "B", "C"):
+        assert client.post("/tasks", json={"name": name, "team_id": 1}).status_code == 201
+    return module
+
+
+def request(asgi, method, path, **kwargs):
+    async def run():
+        transport = httpx.ASGITransport(app=asgi.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as client:
+            try:
+                return await client.request(method, path, **kwargs)
+            finally:
+                # Пул engine привʼязаний до циклу подій, а кожен виклик — новий цикл
+                await asgi.engine.dispose()
+    return asyncio.run(run())
+
+
+def is_async(response):
+    # Асинхронний шлях не додає Server-Timing, Flask-застосунок — додає
+    return "server-timing" not in response.headers
+
+
+def test_list_and_item(asgi):
+    response = request(asgi, "GET", "/tasks", params={"fields": "id,name"})
+    assert response.status_code == 200 and is_async(response)
+    assert response.json() == [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}, {"id": 3, "name": "C"}]
+    assert response.headers["cache-control"] == "no-cache"
+
+    response = request(asgi, "GET", "/teams/1", params={"expand": "tasks"})
+    assert response.status_code == 200 and is_async(response)
+    assert [task["name"] for task in response.json()["tasks"]] == ["A", "B", "C"]
+
+
+def test_pagination_and_stream(asgi):
+    response = request(asgi, "GET", "/tasks", params={"limit": 2})
+    assert [task["name"] for task in response.json()] == ["A", "B"]
+    assert "next" in response.headers["link"]
+
+    response = request(asgi, "GET", "/tasks", headers={"Accept": "application/x-ndjson"})
+    assert response.status_code == 200 and is_async(response)
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(response.text.splitlines()) == 3
+
+
+def test_conditional_get(asgi):
+    etag = request(asgi, "GET", "/tasks/2").headers["etag"]
+    response = request(asgi, "GET", "/tasks/2", headers={"If-None-Match": etag})
+    assert response.status_code == 304 and is_async(response)
+
+
+def test_missing_item_and_writes_go_to_flask(asgi):
+    response = request(asgi, "GET", "/tasks/99")
+    assert response.status_code == 404
+    assert response.json()["message"] == "Task not found"
+
+    etag = request(asgi, "GET", "/projects").headers["etag"]
+    response = request(asgi, "POST", "/projects", json={"name": "Q"})
+    assert response.status_code == 201 and not is_async(response)
+    response = request(asgi, "GET", "/projects", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [project["name"] for project in response.json()] == ["P", "Q"]
+
+
+def test_versions_load_off_the_event_loop(asgi, monkeypatch):
+    # Синхронний запит версій з журналу змін не блокує цикл подій
+    from api.extensions import table_versions
+    threads = []
+    load = table_versions.load
+
+    def recording_load():
+        threads.append(threading.current_thread())
+        return load()
+
+    monkeypatch.setattr(table_versions, "load", recording_load)
+    table_versions.expires = 0.0
+    assert request(asgi, "GET", "/tasks/1").status_code == 200
+    assert threads and threading.main_thread() not in threads
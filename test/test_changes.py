@@ -0,0 +1,166 @@
+import pytest
+from flask import abort
+from sqlalchemy import delete, insert, select
+
+import batch
+from pagination import decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def app(make_app):
+    # Без вікна очікування пропусків: записи журналу видимі одразу після commit
+    return make_app(CHANGE_FEED_SETTLE_SECONDS=0)
+
+
+@pytest.fixture
+def project_team(client):
+    assert client.post("/projects", json={"name": "P"}).status_code == 201
+    assert client.post("/teams", json={"name": "T", "project_id": 1}).status_code == 201
+
+
+def head(client):
+    response = client.get("/changes")
+    assert response.status_code == 200
+    return response.get_json()["cursor"]
+
+
+def feed(client, cursor, **params):
+    response = client.get("/changes", query_string={"since": cursor, **params})
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def ops(page):
+    return [(change["table"], change["id"], change["op"]) for change in page["changes"]]
+
+
+def logged(app):
+    from api import db
+    from api.models import Change
+    with app.app_context():
+        return db.session.execute(select(Change.entity, Change.entity_id, Change.op).order_by(Change.id)).all()
+
+
+def test_changes_in_log_order(client, project_team):
+    start = head(client)
+    assert client.post("/tasks", json={"name": "A", "team_id": 1}).status_code == 201
+    assert client.put("/teams/1", json={"name": "T2"}).status_code == 200
+    assert client.post("/tasks", json={"name": "B", "team_id": 1}).status_code == 201
+
+    page = feed(client, start)
+    assert ops(page) == [("Task", 1, "insert"), ("Team", 1, "update"), ("Task", 2, "insert")]
+    assert page["changes"][1]["data"]["name"] == "T2"
+    assert page["more"] is False
+    assert decode_cursor(page["cursor"]) == decode_cursor(head(client))
+
+
+def test_since_is_exclusive(client, project_team):
+    assert client.post("/tasks", json={"name": "A", "team_id": 1}).status_code == 201
+    cursor = head(client)
+    assert client.post("/tasks", json={"name": "B", "team_id": 1}).status_code == 201
+
+    page = feed(client, cursor)
+    assert ops(page) == [("Task", 2, "insert")]
+    assert feed(client, page["cursor"]) == {"changes": [], "cursor": page["cursor"], "more": False}
+
+
+def test_limit_pages_through(client, project_team):
+    start = head(client)
+    for name in ("A", "B", "C"):
+        client.post("/tasks", json={"name": name, "team_id": 1})
+
+    first = feed(client, start, limit=2)
+    assert ops(first) == [("Task", 1, "insert"), ("Task", 2, "insert")]
+    assert first["more"] is True
+    second = feed(client, first["cursor"], limit=2)
+    assert ops(second) == [("Task", 3, "insert")]
+    assert second["more"] is False
+
+
+def test_pruned_cursor_is_gone(app, client, project_team):
+    from api import db
+    from api.models import Change
+    client.post("/tasks", json={"name": "A", "team_id": 1})
+    with app.app_context():
+        db.session.execute(delete(Change).where(Change.id <= 2))
+        db.session.commit()
+
+    for since in (0, 1):
+        assert client.get("/changes", query_string={"since": encode_cursor([since])}).status_code == 410
+    # Курсор одразу перед найстарішим записом ще дійсний
+    assert ops(feed(client, encode_cursor([2]))) == [("Task", 1, "insert")]
+
+
+def test_batch_and_cascade_are_logged(client, project_team):
+    start = head(client)
+    response = client.post("/tasks:batch", json=[{"name": "A", "team_id": 1}, {"name": "B", "team_id": 1}])
+    assert response.status_code == 201
+    assert client.post("/artifacts", json={"status": "new", "task_id": 1}).status_code == 201
+    assert ops(feed(client, start)) == [("Task", 1, "insert"), ("Task", 2, "insert"), ("Artifact", 1, "insert")]
+
+    # DELETE задачі каскадно видаляє її артефакти — вони теж у журналі
+    cursor = head(client)
+    assert client.delete("/tasks:batch", json=[1]).status_code == 200
+    assert sorted(ops(feed(client, cursor))) == [("Artifact", 1, "delete"), ("Task", 1, "delete")]
+
+    cursor = head(client)
+    assert client.delete("/projects/1").status_code == 200
+    assert sorted(ops(feed(client, cursor))) == [
+        ("Project", 1, "delete"), ("Task", 2, "delete"), ("Team", 1, "delete")
+    ]
+
+
+def test_upsert_is_logged(client, project_team):
+    # Вставка й оновлення через PUT /users/by-email; незмінені дані — без запису
+    start = head(client)
+    user = {"nickname": "a", "password": "x", "team_id": 1}
+    user_id = client.put("/users/by-email/a@example.com", json=user).get_json()["id"]
+    assert ops(feed(client, start)) == [("User", user_id, "insert")]
+
+    cursor = head(client)
+    client.put("/users/by-email/a@example.com", json=dict(user, nickname="a2"))
+    assert ops(feed(client, cursor)) == [("User", user_id, "update")]
+
+    cursor = head(client)
+    client.put("/users/by-email/a@example.com", json=dict(user, nickname="a2"))
+    assert feed(client, cursor)["changes"] == []
+
+
+def test_batch_log_rolls_back_with_write(app, client, project_team, monkeypatch):
+    # Журнал пишеться в транзакції запису: невдалий commit не лишає записів
+    client.post("/tasks", json={"name": "A", "team_id": 1})
+    client.post("/artifacts", json={"status": "new", "task_id": 1})
+    before = logged(app)
+
+    def failing_commit(session, *args, **kwargs):
+        session.rollback()
+        abort(409, description="Conflict")
+
+    monkeypatch.setattr(batch, "commit_or_abort", failing_commit)
+    assert client.post("/tasks:batch", json=[{"name": "B", "team_id": 1}]).status_code == 409
+    assert client.put("/tasks:batch", json=[{"id": 1, "name": "A2"}]).status_code == 409
+    assert client.delete("/tasks:batch", json=[1]).status_code == 409
+
+    assert logged(app) == before
+    assert client.get("/tasks/1").get_json()["name"] == "A"
+    assert client.get("/artifacts/1").status_code == 200
+
+
+def test_auto_increment_step(make_app, monkeypatch):
+    # auto_increment_increment = 2: id журналу 10, 12, 14 ідуть підряд, а 18 — після пропуску
+    from api import db
+    from api.models import Change
+    from api.resources import changes
+    app = make_app(CHANGE_FEED_SETTLE_SECONDS=3600)
+    client = app.test_client()
+    monkeypatch.setattr(changes, "id_step", lambda executor, dialect: 2)
+    with app.app_context():
+        db.session.execute(insert(Change), [
+            {"id": key, "entity": "Project", "entity_id": str(key), "op": "delete"} for key in (10, 12, 14, 18)
+        ])
+        db.session.commit()
+
+    page = feed(client, encode_cursor([8]))
+    assert ops(page) == [("Project", 10, "delete"), ("Project", 12, "delete"), ("Project", 14, "delete")]
+    assert decode_cursor(page["cursor"]) == [14]
+    assert client.get("/changes", query_string={"since": encode_cursor([7])}).status_code == 410
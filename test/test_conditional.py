@@ -0,0 +1,52 @@
+import pytest
+
+
+@pytest.fixture
+def events(client):
+    assert client.post("/projects", json={"name": "P"}).status_code == 201
+    assert client.post("/teams", json={"name": "T", "project_id": 1}).status_code == 201
+    assert client.post("/roles", json={"name": "R", "project_id": 1}).status_code == 201
+    for nickname in ("u1", "u2"):
+        user = {"nickname": nickname, "email": f"{nickname}@example.com", "password": "x", "team_id": 1}
+        assert client.post("/users", json=user).status_code == 201
+    users = [user["id"] for user in client.get("/users").get_json()]
+    for user_id in (users[0], users[1], users[0]):
+        assert client.post("/events", json={"user_id": user_id, "role_id": 1, "action": "a"}).status_code == 201
+    return users
+
+
+def revalidate(client, path):
+    # Повторний GET з ETag першої відповіді в If-None-Match
+    etag = client.get(path).headers["ETag"]
+    return lambda: client.get(path, headers={"If-None-Match": etag})
+
+
+def test_unchanged_is_not_modified(client, events):
+    assert revalidate(client, "/events")().status_code == 304
+    assert revalidate(client, "/events/2")().status_code == 304
+
+
+def test_event_update_changes_etag(client, events):
+    again = revalidate(client, "/events/2")
+    assert client.put("/events/2", json={"action": "b"}).status_code == 200
+    response = again()
+    assert response.status_code == 200
+    assert response.get_json()["action"] == "b"
+
+
+def test_event_delete_changes_etag(client, events):
+    # Ні найменший, ні найбільший id — діапазон id не змінюється
+    again = revalidate(client, "/events")
+    assert client.delete("/events/2").status_code == 200
+    response = again()
+    assert response.status_code == 200
+    assert [event["id"] for event in response.get_json()] == [1, 3]
+
+
+def test_cascade_delete_changes_event_etag(client, events):
+    again = revalidate(client, "/events")
+    assert client.delete(f"/users/{events[1]}").status_code == 200
+    response = again()
+    assert response.status_code == 200
+    assert [event["id"] for event in response.get_json()] == [1, 3]
+
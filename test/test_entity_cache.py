@@ -0,0 +1,143 @@
+import pytest
+
+from conftest import SharedStub
+from entity_cache import TOMBSTONE, EntityCache
+
+
+@pytest.fixture
+def shared(app):
+    from api.extensions import entity_cache
+    entity_cache.shared = SharedStub()
+    yield entity_cache.shared
+    entity_cache.shared = None
+
+
+@pytest.fixture
+def team_task(client):
+    assert client.post("/projects", json={"name": "P"}).status_code == 201
+    assert client.post("/teams", json={"name": "T", "project_id": 1}).status_code == 201
+    assert client.post("/tasks", json={"name": "A", "team_id": 1}).status_code == 201
+
+
+def filled(shared):
+    # Ключі спільного кешу із записами, без позначок інвалідації
+    return {name for name, value in shared.data.items() if value != TOMBSTONE}
+
+
+def stats(table):
+    from api.extensions import entity_cache
+    return entity_cache.metrics()["models"].get(table, {})
+
+
+def test_read_through(client, shared, team_task):
+    assert client.get("/tasks/1").get_json()["name"] == "A"
+    assert stats("Task")["misses"] == 1
+    assert "entity:Task:1" in shared.data
+
+    assert client.get("/tasks/1").get_json()["name"] == "A"
+    assert stats("Task")["local_hits"] == 1
+
+    # Інший воркер: локальний рівень порожній, запис береться зі спільного
+    from api.extensions import entity_cache
+    entity_cache.clear()
+    assert client.get("/tasks/1").get_json()["name"] == "A"
+    assert stats("Task")["shared_hits"] == 1
+    assert stats("Task")["misses"] == 1
+
+
+def test_missing_row_not_cached(client, shared):
+    assert client.get("/tasks/7").status_code == 404
+    assert client.get("/tasks/7").status_code == 404
+    assert stats("Task")["misses"] == 2
+    assert not filled(shared)
+
+
+def test_put_invalidates(client, shared, team_task):
+    client.get("/tasks/1")
+    assert client.put("/tasks/1", json={"name": "B"}).status_code == 200
+    assert shared.data["entity:Task:1"] == TOMBSTONE
+    assert client.get("/tasks/1").get_json()["name"] == "B"
+
+
+def test_delete_invalidates(client, shared, team_task):
+    client.get("/tasks/1")
+    assert client.delete("/tasks/1").status_code == 200
+    assert not filled(shared)
+    assert client.get("/tasks/1").status_code == 404
+
+
+def test_batch_invalidates(client, shared, team_task):
+    assert client.post("/tasks:batch", json=[{"name": "B", "team_id": 1}]).status_code == 201
+    client.get("/tasks/1")
+    client.get("/tasks/2")
+
+    response = client.put("/tasks:batch", json=[{"id": 1, "name": "A2"}, {"id": 2, "name": "B2"}])
+    assert response.status_code == 200
+    assert not filled(shared)
+    assert [client.get(f"/tasks/{key}").get_json()["name"] for key in (1, 2)] == ["A2", "B2"]
+
+    assert client.delete("/tasks:batch", json=[1]).status_code == 200
+    assert client.get("/tasks/1").status_code == 404
+    assert client.get("/tasks/2").status_code == 200
+
+
+def test_cascade_invalidates(client, shared, team_task):
+    # DELETE проєкту каскадно видаляє команду і задачу — їх записи в кеші теж
+    for path in ("/projects/1", "/teams/1", "/tasks/1"):
+        assert client.get(path).status_code == 200
+    assert len(filled(shared)) == 3
+
+    assert client.delete("/projects/1").status_code == 200
+    assert not filled(shared)
+    for path in ("/projects/1", "/teams/1", "/tasks/1"):
+        assert client.get(path).status_code == 404
+
+
+def test_generation_guard():
+    # Запис, що завершився під час читання, не дає закешувати прочитаний до нього рядок
+    shared = SharedStub()
+    cache = EntityCache(size=10, ttl=60, shared=shared)
+
+    def stale():
+        cache.invalidate([("Task", 1)])
+        return {"id": 1, "name": "old"}
+
+    assert cache.get("Task", 1, stale) == {"id": 1, "name": "old"}
+    assert not cache.entries
+    assert not filled(shared)
+    assert cache.get("Task", 1, lambda: {"id": 1, "name": "new"}) == {"id": 1, "name": "new"}
+    assert cache.get("Task", 1, lambda: pytest.fail("loader called on a cached key"))["name"] == "new"
+
+
+def test_stale_fill_from_other_worker():
+    # Воркер B читає рядок, воркер A записує його й інвалідує ключ, B кладе
+    # прочитаний рядок у спільний кеш — позначка A не дає його перезаписати
+    shared = SharedStub()
+    a, b, c = (EntityCache(size=10, ttl=60, shared=shared) for _ in range(3))
+
+    def stale():
+        a.invalidate([("Task", 1)])
+        return {"id": 1, "name": "old"}
+
+    assert b.get("Task", 1, stale) == {"id": 1, "name": "old"}
+    assert shared.data["entity:Task:1"] == TOMBSTONE
+    assert c.get("Task", 1, lambda: {"id": 1, "name": "new"}) == {"id": 1, "name": "new"}
+
+    # Позначка минула (ex): наступне читання знову заповнює спільний кеш
+    del shared.data["entity:Task:1"]
+    c.clear()
+    assert c.get("Task", 1, lambda: {"id": 1, "name": "new"})["name"] == "new"
+    assert a.get("Task", 1, lambda: pytest.fail("loader called on a shared hit"))["name"] == "new"
+
+
+def test_shared_errors_fall_back_to_loader():
+    class Broken:
+        def get(self, *args, **kwargs):
+            raise ConnectionError
+
+        set = delete = get
+
+    cache = EntityCache(size=10, ttl=60, shared=Broken())
+    assert cache.get("Task", 1, lambda: {"id": 1}) == {"id": 1}
+    cache.invalidate([("Task", 1)])
+    assert cache.metrics()["models"]["Task"]["shared_errors"] == 3
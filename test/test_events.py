@@ -0,0 +1,52 @@
+import pytest
+
+
+@pytest.fixture
+def app(make_app):
+    # enqueue: відповідь 202 до INSERT, тож зовнішній ключ не може повернути 404
+    return make_app(EVENT_INGEST_MODE="enqueue")
+
+
+@pytest.fixture
+def user_role(client):
+    assert client.post("/projects", json={"name": "P"}).status_code == 201
+    assert client.post("/teams", json={"name": "T", "project_id": 1}).status_code == 201
+    assert client.post("/roles", json={"name": "R", "project_id": 1}).status_code == 201
+    user = {"nickname": "u", "email": "u@example.com", "password": "x", "team_id": 1}
+    return client.post("/users", json=user).get_json()["id"], 1
+
+
+@pytest.fixture
+def partitioned(app):
+    # Як після partitioning.sql у MySQL: Event без зовнішніх ключів
+    app.extensions["partitioned_tables"] = {"Event"}
+
+
+def test_foreign_keys_checked_by_db(app, client, user_role):
+    response = client.post("/events", json={"user_id": "missing", "role_id": 1, "action": "a"})
+    assert response.status_code == 202
+    assert app.extensions["partitioned_tables"] == set()
+
+
+def test_partitioned_checks_references(client, user_role, partitioned):
+    user_id, role_id = user_role
+    response = client.post("/events", json={"user_id": "missing", "role_id": role_id, "action": "a"})
+    assert response.status_code == 404
+    assert response.get_json()["message"] == "User not found"
+    response = client.post("/events", json={"user_id": user_id, "role_id": 9, "action": "a"})
+    assert response.status_code == 404
+    assert response.get_json()["message"] == "Role not found"
+    assert client.post("/events", json={"user_id": user_id, "role_id": role_id, "action": "a"}).status_code == 202
+
+
+def test_partitioned_batch_checks_references(client, user_role, partitioned):
+    user_id, role_id = user_role
+    response = client.post("/events:batch", json=[
+        {"user_id": user_id, "role_id": role_id, "action": "a"},
+        {"user_id": "missing", "role_id": role_id, "action": "a"},
+        {"user_id": user_id, "role_id": 9, "action": "a"},
+    ])
+    assert response.status_code == 207
+    assert [item["status"] for item in response.get_json()] == [201, 404, 404]
+    assert client.put("/events/1", json={"user_id": "missing"}).status_code == 404
+    assert client.put("/events/1", json={"role_id": role_id}).status_code == 200
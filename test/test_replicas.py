@@ -0,0 +1,100 @@
+import os
+import time
+
+import pytest
+from sqlalchemy import insert, select
+
+from replicas import PIN_COOKIE, ROUTES
+
+
+@pytest.fixture
+def replica_app(make_app, tmp_path):
+    # Дві SQLite-БД: primary і replica_0. Проєкт 1 у них має різні назви,
+    # тож відповідь показує, з якої БД її прочитано
+    from api import db
+    from api.extensions import replica_set, table_versions
+    from api.models import Project
+
+    binds = {"replica_0": f"sqlite:///{tmp_path / 'replica.db'}"}
+    app = make_app(
+        REPLICA_BINDS=binds,
+        SQLALCHEMY_BINDS=dict(binds),
+        DB_REPLICA_CHECK_INTERVAL=3600,
+        DB_PRIMARY_PIN_SECONDS=30
+    )
+    with app.app_context():
+        for name, engine in (("primary", db.engine), ("replica", db.engines["replica_0"])):
+            with engine.begin() as conn:
+                conn.execute(insert(Project).values(id=1, name=name))
+    # Заповнення — не запис клієнта: без recent_write у наступних читаннях
+    table_versions.modified.clear()
+    replica_set.routes = dict.fromkeys(ROUTES, 0)
+    replica_set.reads = {}
+    replica_set.check()
+    return app
+
+
+def names(client):
+    response = client.get("/projects")
+    assert response.status_code == 200
+    return sorted(project["name"] for project in response.get_json())
+
+
+def stored(app, bind_key):
+    from api import db
+    from api.models import Project
+    with app.app_context():
+        with db.engines[bind_key].connect() as conn:
+            return sorted(conn.scalars(select(Project.name)))
+
+
+def test_get_reads_replica(replica_app):
+    from api.extensions import replica_set
+    assert names(replica_app.test_client()) == ["replica"]
+    metrics = replica_set.metrics()
+    assert metrics["routes"]["replica"] == 1
+    assert metrics["reads"] == {"replica_0": 1}
+
+
+def test_write_goes_to_primary_and_pins_reads(replica_app):
+    from api.extensions import replica_set, table_versions
+    client = replica_app.test_client()
+    assert client.post("/projects", json={"name": "new"}).status_code == 201
+    assert stored(replica_app, None) == ["new", "primary"]
+    assert stored(replica_app, "replica_0") == ["replica"]
+
+    # Cookie клієнта, що записував: читання з primary протягом DB_PRIMARY_PIN_SECONDS
+    assert float(client.get_cookie(PIN_COOKIE).value) > time.time()
+    assert names(client) == ["new", "primary"]
+    assert replica_set.metrics()["routes"]["pinned"] == 1
+
+    # Інший клієнт бачить свіжий запис у цьому процесі — теж primary
+    other = replica_app.test_client()
+    assert names(other) == ["new", "primary"]
+    assert replica_set.metrics()["routes"]["recent_write"] == 1
+
+    # Вікно минуло: знову репліка
+    table_versions.modified.clear()
+    client.set_cookie(PIN_COOKIE, f"{time.time() - 1:.3f}")
+    assert names(client) == ["replica"]
+    assert names(other) == ["replica"]
+
+
+def test_unhealthy_replica_falls_back_to_primary(replica_app, tmp_path):
+    from api import db
+    from api.extensions import replica_set
+    client = replica_app.test_client()
+    assert names(client) == ["replica"]
+
+    # Файл репліки недоступний: перевірка вимикає її, читання йдуть на primary
+    with replica_app.app_context():
+        db.engines["replica_0"].dispose()
+    os.remove(tmp_path / "replica.db")
+    os.mkdir(tmp_path / "replica.db")
+    replica_set.check()
+    state = replica_set.metrics()["replicas"]["replica_0"]
+    assert state["healthy"] is False and state["error"]
+
+    assert names(client) == ["primary"]
+    assert replica_set.metrics()["routes"]["no_replica"] == 1
+
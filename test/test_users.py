@@ -0,0 +1,44 @@
+import pytest
+
+
+@pytest.fixture
+def team(client):
+    assert client.post("/projects", json={"name": "P"}).status_code == 201
+    assert client.post("/teams", json={"name": "T", "project_id": 1}).status_code == 201
+    return 1
+
+
+def put(client, email, nickname, **extra):
+    return client.put(f"/users/by-email/{email}", json=dict(nickname=nickname, password="x", team_id=1, **extra))
+
+
+def test_upsert_inserts_then_updates(client, team):
+    response = put(client, "a@example.com", "a")
+    assert response.status_code == 201
+    user_id = response.get_json()["id"]
+
+    assert put(client, "a@example.com", "a2", photo="p.png").get_json() == {"message": "User updated"}
+    user = client.get(f"/users/{user_id}").get_json()
+    assert (user["nickname"], user["photo"]) == ("a2", "p.png")
+    assert len(client.get("/users").get_json()) == 1
+
+
+def test_upsert_unchanged(client, team):
+    assert put(client, "a@example.com", "a").status_code == 201
+    response = put(client, "a@example.com", "a")
+    assert response.status_code == 200
+    assert response.get_json() == {"message": "User updated"}
+
+
+def test_upsert_nickname_conflict(client, team):
+    assert put(client, "a@example.com", "a").status_code == 201
+    assert put(client, "b@example.com", "b").status_code == 201
+    assert put(client, "b@example.com", "a").status_code == 409
+    assert put(client, "c@example.com", "a").status_code == 409
+    nicknames = {user["email"]: user["nickname"] for user in client.get("/users").get_json()}
+    assert nicknames == {"a@example.com": "a", "b@example.com": "b"}
+
+
+def test_upsert_unknown_team(client, team):
+    response = client.put("/users/by-email/a@example.com", json={"nickname": "a", "password": "x", "team_id": 9})
+    assert response.status_code == 404